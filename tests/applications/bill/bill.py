@@ -0,0 +1,132 @@
+# Copyright(C) 2026 woob project
+#
+# This file is part of woob.
+#
+# woob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# woob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with woob. If not, see <http://www.gnu.org/licenses/>.
+
+import io
+import logging
+from threading import Barrier, RLock
+from unittest.mock import MagicMock
+
+from woob.applications.bill.bill import AppBill
+from woob.capabilities.bill import Document, Subscription
+
+
+class FakeBackend:
+    def __init__(self, name, barrier=None):
+        self.name = name
+        self.lock = RLock()
+        self.downloaded = []
+        self.barrier = barrier
+
+    def __enter__(self):
+        self.lock.acquire()
+
+    def __exit__(self, *args):
+        self.lock.release()
+
+    def iter_documents(self, subscription):
+        for num in range(3):
+            document = Document(id=f"{self.name}-{num}")
+            document.format = "pdf"
+            document.backend = self.name
+            yield document
+
+    def download_document(self, document):
+        if self.barrier is not None:
+            # Only passes if the other backend downloads at the same time.
+            self.barrier.wait()
+        self.downloaded.append(document.id)
+        return f"content of {document.id}".encode()
+
+
+def create_app(backends):
+    subscriptions = []
+    for name in backends:
+        subscription = Subscription(id=f"sub-{name}")
+        subscription.backend = name
+        subscriptions.append(subscription)
+
+    def do(method, *args, backends=None):
+        if method == "iter_subscription":
+            return subscriptions
+        (name,) = backends
+        return getattr(app.woob.get_backend(name), method)(*args)
+
+    app = AppBill.__new__(AppBill)
+    app.stderr = io.StringIO()
+    app.logger = logging.getLogger("bill")
+    app.woob = MagicMock()
+    app.woob.get_backend = backends.get
+    app.do = do
+    return app
+
+
+def test_download_all_resume(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    backends = {"bnp": FakeBackend("bnp"), "free": FakeBackend("free")}
+    app = create_app(backends)
+
+    # An interrupted run left one complete document and a partial one.
+    (tmp_path / "bnp-0.pdf").write_bytes(b"content of bnp-0")
+    (tmp_path / "free-1.pdf.part").write_bytes(b"content")
+
+    assert app.download_all(None, False) is None
+
+    # Documents on disk are skipped, the other ones are downloaded.
+    assert backends["bnp"].downloaded == ["bnp-1", "bnp-2"]
+    assert backends["free"].downloaded == ["free-0", "free-1", "free-2"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        f"{name}-{num}.pdf" for name in ("bnp", "free") for num in range(3)
+    ]
+    assert (tmp_path / "free-1.pdf").read_bytes() == b"content of free-1"
+
+    # Nothing is downloaded again.
+    assert app.download_all(None, False) is None
+    assert len(backends["bnp"].downloaded) == 2
+    assert len(backends["free"].downloaded) == 3
+
+
+def test_download_all_backends_overlap(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    barrier = Barrier(2, timeout=5)
+    backends = {"bnp": FakeBackend("bnp", barrier), "free": FakeBackend("free", barrier)}
+    app = create_app(backends)
+
+    assert app.download_all(None, False) is None
+
+    # Downloads of different backends run concurrently, and the ones of a
+    # backend one after the other.
+    assert not barrier.broken
+    assert backends["bnp"].downloaded == ["bnp-0", "bnp-1", "bnp-2"]
+    assert backends["free"].downloaded == ["free-0", "free-1", "free-2"]
+
+
+def test_sort_subscriptions():
+    subscriptions = []
+    for backend, num in (("bnp", 0), ("bnp", 1), ("bnp", 2), ("free", 0), ("orange", 0), ("free", 1)):
+        subscription = Subscription(id=f"{backend}-{num}")
+        subscription.backend = backend
+        subscriptions.append(subscription)
+
+    app = AppBill.__new__(AppBill)
+    assert [subscription.id for subscription in app.sort_subscriptions(subscriptions)] == [
+        "bnp-0",
+        "free-0",
+        "orange-0",
+        "bnp-1",
+        "free-1",
+        "bnp-2",
+    ]
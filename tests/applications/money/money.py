@@ -0,0 +1,130 @@
+# Copyright(C) 2026 woob project
+#
+# This file is part of woob.
+#
+# woob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# woob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with woob. If not, see <http://www.gnu.org/licenses/>.
+
+import logging
+import multiprocessing
+import os
+import sys
+from optparse import Values
+from threading import Thread
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from woob.applications.money import money
+from woob.applications.money.money import AppMoney, HistoryThreadAsAProcess, history_worker
+
+
+class FakeMoney:
+    """Stands for AppMoney in worker processes."""
+
+    def parse_args(self, args):
+        self.args = args
+
+    def load_config(self):
+        pass
+
+    def retrieve_history(self, account):
+        if account.startswith("crash"):
+            os._exit(3)
+        if account.startswith("error"):
+            raise ValueError("unable to parse history")
+        return f"OFX {account} {os.getpid()}", ""
+
+
+def test_get_worker_args():
+    options = Values(
+        {
+            "backends": "other",
+            "debug": 0,
+            "verbose": 1,
+            "count": 20,
+            "force": None,
+            "until_date": "2026-01-01",
+            "no_import": True,
+            "display": True,
+        }
+    )
+    app = SimpleNamespace(
+        APPNAME="money",
+        WORKER_OPTIONS=AppMoney.WORKER_OPTIONS,
+        options=options,
+        logger=logging.getLogger("money"),
+    )
+
+    assert AppMoney.get_worker_args(app, "bnp") == [
+        "money",
+        "--backends=bnp",
+        "--verbose",
+        "--count=20",
+        "--until-date=2026-01-01",
+    ]
+
+
+def test_history_worker():
+    conn, child_conn = multiprocessing.Pipe()
+    worker = Thread(target=history_worker, args=(["money", "--backends=bnp"], child_conn), daemon=True)
+
+    # Signal handlers can only be set in the main thread.
+    with patch.object(money, "AppMoney", FakeMoney), patch.object(money.signal, "signal"):
+        worker.start()
+        for account in ("1@bnp", "error@bnp", "2@bnp", None):
+            conn.send(account)
+
+        assert conn.poll(5)
+        assert conn.recv() == (f"OFX 1@bnp {os.getpid()}", "")
+        ofxcontent, stderrcontent = conn.recv()
+        assert ofxcontent == ""
+        assert "ValueError: unable to parse history" in stderrcontent
+        assert conn.recv() == (f"OFX 2@bnp {os.getpid()}", "")
+
+        # None stops the worker.
+        worker.join(5)
+    assert not worker.is_alive()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="needs fork to use a fake application in the worker")
+def test_history_worker_crash():
+    results = {}
+
+    def get_history_from_thread(account, thread):
+        results[account] = thread.retrieve_history(account)
+        return "2026-01-01"
+
+    app = SimpleNamespace(
+        config=MagicMock(),
+        options=SimpleNamespace(no_import=False),
+        logger=logging.getLogger("money"),
+        get_worker_args=lambda backend: ["money", "--backends=" + backend],
+        get_history_from_thread=get_history_from_thread,
+    )
+    accounts = ["1@bnp", "2@bnp", "crash@bnp", "3@bnp"]
+
+    with patch.object(money, "AppMoney", FakeMoney), patch.object(HistoryThreadAsAProcess, "MP_CONTEXT", "fork"):
+        thread = HistoryThreadAsAProcess(app, accounts)
+        thread.run()
+
+    # Accounts are retrieved by the same worker.
+    pid = results["1@bnp"][0].split()[-1]
+    assert pid != str(os.getpid())
+    assert results["2@bnp"] == (f"OFX 2@bnp {pid}", "")
+
+    # Remaining accounts are reported as failures when the worker dies.
+    assert results["crash@bnp"] == ("", "History worker of bnp exited with code 3\n")
+    assert results["3@bnp"] == ("", "History worker of bnp exited with code 3\n")
+    assert thread.last_dates == {account: "2026-01-01" for account in accounts}
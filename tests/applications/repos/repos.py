@@ -0,0 +1,68 @@
+# Copyright(C) 2026 woob project
+#
+# This file is part of woob.
+#
+# woob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# woob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with woob. If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tarfile
+
+from woob.applications.repos.repos import build_archive
+
+
+def make_module(path):
+    (path / "__pycache__").mkdir(parents=True)
+    (path / "__pycache__" / "__init__.cpython-311.pyc").write_bytes(b"\0")
+    (path / "__init__.py").write_text("from .module import ExampleModule\n")
+    (path / "module.py").write_text("class ExampleModule: pass\n")
+    (path / "favicon.png").write_bytes(b"\x89PNG")
+
+
+def test_build_archive_reproducible(tmp_path):
+    """The same module always gives the same archive."""
+    first = tmp_path / "first" / "example"
+    second = tmp_path / "second" / "example"
+    make_module(first)
+    make_module(second)
+    os.utime(second / "module.py", (0, 0))
+
+    assert build_archive(str(first), "example", str(tmp_path / "first.tar.gz"), 1700000000)[0] is True
+    assert build_archive(str(second), "example", str(tmp_path / "second.tar.gz"), 1700000000)[0] is True
+    assert (tmp_path / "first.tar.gz").read_bytes() == (tmp_path / "second.tar.gz").read_bytes()
+    assert os.path.getmtime(tmp_path / "first.tar.gz") == 1700000000
+
+    with tarfile.open(tmp_path / "first.tar.gz") as tar:
+        assert tar.getnames() == ["example", "example/__init__.py", "example/module.py"]
+        assert {member.mtime for member in tar.getmembers()} == {1700000000}
+
+
+def test_build_archive_unchanged(tmp_path):
+    """An archive is only written again if the module changed."""
+    module_path = tmp_path / "example"
+    make_module(module_path)
+    tarname = tmp_path / "example.tar.gz"
+
+    changed, content_hash = build_archive(str(module_path), "example", str(tarname), 1700000000)
+    assert changed is True
+    os.utime(tarname, (0, 0))
+    assert build_archive(str(module_path), "example", str(tarname), 1700000000) == (False, content_hash)
+    assert os.path.getmtime(tarname) == 0
+
+    # A new version with the same content has the same content hash.
+    assert build_archive(str(module_path), "example", str(tarname), 1800000000) == (True, content_hash)
+
+    (module_path / "module.py").write_text("class ExampleModule: version = 2\n")
+    changed, new_content_hash = build_archive(str(module_path), "example", str(tarname), 1800000000)
+    assert changed is True
+    assert new_content_hash != content_hash
@@ -3,8 +3,11 @@
 
 import pytest
 import requests
+import responses
 
-from woob.browser import Browser
+from woob.browser import URL, Browser, PagesBrowser
+from woob.browser.exceptions import HTTPNotFound
+from woob.browser.pages import RawPage
 
 
 @pytest.fixture(scope="function")
@@ -67,3 +70,45 @@ class BrowserVerifyPath(NoRetryBrowser):
 
         r = BrowserVerifyPath().open("https://self-signed.badssl.com/")
         assert r.status_code == 200
+
+
+@responses.activate
+def test_open_many():
+    for num in range(5):
+        responses.add(responses.GET, f"https://woob.tech/item/{num}", body=str(num))
+    responses.add(responses.GET, "https://woob.tech/other", body="other")
+
+    class ItemPage(RawPage):
+        pass
+
+    class MyBrowser(PagesBrowser):
+        BASEURL = "https://woob.tech/"
+
+        item = URL(r"item/(?P<num>\d+)", ItemPage)
+
+    browser = MyBrowser()
+    browser.location("/other")
+
+    results = list(browser.open_many([f"item/{num}" for num in range(5)], concurrency=2))
+    assert [r.text for r in results] == ["0", "1", "2", "3", "4"]
+    assert all(isinstance(r.page, ItemPage) for r in results)
+    assert all(r.request.headers["Referer"] == "https://woob.tech/other" for r in results)
+    # the current page isn't changed
+    assert browser.url == "https://woob.tech/other"
+
+    results = browser.open_many(["item/3", "item/4"], ordered=False)
+    assert sorted(r.text for r in results) == ["3", "4"]
+
+
+@responses.activate
+def test_open_many_error():
+    responses.add(responses.GET, "https://woob.tech/ok", body="ok")
+    responses.add(responses.GET, "https://woob.tech/ko", status=404)
+
+    class MyBrowser(PagesBrowser):
+        BASEURL = "https://woob.tech/"
+
+    results = MyBrowser().open_many(["ok", "ko", "ok"], concurrency=1)
+    assert next(results).text == "ok"
+    with pytest.raises(HTTPNotFound):
+        next(results)
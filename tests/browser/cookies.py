@@ -0,0 +1,106 @@
+import requests
+import responses
+
+from woob.browser import Browser
+from woob.browser.browsers import StatesMixin
+from woob.browser.cookies import BlockAllCookies, WoobCookieJar
+from woob.tools.storage import StandardStorage
+
+
+def make_jar():
+    jar = WoobCookieJar()
+    jar.set("session", "1", domain="woob.tech", path="/")
+    jar.set("sub", "2", domain=".woob.tech", path="/")
+    jar.set("private", "3", domain="woob.tech", path="/private")
+    for num in range(50):
+        jar.set("other", str(num), domain=f"other{num}.example.org", path="/")
+    return jar
+
+
+def test_for_request():
+    jar = make_jar()
+
+    request = requests.Request("GET", "https://woob.tech/public")
+    cookies = jar.for_request(request)
+    assert isinstance(cookies, WoobCookieJar)
+    assert sorted(cookie.name for cookie in cookies) == ["session", "sub"]
+
+    request = requests.Request("GET", "https://woob.tech/private/page")
+    assert sorted(cookie.name for cookie in jar.for_request(request)) == ["private", "session", "sub"]
+
+    request = requests.Request("GET", "https://other3.example.org/")
+    assert [cookie.value for cookie in jar.for_request(request)] == ["3"]
+
+    # the jar is a copy
+    cookies.set("new", "4", domain="woob.tech", path="/")
+    assert "new" not in jar
+
+
+def test_for_request_policy():
+    jar = make_jar()
+    jar.set_policy(BlockAllCookies())
+
+    cookies = jar.for_request(requests.Request("GET", "https://woob.tech/"))
+    assert len(cookies) == 0
+    assert isinstance(cookies.get_policy(), BlockAllCookies)
+
+
+@responses.activate
+def test_browser_cookies():
+    responses.add(responses.GET, "https://woob.tech/private/page", body="ok")
+
+    browser = Browser()
+    browser.session.cookies = make_jar()
+
+    response = browser.open("https://woob.tech/private/page", cookies={"extra": "5"})
+    assert response.request.headers["Cookie"] == "private=3; session=1; sub=2; extra=5"
+    assert "extra" not in browser.session.cookies
+
+
+def test_dump_load_rows():
+    jar = make_jar()
+    rows = jar.dump_rows()
+    assert len(rows) == 53
+    assert ["session", "1", "woob.tech", "/", False, None] in rows
+
+    new_jar = WoobCookieJar()
+    new_jar.load_rows(rows)
+    assert sorted(new_jar.dump_rows()) == sorted(rows)
+    assert new_jar.get("private", domain="woob.tech", path="/private") == "3"
+
+
+class StateBrowser(StatesMixin, Browser):
+    pass
+
+
+def test_compact_state(tmp_path):
+    browser = StateBrowser()
+    browser.session.cookies = make_jar()
+    state = browser.dump_state()
+    assert isinstance(state["cookies"], bytes)
+    assert state["cookies"][:1] == StatesMixin.STATE_COOKIES_VERSION
+
+    # The storage handles bytes natively.
+    storage = StandardStorage(str(tmp_path / "storage"))
+    storage.set("backends", "test", "browser_state", state)
+    storage.save("backends", "test")
+    state = StandardStorage(str(tmp_path / "storage")).get("backends", "test", "browser_state")
+
+    browser = StateBrowser()
+    browser.load_state(state)
+    assert sorted(browser.session.cookies.dump_rows()) == sorted(make_jar().dump_rows())
+
+
+def test_legacy_state():
+    class LegacyStateBrowser(StateBrowser):
+        COMPACT_STATE = False
+
+    browser = LegacyStateBrowser()
+    browser.session.cookies = make_jar()
+    state = browser.dump_state()
+    assert isinstance(state["cookies"], str)
+
+    # Legacy states can still be loaded by browsers using the compact format.
+    browser = StateBrowser()
+    browser.load_state(state)
+    assert sorted(browser.session.cookies.dump_rows()) == sorted(make_jar().dump_rows())
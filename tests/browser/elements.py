@@ -17,10 +17,13 @@
 
 from unittest import TestCase
 
+import responses
+
+from woob.browser import URL, PagesBrowser
 from woob.browser.elements import DictElement, ItemElement, method
 from woob.browser.filters.json import Dict
 from woob.browser.filters.standard import CleanText, Eval
-from woob.browser.pages import JsonPage
+from woob.browser.pages import JsonPage, pagination
 from woob.capabilities.base import BaseObject, StringField
 from woob.tools.json import json
 
@@ -155,3 +158,101 @@ class iter_other_objects(DictElement):
 
         objects = list(page.iter_other_objects())
         assert len(objects) == 0
+
+
+@responses.activate
+def test_prefetch_next_page():
+    for num in range(1, 4):
+        responses.add(
+            responses.GET,
+            f"https://example.org/objects/{num}",
+            json={
+                "objects": [{"id": f"{num}-{idx}"} for idx in range(2)],
+                "next": f"/objects/{num + 1}" if num < 3 else None,
+            },
+        )
+
+    class MyObject(BaseObject):
+        pass
+
+    prefetched = []
+
+    class MyPage(JsonPage):
+        @pagination
+        @method
+        class iter_objects(DictElement):
+            item_xpath = "objects"
+            prefetch_next_page = True
+
+            def next_page(self):
+                return Dict("next", default=None)(self)
+
+            class item(ItemElement):
+                klass = MyObject
+
+                def obj_id(self):
+                    # the next page is already being fetched
+                    prefetched.append(bool(self.page.browser._prefetched))
+                    return Dict("id")(self)
+
+    class MyBrowser(PagesBrowser):
+        BASEURL = "https://example.org"
+
+        objects = URL(r"/objects/(?P<num>\d+)", MyPage)
+
+    browser = MyBrowser()
+    browser.objects.go(num=1)
+    objects = list(browser.page.iter_objects())
+
+    assert [obj.id for obj in objects] == ["1-0", "1-1", "2-0", "2-1", "3-0", "3-1"]
+    assert prefetched == [True] * 4 + [False] * 2
+    assert browser.url == "https://example.org/objects/3"
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_prefetch_abandoned_pagination():
+    for listing in "AB":
+        for num in range(1, 3):
+            responses.add(
+                responses.GET,
+                f"https://example.org/{listing}/{num}",
+                json={
+                    "objects": [{"id": f"{listing}{num}"}],
+                    # Both listings share their next page URL.
+                    "next": "/next" if num < 2 else None,
+                },
+            )
+    responses.add(responses.GET, "https://example.org/next", json={"objects": [{"id": "A2"}], "next": None})
+    responses.add(responses.GET, "https://example.org/next", json={"objects": [{"id": "B2"}], "next": None})
+
+    class MyObject(BaseObject):
+        pass
+
+    class MyPage(JsonPage):
+        @pagination
+        @method
+        class iter_objects(DictElement):
+            item_xpath = "objects"
+            prefetch_next_page = True
+
+            def next_page(self):
+                return Dict("next", default=None)(self)
+
+            class item(ItemElement):
+                klass = MyObject
+
+                obj_id = Dict("id")
+
+    class MyBrowser(PagesBrowser):
+        BASEURL = "https://example.org"
+
+        objects = URL(r"/(?P<listing>[AB])/(?P<num>\d+)", r"/next", MyPage)
+
+    browser = MyBrowser()
+    browser.objects.go(listing="A", num=1)
+    # Only the first object is read, the next page has been prefetched.
+    assert next(browser.page.iter_objects()).id == "A1"
+
+    browser.objects.go(listing="B", num=1)
+    assert [obj.id for obj in browser.page.iter_objects()] == ["B1", "B2"]
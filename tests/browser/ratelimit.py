@@ -0,0 +1,105 @@
+from email.utils import formatdate
+from time import time
+
+import pytest
+import responses
+
+from woob.browser import URL, Browser, PagesBrowser
+from woob.browser.exceptions import ClientError
+from woob.browser.ratelimit import TokenBucket, get_token_bucket, parse_retry_after
+
+
+def test_parse_retry_after():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("") is None
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("not a date") is None
+    assert 55 < parse_retry_after(formatdate(time() + 60, usegmt=True)) <= 60
+    assert parse_retry_after(formatdate(time() - 60, usegmt=True)) == 0
+
+
+def test_token_bucket():
+    bucket = TokenBucket(10, burst=2)
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.02)
+    assert bucket.waits == 2
+
+
+def test_token_bucket_backoff():
+    bucket = TokenBucket(8)
+
+    bucket.backoff(5)
+    assert bucket.rate == 4
+    assert bucket.throttled == 1
+    assert bucket.reserve() == pytest.approx(5, abs=0.05)
+    # requests waiting for the end of the backoff are still spread
+    assert bucket.reserve() == pytest.approx(5.25, abs=0.05)
+
+    for _ in range(5):
+        bucket.backoff()
+    assert bucket.rate == 0.5
+
+    for _ in range(20):
+        bucket.recover()
+    assert bucket.rate == 8
+
+
+def test_get_token_bucket():
+    bucket = get_token_bucket("test-shared.woob.tech", 5)
+    assert get_token_bucket("test-shared.woob.tech", 5) is bucket
+
+    # the most restrictive limit wins
+    assert get_token_bucket("test-shared.woob.tech", (2, 3)) is bucket
+    assert bucket.max_rate == 2
+    assert bucket.burst == 1
+
+
+@responses.activate
+def test_browser_rate_limit():
+    responses.add(responses.GET, "https://limited.woob.tech/", body="ok")
+    responses.add(responses.GET, "https://other.woob.tech/", body="ok")
+
+    class LimitedBrowser(Browser):
+        RATE_LIMITS = {"limited.woob.tech": 5}
+
+    browser = LimitedBrowser()
+    assert browser.get_rate_limiter("https://other.woob.tech/") is None
+
+    limiter = browser.get_rate_limiter("https://limited.woob.tech/")
+    assert limiter is LimitedBrowser().get_rate_limiter("https://limited.woob.tech/path")
+
+    browser.open("https://limited.woob.tech/")
+    browser.open("https://limited.woob.tech/")
+    assert limiter.waits >= 1
+
+    responses.add(responses.GET, "https://limited.woob.tech/throttled", status=429, headers={"Retry-After": "0"})
+    with pytest.raises(ClientError):
+        browser.open("https://limited.woob.tech/throttled")
+    assert limiter.throttled == 1
+    assert limiter.rate == 2.5
+
+
+@responses.activate
+def test_url_rate_limit():
+    responses.add(responses.GET, "https://woob.tech/api/1", body="ok")
+
+    class MyBrowser(PagesBrowser):
+        BASEURL = "https://woob.tech/"
+
+        api = URL(r"api/(?P<id>\d+)", rate_limit=(5, 2))
+        other = URL(r"other")
+
+    browser = MyBrowser()
+    assert browser.other.get_rate_limiter() is None
+
+    limiter = browser.api.get_rate_limiter()
+    assert limiter is MyBrowser().api.get_rate_limiter()
+    assert limiter.burst == 2
+
+    browser.api.go(id=1)
+    browser.api.open(id=1)
+    browser.api.go(id=1)
+    assert limiter.waits >= 1
@@ -0,0 +1,81 @@
+from threading import Event, Lock
+
+import responses
+
+from woob.browser import Browser
+from woob.browser.sessions import BoundedExecutor, FuturesSession, get_shared_executor
+
+
+def test_executor_is_lazy():
+    session = FuturesSession(max_workers=4)
+    assert session._executor is None
+
+    # closing a session which never made asynchronous requests doesn't
+    # create an executor
+    session.close()
+    assert session._executor is None
+
+
+@responses.activate
+def test_executor_created_on_async_open():
+    responses.add(responses.GET, "https://woob.tech/", body="hello")
+
+    browser = Browser()
+    assert browser.session._executor is None
+
+    # synchronous requests don't need it
+    assert browser.open("https://woob.tech/").text == "hello"
+    assert browser.session._executor is None
+
+    assert browser.async_open("https://woob.tech/").result().text == "hello"
+    assert browser.session._executor is not None
+
+    browser.deinit()
+
+
+@responses.activate
+def test_shared_executor():
+    responses.add(responses.GET, "https://woob.tech/", body="hello")
+
+    class SharedBrowser(Browser):
+        SHARE_EXECUTOR = True
+        MAX_WORKERS = 2
+
+    first = SharedBrowser()
+    second = SharedBrowser()
+
+    assert first.async_open("https://woob.tech/").result().text == "hello"
+    assert second.async_open("https://woob.tech/").result().text == "hello"
+
+    assert isinstance(first.session.executor, BoundedExecutor)
+    assert first.session.executor.executor is get_shared_executor()
+    assert second.session.executor.executor is get_shared_executor()
+
+    first.deinit()
+    second.deinit()
+
+    # the shared executor is still usable by others
+    assert get_shared_executor().submit(lambda: 42).result() == 42
+
+
+def test_bounded_executor_limit():
+    executor = BoundedExecutor(get_shared_executor(), max_workers=2)
+    lock = Lock()
+    release = Event()
+    running = []
+    max_running = []
+
+    def job():
+        with lock:
+            running.append(1)
+            max_running.append(len(running))
+        release.wait(5)
+        with lock:
+            running.pop()
+
+    futures = [executor.submit(job) for _ in range(6)]
+    release.set()
+    executor.shutdown()
+
+    assert all(future.done() for future in futures)
+    assert max(max_running) <= 2
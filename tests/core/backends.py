@@ -0,0 +1,164 @@
+# Copyright(C) 2026 woob project
+#
+# This file is part of woob.
+#
+# woob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# woob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with woob. If not, see <http://www.gnu.org/licenses/>.
+
+# flake8: compatible
+
+from __future__ import annotations
+
+import pathlib
+import sys
+
+import pytest
+
+from woob.core.woob import Woob
+from woob.tools.backend import Module
+from woob.tools.storage import StandardStorage
+
+
+LOADER_MODULE = """
+from woob.tools.backend import BackendConfig, Module
+from woob.tools.value import Value
+
+
+class {klass}(Module):
+    NAME = "{name}"
+    CONFIG = BackendConfig(Value("login", label="Login"))
+    STORAGE = {{"seen": []}}
+
+    def get_login(self):
+        return self.config["login"].get()
+"""
+
+BACKENDS_COUNT = 500
+
+
+@pytest.fixture
+def woob(tmp_path: pathlib.Path) -> Woob:
+    """Woob with a local repository and a lot of backends."""
+    repo_path = tmp_path / "repo"
+    repo_path.mkdir()
+    for i in range(5):
+        name = f"loadmod{i}"
+        (repo_path / f"{name}.py").write_text(LOADER_MODULE.format(klass=f"LoadMod{i}Module", name=name))
+
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    (workdir / "sources.list").write_text(f"file://{repo_path}\n")
+
+    backends = []
+    for i in range(BACKENDS_COUNT):
+        # Every tenth backend is not properly configured.
+        login = "" if i % 10 == 9 else f"login = user{i}\n"
+        backends.append(f"[backend{i:03d}]\n_module = loadmod{i % 5}\n{login}")
+    (workdir / "backends").write_text("\n".join(backends))
+    (workdir / "backends").chmod(0o600)
+
+    woob = Woob(workdir=str(workdir), datadir=str(tmp_path / "data"))
+    woob.update()
+    yield woob
+    woob.deinit()
+
+
+@pytest.mark.parametrize("workers", [None, 8])
+def test_load_backends(woob: Woob, workers: int | None, tmp_path: pathlib.Path) -> None:
+    storage = StandardStorage(str(tmp_path / "storage"))
+    errors: list[Woob.LoadError] = []
+    loaded = woob.load_backends(storage=storage, errors=errors, workers=workers)
+
+    expected = [f"backend{i:03d}" for i in range(BACKENDS_COUNT) if i % 10 != 9]
+    assert list(loaded) == expected
+    assert list(woob.backend_instances) == expected
+    assert [error.backend_name for error in errors] == [f"backend{i:03d}" for i in range(BACKENDS_COUNT) if i % 10 == 9]
+
+    backend = woob.get_backend("backend042")
+    assert backend.NAME == "loadmod2"
+    assert backend.config["login"].get() == "user42"
+    assert backend.storage.get("seen") == []
+    assert len(storage.config.values["backends"]) == len(expected)
+
+
+def test_load_backends_lazy(woob: Woob, tmp_path: pathlib.Path) -> None:
+    storage = StandardStorage(str(tmp_path / "storage"))
+    errors: list[Woob.LoadError] = []
+    woob.backends_lru.maxsize = 3
+    loaded = woob.load_backends(storage=storage, errors=errors, lazy=True)
+
+    # Nothing is created, so config errors aren't known yet.
+    assert len(loaded) == BACKENDS_COUNT
+    assert errors == []
+    assert "backends" not in storage.config.values
+
+    backend = woob.get_backend("backend042")
+    assert not backend.is_loaded
+    assert backend.NAME == "loadmod2"
+    assert backend.has_caps("CapBank") is False
+    assert not backend.is_loaded
+
+    assert backend.get_login() == "user42"
+    assert backend.is_loaded
+    assert "backend042" in storage.config.values["backends"]
+
+    with pytest.raises(Module.ConfigError):
+        woob.get_backend("backend009").get_login()
+
+    # Only the most recently used backends are kept loaded.
+    logins = list(woob.do("get_login", backends=["backend000", "backend001", "backend002", "backend003"]))
+    assert sorted(logins) == ["user0", "user1", "user2", "user3"]
+    assert len(woob.backends_lru) == 3
+    assert sum(backend.is_loaded for backend in woob.backend_instances.values()) == 3
+    assert not backend.is_loaded
+
+    # Unloaded backends are created again when needed.
+    assert backend.get_login() == "user42"
+    assert backend.is_loaded
+
+
+def test_load_backends_lazy_does_not_import(woob: Woob, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Cache the metadata of modules, then forget they were imported.
+    for i in range(5):
+        woob.modules_loader.get_module_metadata(f"loadmod{i}")
+    monkeypatch.setattr(woob.modules_loader, "loaded", {})
+    for i in range(5):
+        monkeypatch.delitem(sys.modules, f"woob_modules.loadmod{i}")
+
+    woob.load_backends(lazy=True)
+    assert not any(f"woob_modules.loadmod{i}" in sys.modules for i in range(5))
+
+    backend = woob.get_backend("backend042")
+    assert backend.NAME == "loadmod2"
+    assert backend.has_caps("CapBank") is False
+    assert "woob_modules.loadmod2" not in sys.modules
+
+    assert backend.get_login() == "user42"
+    assert "woob_modules.loadmod2" in sys.modules
+    assert list(woob.modules_loader.loaded) == ["loadmod2"]
+
+
+def test_backends_lru_keeps_locked_backends(woob: Woob) -> None:
+    woob.backends_lru.maxsize = 1
+    woob.load_backends(names=["backend000", "backend001"], lazy=True)
+    first = woob.get_backend("backend000")
+    second = woob.get_backend("backend001")
+
+    with first:
+        assert first.get_login() == "user0"
+        assert second.get_login() == "user1"
+        # The first backend is in use, so it can't be unloaded.
+        assert first.is_loaded
+
+    assert first.get_login() == "user0"
+    assert not second.is_loaded
@@ -0,0 +1,125 @@
+# Copyright(C) 2026 woob project
+#
+# This file is part of woob.
+#
+# woob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# woob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with woob. If not, see <http://www.gnu.org/licenses/>.
+
+# flake8: compatible
+
+from __future__ import annotations
+
+import os
+import pathlib
+from unittest.mock import patch
+
+import pytest
+
+from woob.core.backendscfg import BackendAlreadyExists, BackendsConfig
+
+
+BACKENDS = """
+[first]
+_module = mod1
+login = user1
+
+[second]
+_module = mod2
+login = user2
+
+[third]
+_module = mod1
+login = user3
+
+[broken]
+login = user4
+"""
+
+
+@pytest.fixture
+def backends_config(tmp_path: pathlib.Path) -> BackendsConfig:
+    path = tmp_path / "backends"
+    path.write_text(BACKENDS)
+    path.chmod(0o600)
+    return BackendsConfig(str(path))
+
+
+def test_iter_backends(backends_config: BackendsConfig) -> None:
+    assert [(name, module) for name, module, _ in backends_config.iter_backends()] == [
+        ("first", "mod1"),
+        ("second", "mod2"),
+        ("third", "mod1"),
+    ]
+    assert [name for name, _, _ in backends_config.iter_backends(modules=["mod1"])] == ["first", "third"]
+    assert [name for name, _, _ in backends_config.iter_backends(names=["third", "first", "unknown"])] == [
+        "first",
+        "third",
+    ]
+    assert [name for name, _, _ in backends_config.iter_backends(names=["third", "second"], modules=["mod1"])] == [
+        "third"
+    ]
+    assert list(backends_config.iter_backends(modules=["unknown"])) == []
+
+    # Params are copies.
+    _, _, params = next(backends_config.iter_backends())
+    params["login"] = "changed"
+    assert backends_config.get_backend("first") == ("mod1", {"login": "user1"})
+
+
+def test_parsed_once(backends_config: BackendsConfig) -> None:
+    with patch.object(BackendsConfig, "_read_config", wraps=backends_config._read_config) as read_config:
+        list(backends_config.iter_backends())
+        assert backends_config.backend_exists("second")
+        assert not backends_config.backend_exists("broken2")
+        assert backends_config.get_backend("third") == ("mod1", {"login": "user3"})
+        with pytest.raises(KeyError):
+            backends_config.get_backend("broken")
+        assert read_config.call_count == 1
+
+
+def test_invalidated_on_change(backends_config: BackendsConfig) -> None:
+    assert not backends_config.backend_exists("fourth")
+
+    path = pathlib.Path(backends_config.confpath)
+    mtime = path.stat().st_mtime_ns
+    path.write_text(BACKENDS + "\n[fourth]\n_module = mod2\n")
+    # Make sure the change is seen even with a coarse mtime resolution.
+    os.utime(path, ns=(mtime + 10**9, mtime + 10**9))
+
+    assert backends_config.backend_exists("fourth")
+    assert [name for name, _, _ in backends_config.iter_backends(modules=["mod2"])] == ["second", "fourth"]
+
+
+def test_changes(backends_config: BackendsConfig) -> None:
+    backends_config.add_backend("fourth", "mod2", {"login": "user5"})
+    with pytest.raises(BackendAlreadyExists):
+        backends_config.add_backend("fourth", "mod2", {})
+    backends_config.edit_backend("first", {"login": "new"})
+    assert backends_config.remove_backend("second")
+    assert not backends_config.remove_backend("second")
+
+    with patch.object(BackendsConfig, "_read_config") as read_config:
+        assert [(name, module, dict(params)) for name, module, params in backends_config.iter_backends()] == [
+            ("first", "mod1", {"login": "new"}),
+            ("third", "mod1", {"login": "user3"}),
+            ("fourth", "mod2", {"login": "user5"}),
+        ]
+        assert [name for name, _, _ in backends_config.iter_backends(modules=["mod2"])] == ["fourth"]
+        assert read_config.call_count == 0
+
+    # Changes are written to the file.
+    assert [name for name, _, _ in BackendsConfig(backends_config.confpath).iter_backends()] == [
+        "first",
+        "third",
+        "fourth",
+    ]
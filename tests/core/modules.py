@@ -167,3 +167,58 @@ def test_modules_loader_module_cannot_load(caplog: pytest.LogCaptureFixture, tmp
             assert caplog.records[0].message == "could not load module placeholder: Module placeholder does not exist"
 
     assert list(loader.loaded.keys()) == []
+
+
+METADATA_MODULE = """
+from woob.capabilities.base import Capability
+from woob.tools.backend import BackendConfig, Module
+from woob.tools.value import Value, ValueBackendPassword
+
+
+class MetadataCap(Capability): ...
+
+
+class MetaModule(Module, MetadataCap):
+    NAME = "metamod"
+    DESCRIPTION = "Module with metadata"
+    CONFIG = BackendConfig(
+        Value("login", label="Login"),
+        ValueBackendPassword("password", label="Password"),
+    )
+"""
+
+
+def test_modules_loader_metadata(tmp_path: pathlib.Path) -> None:
+    """Metadata of modules are cached on disk."""
+    modules_path = tmp_path / "modules"
+    (modules_path / "metamod").mkdir(parents=True)
+    (modules_path / "metamod" / "__init__.py").write_text(METADATA_MODULE)
+    (modules_path / "metamod" / "requirements.txt").write_text("woob >= 3.0\n")
+    metadata_path = str(tmp_path / "metadata.json")
+
+    loader = ModulesLoader(str(modules_path), __version__, metadata_path=metadata_path)
+    metadata = loader.get_module_metadata("metamod")
+    assert metadata.name == "metamod"
+    assert metadata.klass == "woob_modules.metamod:MetaModule"
+    assert metadata.description == "Module with metadata"
+    assert metadata.has_caps("MetadataCap") is True
+    assert metadata.has_caps("TestCap") is False
+    assert metadata.is_masked("password") is True
+    assert metadata.is_masked("login") is False
+    assert metadata.requirements == {"woob": ">=3.0"}
+    assert list(loader.loaded) == ["metamod"]
+
+    # Another loader doesn't need to import the module.
+    loader = ModulesLoader(str(modules_path), __version__, metadata_path=metadata_path)
+    with patch("woob.core.modules.importlib.import_module", Mock(side_effect=ImportError)):
+        cached = loader.get_module_metadata("metamod")
+    assert cached.to_dict() == metadata.to_dict()
+    assert list(loader.loaded) == []
+
+    # The class is directly found when loading the module.
+    assert loader.get_or_load_module("metamod").klass.__name__ == "MetaModule"
+
+    # Adding a file to the module invalidates the cache.
+    (modules_path / "metamod" / "pages.py").write_text("")
+    loader = ModulesLoader(str(modules_path), __version__, metadata_path=metadata_path)
+    assert loader.metadata.get("metamod", loader.get_module_fingerprint("metamod")) is None
@@ -19,12 +19,18 @@
 
 from __future__ import annotations
 
+import io
 import logging
+import os
 import pathlib
+import tarfile
+from unittest.mock import patch
 
 import pytest
+import responses
 
-from woob.core.repositories import Repositories, Repository
+from woob.core import repositories
+from woob.core.repositories import IProgress, ModuleInstallError, Repositories, Repository
 
 
 LOCAL_REPOSITORY = """
@@ -115,6 +121,50 @@ def test_local_repository_built(tmp_path: pathlib.Path) -> None:
     assert len(repo.modules) == 1
 
 
+def test_local_repository_incremental_build(tmp_path: pathlib.Path) -> None:
+    """Only modules which changed are imported again when the index is rebuilt."""
+    repo_path = tmp_path / "local_repo"
+    repo_path.mkdir(parents=True)
+    for name in ("incr1", "incr2", "incr3"):
+        (repo_path / f"{name}.py").write_text(MOD1.replace("mod1", name))
+
+    repo = Repository("file://" + str(repo_path))
+    repo.build_index(str(repo_path), str(repo_path / "modules.list"))
+    assert sorted(repo.modules) == ["incr1", "incr2", "incr3"]
+    assert (repo_path / Repository.INDEX_CACHE).exists()
+
+    # Touch incr2, and remove incr3.
+    stat = (repo_path / "incr2.py").stat()
+    os.utime(repo_path / "incr2.py", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    (repo_path / "incr3.py").unlink()
+
+    with patch.object(repositories, "build_module_info", wraps=repositories.build_module_info) as build:
+        repo.build_index(str(repo_path), str(repo_path / "modules.list"))
+
+    assert [call.args[1] for call in build.call_args_list] == ["incr2"]
+    assert sorted(repo.modules) == ["incr1", "incr2"]
+    assert repo.modules["incr1"].has_caps("SampleCap")
+
+    index = (repo_path / "modules.list").read_text()
+    assert "[incr1]" in index
+    assert "[incr3]" not in index
+
+
+def test_local_repository_build_workers(tmp_path: pathlib.Path) -> None:
+    """Modules can be imported in a process pool."""
+    repo_path = tmp_path / "local_repo"
+    repo_path.mkdir(parents=True)
+    for name in ("pool1", "pool2"):
+        (repo_path / f"{name}.py").write_text(MOD1.replace("mod1", name))
+    (repo_path / "pool3.py").write_text("<")
+
+    repo = Repository("file://" + str(repo_path))
+    repo.build_index(str(repo_path), str(repo_path / "modules.list"), workers=2)
+    assert sorted(repo.modules) == ["pool1", "pool2"]
+    assert repo.modules["pool2"].capabilities == ["SampleCap"]
+    assert list(repo.errors) == ["pool3"]
+
+
 def test_load_repositories(tmp_path: pathlib.Path) -> None:
     """Load repositories' content."""
     workdir = tmp_path / "work"
@@ -143,3 +193,160 @@ def test_load_repositories(tmp_path: pathlib.Path) -> None:
     # assert modinfo.is_local() is True
     assert modinfo.has_caps("SampleCap") is True
     assert modinfo.has_caps("AnotherCap") is False
+
+
+REMOTE_REPOSITORY = """
+[DEFAULT]
+name = remote
+update = 197001010000
+maintainer = jdoe@test.com
+signed = 0
+key_update = 0
+obsolete = 0
+url = https://updates.woob.test/1.0/main/
+
+[mod1]
+version = 197001010000
+capabilities = SampleCap
+dependencies =
+description = <unspecified>
+maintainer = <unspecified> <<unspecified>>
+license = <unspecified>
+icon =
+woob_spec =
+
+[mod2]
+version = 197001010000
+capabilities = SampleCap
+dependencies = mod1
+description = <unspecified>
+maintainer = <unspecified> <<unspecified>>
+license = <unspecified>
+icon =
+woob_spec =
+"""
+
+
+class RecordProgress(IProgress):
+    def __init__(self) -> None:
+        self.messages: list[str] = []
+
+    def progress(self, percent: float, message: str) -> None:
+        self.messages.append(message)
+
+
+def make_tarball(name: str) -> bytes:
+    data = MOD1.replace("mod1", name).encode("utf-8")
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        info = tarfile.TarInfo(f"{name}/__init__.py")
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+@pytest.fixture
+def remote_repos(tmp_path: pathlib.Path) -> Repositories:
+    workdir = tmp_path / "work"
+    datadir = tmp_path / "data"
+
+    workdir.mkdir(parents=True)
+    (workdir / "sources.list").write_text("https://updates.woob.test/1.0/main/")
+
+    repo_path = datadir / "repositories"
+    repo_path.mkdir(parents=True)
+    (repo_path / "00-https___updates.woob.test_1.0_main_").write_text(REMOTE_REPOSITORY)
+
+    return Repositories(str(workdir), str(datadir), "1.0")
+
+
+@responses.activate
+def test_install_modules(remote_repos: Repositories) -> None:
+    """Install a module and its dependencies from a remote repository."""
+    for name in ("mod1", "mod2"):
+        responses.add(responses.GET, f"https://updates.woob.test/1.0/main/{name}.tar.gz", body=make_tarball(name))
+        responses.add(responses.GET, f"https://updates.woob.test/1.0/main/{name}.png", status=404)
+
+    browsers = []
+    create_browser = remote_repos.create_browser
+
+    def record_browser():
+        browser = create_browser()
+        browsers.append(browser)
+        return browser
+
+    progress = RecordProgress()
+    with (
+        patch.object(remote_repos, "create_browser", record_browser),
+        patch.object(repositories.Browser, "deinit", autospec=True) as deinit,
+    ):
+        remote_repos.install("mod2", progress)
+
+    # Browsers of download threads are closed, the shared one is kept.
+    thread_browsers = [browser for browser in browsers if browser is not remote_repos.browser]
+    assert thread_browsers
+    assert [call.args[0] for call in deinit.call_args_list] == thread_browsers
+
+    for name in ("mod1", "mod2"):
+        module_dir = pathlib.Path(remote_repos.modules_dir) / name
+        assert (module_dir / "__init__.py").is_file()
+        assert list((module_dir / "__pycache__").glob("__init__.*.pyc"))
+        assert remote_repos.versions.get(name) == 197001010000
+
+    # Dependencies are installed first.
+    installed = [message for message in progress.messages if message.endswith("has been installed!")]
+    assert installed == ["Module mod1 has been installed!", "Module mod2 has been installed!"]
+
+    # Nothing is left from the staging directory.
+    assert not list(pathlib.Path(remote_repos.modules_dir).glob(".install-*"))
+
+
+@responses.activate
+def test_install_modules_error(remote_repos: Repositories) -> None:
+    """A module which can't be downloaded isn't installed."""
+    responses.add(responses.GET, "https://updates.woob.test/1.0/main/mod1.tar.gz", body=make_tarball("mod1"))
+    responses.add(responses.GET, "https://updates.woob.test/1.0/main/mod1.png", status=404)
+    responses.add(responses.GET, "https://updates.woob.test/1.0/main/mod2.tar.gz", status=404)
+
+    with pytest.raises(ModuleInstallError, match="Unable to fetch module"):
+        remote_repos.install("mod2", RecordProgress())
+
+    assert remote_repos.versions.get("mod2") is None
+    assert not (pathlib.Path(remote_repos.modules_dir) / "mod2").exists()
+
+
+@responses.activate
+def test_update_repositories_not_modified(remote_repos: Repositories) -> None:
+    """An index is not downloaded again if it has not changed."""
+    requests = []
+
+    def index_callback(request):
+        requests.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return (304, {}, "")
+        return (200, {"ETag": '"v1"'}, REMOTE_REPOSITORY)
+
+    responses.add_callback(responses.GET, "https://updates.woob.test/1.0/main/modules.list", callback=index_callback)
+
+    remote_repos.update_repositories(RecordProgress())
+    remote_repos.update_repositories(RecordProgress())
+    assert requests == [None, '"v1"']
+
+    assert sorted(remote_repos.get_all_modules_info()) == ["mod1", "mod2"]
+    (repo_file,) = pathlib.Path(remote_repos.repos_dir).iterdir()
+    assert 'etag = "v1"' in repo_file.read_text()
+
+
+@responses.activate
+def test_update_unchanged_content(remote_repos: Repositories) -> None:
+    """A module whose content didn't change is not downloaded again."""
+    index = REMOTE_REPOSITORY.replace("version = 197001010000", "version = 197001020000\ncontent_hash = abc", 1)
+    responses.add(responses.GET, "https://updates.woob.test/1.0/main/modules.list", body=index)
+
+    (pathlib.Path(remote_repos.modules_dir) / "mod1").mkdir()
+    remote_repos.versions.set("mod1", 197001010000, "abc")
+
+    remote_repos.update(RecordProgress())
+    assert remote_repos.versions.get("mod1") == 197001020000
+    assert remote_repos.versions.get_content_hash("mod1") == "abc"
+    assert [call.request.url for call in responses.calls] == ["https://updates.woob.test/1.0/main/modules.list"]
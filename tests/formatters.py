@@ -15,9 +15,13 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with woob. If not, see <http://www.gnu.org/licenses/>.
 
+import datetime
+import json
+from decimal import Decimal
 from os import remove
 from tempfile import mkstemp
 
+from woob.capabilities.base import NotAvailable
 from woob.tools.application.formatters.json import JsonFormatter, JsonLineFormatter
 from woob.tools.application.formatters.table import TableFormatter
 
@@ -48,3 +52,76 @@ def test_table():
     assert formatter_test_output(TableFormatter, {"foo": "bar"}) == (
         "┌─────┐\n" "│ Foo │\n" "├─────┤\n" "│ bar │\n" "└─────┘\n"
     )
+
+
+def test_table_stream():
+    class StreamTableFormatter(TableFormatter):
+        STREAM_THRESHOLD = 2
+
+    rows = [
+        {"id": "1", "label": "first", "amount": None},
+        {"id": "22", "label": "second", "amount": None},
+        {"id": "3", "label": "third", "amount": "12.5"},
+    ]
+
+    def output(Formatter):
+        _, name = mkstemp()
+        fmt = Formatter()
+        fmt.outfile = name
+        for row in rows:
+            fmt.format(row)
+            if Formatter is StreamTableFormatter and row is rows[1]:
+                # Rows are printed before the end.
+                with open(name) as f:
+                    assert "second" in f.read()
+        fmt.flush()
+        with open(name) as f:
+            res = f.read()
+        remove(name)
+        return res
+
+    # Columns are decided from the first rows: amount is empty there.
+    assert output(StreamTableFormatter) == (
+        "┌────┬────────┐\n"
+        "│ Id │ Label  │\n"
+        "├────┼────────┤\n"
+        "│ 1  │ first  │\n"
+        "│ 22 │ second │\n"
+        "│ 3  │ third  │\n"
+        "└────┴────────┘\n"
+    )
+    assert output(TableFormatter).startswith("┌────┬────────┬────────┐\n")
+
+
+def test_json_stream():
+    class ChunkJsonFormatter(JsonFormatter):
+        CHUNK_SIZE = 2
+
+    _, name = mkstemp()
+    fmt = ChunkJsonFormatter()
+    fmt.outfile = name
+    for i in range(5):
+        fmt.format({"id": i, "amount": Decimal("1.50"), "date": datetime.date(2026, 1, i + 1)})
+
+    # The first chunk is written before the end.
+    with open(name) as f:
+        assert f.read().startswith('[{"id": 0, ')
+
+    fmt.flush()
+    with open(name) as f:
+        res = f.read()
+    remove(name)
+
+    assert json.loads(res) == [{"id": i, "amount": "1.50", "date": "2026-01-0%d" % (i + 1)} for i in range(5)]
+
+    assert formatter_test_output(JsonFormatter, {"foo": NotAvailable}) == '[{"foo": null}]\n'
+
+
+def test_json_empty():
+    _, name = mkstemp()
+    fmt = JsonFormatter()
+    fmt.outfile = name
+    fmt.flush()
+    with open(name) as f:
+        assert f.read() == "[]\n"
+    remove(name)
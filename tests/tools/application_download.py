@@ -0,0 +1,78 @@
+# Copyright(C) 2026 woob project
+#
+# This file is part of woob.
+#
+# woob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# woob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with woob. If not, see <http://www.gnu.org/licenses/>.
+
+# flake8: compatible
+
+from __future__ import annotations
+
+import threading
+from time import sleep
+
+import pytest
+
+from woob.tools.application.download import Downloader, is_downloaded, write_file
+
+
+def test_write_file(tmp_path) -> None:
+    dest = str(tmp_path / "doc.pdf")
+    assert not is_downloaded(dest)
+
+    assert write_file(dest, [b"abc", b"def"]) == 6
+    assert is_downloaded(dest)
+    assert is_downloaded(dest, 6)
+    assert not is_downloaded(dest, 5)
+
+    def chunks():
+        yield b"partial"
+        raise OSError("connection reset")
+
+    with pytest.raises(OSError):
+        write_file(dest, chunks())
+
+    # The previous file is kept, and no temporary file is left.
+    assert (tmp_path / "doc.pdf").read_bytes() == b"abcdef"
+    assert [path.name for path in tmp_path.iterdir()] == ["doc.pdf"]
+
+
+def test_downloader(tmp_path) -> None:
+    lock = threading.Lock()
+    running = {}
+    concurrent = set()
+
+    def fetch(key, data):
+        def fetch():
+            with lock:
+                assert key not in running, "downloads of a key must not be concurrent"
+                running[key] = True
+                if len(running) > 1:
+                    concurrent.add(key)
+            sleep(0.01)
+            with lock:
+                del running[key]
+            return data
+
+        return fetch
+
+    futures = []
+    with Downloader(max_workers=4) as downloader:
+        for i in range(6):
+            key = "a" if i % 2 else "b"
+            futures.append(downloader.submit(key, str(tmp_path / f"{i}.txt"), fetch(key, b"x" * i or None)))
+
+    assert [future.result() for future in futures] == [None, 1, 2, 3, 4, 5]
+    assert sorted(path.name for path in tmp_path.iterdir()) == [f"{i}.txt" for i in range(1, 6)]
+    assert concurrent
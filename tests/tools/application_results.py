@@ -0,0 +1,97 @@
+# Copyright(C) 2026 woob project
+#
+# This file is part of woob.
+#
+# woob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# woob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with woob. If not, see <http://www.gnu.org/licenses/>.
+
+import datetime
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+from woob.capabilities.base import BaseObject, DecimalField, NotAvailable, StringField
+from woob.capabilities.date import DateField, DeltaField
+from woob.tools.application.results import ResultsCondition, ResultsConditionError
+
+
+class Item(BaseObject):
+    label = StringField("Label")
+    amount = DecimalField("Amount")
+    date = DateField("Date")
+    duration = DeltaField("Duration")
+
+
+def make_item(**kwargs):
+    item = Item(id="42", backend="bank")
+    item.label = "Coffee shop"
+    item.amount = Decimal("-3.50")
+    item.date = datetime.date(2026, 3, 14)
+    item.duration = datetime.timedelta(minutes=90)
+    for key, value in kwargs.items():
+        setattr(item, key, value)
+    return item
+
+
+@pytest.mark.parametrize(
+    "condition, expected",
+    [
+        ("amount<0", True),
+        ("amount>0", False),
+        ("amount=-3.50", True),
+        ("label|Coffee", True),
+        ("label!|Coffee", False),
+        ("date=2026-03-14", True),
+        ("date>2026-03-01 AND date<2026-04-01", True),
+        ("date>2026-04-01 OR amount<-3", True),
+        ("duration>1h", True),
+        ("duration<1h 30m", False),
+        ("amount=foo", False),
+        ("id=42", True),
+        ("id=42@bank", True),
+        ("id!=42", False),
+        ("id=43", False),
+    ],
+)
+def test_condition(condition, expected):
+    assert ResultsCondition(condition).is_valid(make_item()) is expected
+
+
+def test_condition_limit():
+    condition = ResultsCondition("amount<0 LIMIT 10")
+    assert condition.limit == 10
+    assert str(condition) == "amount<0"
+
+
+def test_condition_invalid_field():
+    with pytest.raises(ResultsConditionError):
+        ResultsCondition("nope=1").is_valid(make_item())
+
+    with pytest.raises(ResultsConditionError):
+        ResultsCondition("nope").is_valid(make_item())
+
+
+def test_condition_empty_value():
+    assert ResultsCondition("amount<0").is_valid(make_item(amount=NotAvailable)) is False
+
+
+def test_condition_converted_once():
+    condition = ResultsCondition("amount<0")
+    items = [make_item(amount=Decimal(i)) for i in range(-5, 5)]
+
+    with patch.object(BaseObject, "to_dict") as to_dict:
+        assert [item.amount for item in items if condition.is_valid(item)] == [Decimal(i) for i in range(-5, 0)]
+    to_dict.assert_not_called()
+
+    assert condition.condition[0][0].converted == {Decimal: Decimal(0)}
@@ -167,3 +167,67 @@ def test_items_virtual_dict(existing_db: SQLiteConfig) -> None:
         table = config.get("table1")
 
     assert list(table.items()) == [("applications.bill", {}), ("applications.float", 1.66)]
+
+
+def test_wal_mode(existing_db: SQLiteConfig) -> None:
+    """Database is opened in WAL mode."""
+    config = existing_db
+    with config:
+        assert config.storage.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_maintenance_policy(existing_db: SQLiteConfig) -> None:
+    """Database is only vacuumed when needed."""
+    config = existing_db
+    with config:
+        # Just vacuumed, and no free pages.
+        assert config.maintenance() is False
+        assert config.maintenance(force=True) is True
+        assert config.tables() == ["table1"]
+
+        config.set_many("table2", [(f"key{i}", "x" * 1000) for i in range(100)])
+        config.delete("table2")
+        config.force_save()
+        # A lot of pages are free after the table deletion.
+        assert config.maintenance() is True
+        assert config.maintenance() is False
+
+        config.vacuum_since_seconds = 0
+        assert config.maintenance() is True
+
+
+def test_batch(existing_db: SQLiteConfig) -> None:
+    """Changes in a batch are committed or rolled back at once."""
+    config = existing_db
+    with config:
+        with config.batch():
+            config.set("table1", "applications.bank", 1)
+            with config.batch():
+                config.set("table1", "applications.bill", 2)
+            # Not committed yet, even when saving.
+            config.force_save()
+            assert config.storage.in_transaction
+
+        assert not config.storage.in_transaction
+        assert config.get("table1", "applications.bank") == 1
+
+        with pytest.raises(ValueError):
+            with config.batch():
+                config.set("table1", "applications.bank", 3)
+                raise ValueError()
+
+        assert config.get("table1", "applications.bank") == 1
+
+
+def test_update_virtual_dict(existing_db: SQLiteConfig) -> None:
+    """Several keys can be set at once through VirtualDict interface."""
+    config = existing_db
+    with config:
+        table = config.get("table1")
+        table.update({"applications.bill": {"a": 1}, "applications.bank": 2}, other=3)
+        assert not config.storage.in_transaction
+
+    assert table["applications.bill"] == {"a": 1}
+    assert table["applications.bank"] == 2
+    assert table["other"] == 3
+    assert len(table) == 4
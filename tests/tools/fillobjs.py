@@ -0,0 +1,98 @@
+# Copyright(C) 2026 woob project
+#
+# This file is part of woob.
+#
+# woob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# woob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with woob. If not, see <http://www.gnu.org/licenses/>.
+
+# flake8: compatible
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+from woob.capabilities.base import BaseObject, NotAvailable, NotLoaded, StringField
+from woob.tools.application.base import Application
+from woob.tools.backend import Module
+
+
+class Item(BaseObject):
+    label = StringField("Label")
+    comment = StringField("Comment")
+
+
+class Other(BaseObject):
+    label = StringField("Label")
+    comment = StringField("Comment")
+
+
+def fill_items(backend, items, fields):
+    backend.batches.append(([item.id for item in items], fields))
+    for item in items:
+        item.label = f"label {item.id}"
+
+
+def fill_other(backend, other, fields):
+    other.label = "other"
+
+
+class BatchModule(Module):
+    NAME = "batch"
+    OBJECTS = {Other: fill_other}
+    BATCH_OBJECTS = {Item: fill_items}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batches = []
+
+
+def test_fillobjs() -> None:
+    backend = BatchModule(Mock(), "batch")
+    complete = Item(id="0")
+    complete.label = complete.comment = "done"
+    partial = Item(id="3")
+    partial.comment = "set"
+    objs = [Item(id="1"), Other(id="2"), None, complete, partial]
+
+    assert backend.fillobjs(objs, ["label", "comment"]) == objs
+
+    # Complete objects are not given, and fields missing in any object are asked.
+    assert backend.batches == [(["1", "3"], ["label", "comment"])]
+    assert objs[0].label == "label 1"
+    assert objs[0].comment is NotAvailable
+    assert objs[1].label == "other"
+    assert objs[4].label == "label 3"
+    assert objs[4].comment == "set"
+
+
+def test_do_complete_batches() -> None:
+    backend = BatchModule(Mock(), "batch")
+    pulled = []
+
+    def iter_items(backend):
+        for i in range(100):
+            pulled.append(i)
+            yield Item(id=str(i))
+
+    app = Application.__new__(Application)
+    app.condition = None
+    app._is_default_count = False
+    app.FILL_WINDOW = 4
+
+    results = list(app._do_complete(backend, 6, ["label"], iter_items))
+
+    assert [item.id for item in results] == [str(i) for i in range(6)]
+    assert all(item.backend == "batch" and item.comment is NotLoaded for item in results)
+    # The item after the last one is pulled and completed, as one by one.
+    assert pulled == list(range(7))
+    assert [ids for ids, _ in backend.batches] == [["0", "1", "2", "3"], ["4", "5", "6"]]
@@ -0,0 +1,30 @@
+from importlib import metadata
+from unittest.mock import patch
+
+from woob.tools.packaging import cached_parse_requirements, clear_caches, get_installed_version
+
+
+def test_cached_parse_requirements(tmp_path):
+    path = tmp_path / "requirements.txt"
+    assert cached_parse_requirements(path) == {}
+
+    path.write_text("woob >= 3.0\nlxml\n")
+    requirements = cached_parse_requirements(path)
+    assert list(requirements) == ["woob", "lxml"]
+    assert cached_parse_requirements(path) is requirements
+
+    path.write_text("woob >= 3.0, < 5\n")
+    assert list(cached_parse_requirements(path)) == ["woob"]
+
+
+def test_get_installed_version():
+    clear_caches()
+
+    with patch("woob.tools.packaging.metadata.distributions", wraps=metadata.distributions) as distributions:
+        assert get_installed_version("requests") == metadata.version("requests")
+        # names are normalized
+        assert get_installed_version("Python_Dateutil") == metadata.version("python-dateutil")
+        assert get_installed_version("woob-does-not-exist") is None
+
+    # installed distributions are only scanned once
+    assert distributions.call_count == 1
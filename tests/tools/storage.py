@@ -0,0 +1,137 @@
+# Copyright(C) 2026 woob project
+#
+# This file is part of woob.
+#
+# woob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# woob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with woob. If not, see <http://www.gnu.org/licenses/>.
+
+# flake8: compatible
+
+from __future__ import annotations
+
+import pathlib
+
+import pytest
+
+from woob.tools.backend import BackendStorage
+from woob.tools.storage import ShardedStorage, StandardStorage, migrate_storage
+
+
+def test_sharded_storage(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "storage.d"
+    storage = ShardedStorage(str(path))
+
+    first = BackendStorage("first", storage)
+    first.load({"seen": [], "state": None})
+    second = BackendStorage("second", storage)
+    second.load({"seen": []})
+
+    # Nothing is written until it is saved.
+    assert not path.exists()
+
+    first.set("seen", ["a", "b"])
+    first.set("state", "blob")
+    first.save()
+    assert (path / "backends" / "first.yaml").exists()
+    assert not (path / "backends" / "second.yaml").exists()
+
+    second.set("seen", ["c"])
+    second.save()
+
+    # Another process saving the second backend doesn't lose changes of the
+    # first one.
+    other = BackendStorage("second", ShardedStorage(str(path)))
+    other.load({"seen": []})
+    other.set("seen", ["c", "d"])
+    other.save()
+
+    first.set("state", "new blob")
+    first.save()
+
+    storage = ShardedStorage(str(path))
+    assert storage.get("backends", "first", "seen") == ["a", "b"]
+    assert storage.get("backends", "first", "state") == "new blob"
+    assert storage.get("backends", "second", "seen") == ["c", "d"]
+    assert storage.get("backends", "unknown", "seen", default=[]) == []
+
+    storage.delete("backends", "first", "state")
+    storage.save("backends", "first")
+    assert ShardedStorage(str(path)).get("backends", "first") == {"seen": ["a", "b"]}
+
+
+def test_sharded_storage_names(tmp_path: pathlib.Path) -> None:
+    storage = ShardedStorage(str(tmp_path))
+    storage.load("backends", "../evil/name")
+    storage.set("backends", "../evil/name", "key", "value")
+    storage.save("backends", "../evil/name")
+
+    assert list((tmp_path / "backends").iterdir()) == [tmp_path / "backends" / "..%2Fevil%2Fname.yaml"]
+    assert ShardedStorage(str(tmp_path)).get("backends", "../evil/name", "key") == "value"
+
+
+def test_migrate_storage(tmp_path: pathlib.Path) -> None:
+    source = tmp_path / "app.storage"
+    old = StandardStorage(str(source))
+    old.load("backends", "first", {"seen": ["a"]})
+    old.load("backends", "second", {"seen": ["b"]})
+    old.load("applications", "app", {"last": 42})
+    old.save("backends", "first")
+
+    destination = tmp_path / "app.storage.d"
+    assert migrate_storage(str(source), str(destination)) == 3
+
+    new = ShardedStorage(str(destination))
+    assert new.get("backends", "first", "seen") == ["a"]
+    assert new.get("backends", "second", "seen") == ["b"]
+    assert new.get("applications", "app", "last") == 42
+
+    # Running it again doesn't override newer data.
+    new.set("backends", "first", "seen", ["a", "c"])
+    new.save("backends", "first")
+    assert migrate_storage(str(source), str(destination)) == 3
+    assert ShardedStorage(str(destination)).get("backends", "first", "seen") == ["a", "c"]
+
+    with pytest.raises(FileNotFoundError):
+        migrate_storage(str(tmp_path / "missing"), str(destination))
+
+
+def test_backend_storage_skips_unchanged(tmp_path: pathlib.Path) -> None:
+    path = tmp_path / "storage"
+    storage = BackendStorage("backend", StandardStorage(str(path)))
+    storage.load({"browser_state": {}})
+    total_writes = BackendStorage.total_writes
+    total_skipped_writes = BackendStorage.total_skipped_writes
+
+    # Nothing changed since it was loaded.
+    storage.set("browser_state", {})
+    storage.save()
+    assert (storage.writes, storage.skipped_writes) == (0, 1)
+
+    storage.set("browser_state", {"cookies": b"\x02abc"})
+    storage.save()
+    assert (storage.writes, storage.skipped_writes) == (1, 1)
+    mtime = path.stat().st_mtime_ns
+
+    storage.set("browser_state", {"cookies": b"\x02abc"})
+    storage.save()
+    assert (storage.writes, storage.skipped_writes) == (1, 2)
+    assert path.stat().st_mtime_ns == mtime
+
+    assert BackendStorage.total_writes == total_writes + 1
+    assert BackendStorage.total_skipped_writes == total_skipped_writes + 2
+
+    # Once reloaded, unchanged data aren't written either.
+    storage = BackendStorage("backend", StandardStorage(str(path)))
+    storage.load({"browser_state": {}})
+    storage.save()
+    assert (storage.writes, storage.skipped_writes) == (0, 1)
@@ -1,4 +1,6 @@
 from .launcher import Launcher
 
 
-Launcher().run()
+# Guarded, as worker processes started with "spawn" import the main module.
+if __name__ == "__main__":
+    Launcher().run()
@@ -16,6 +16,7 @@
 # along with woob. If not, see <http://www.gnu.org/licenses/>.
 
 from decimal import Decimal
+from itertools import zip_longest
 
 from woob.capabilities.bill import CapDocument, Detail, Subscription
 from woob.capabilities.captcha import exception_to_job
@@ -24,8 +25,10 @@
 from woob.exceptions import CaptchaQuestion
 from woob.tools.application.base import MoreResultsAvailable
 from woob.tools.application.captcha import CaptchaMixin
+from woob.tools.application.download import Downloader, is_downloaded, write_file
 from woob.tools.application.formatters.iformatter import PrettyFormatter
 from woob.tools.application.repl import ReplApplication, defaultcount
+from woob.tools.misc import get_backtrace
 
 
 __all__ = ["AppBill"]
@@ -226,8 +229,7 @@ def do_download(self, line, force_pdf=False):
                     self.stdout.buffer.write(buf)
                 else:
                     try:
-                        with open(dest, "wb") as f:
-                            f.write(buf)
+                        write_file(dest, buf)
                         if not document.has_file:
                             print("Warning: document.has_file is falsy but the file is available", file=self.stderr)
                     except OSError as e:
@@ -249,20 +251,64 @@ def download_all(self, sub_id, force_pdf):
             sub_id, backend_name = self.parse_id(sub_id)
             names = (backend_name,) if backend_name else None
             (subscription,) = self.do("get_subscription", sub_id, backends=names)
-            if not self.download_subscription(subscription, force_pdf):
-                return 1
+            subscriptions = [subscription]
         else:
-            for subscription in self.do("iter_subscription"):
-                if not self.download_subscription(subscription, force_pdf):
-                    return 1
+            subscriptions = self.sort_subscriptions(self.do("iter_subscription"))
 
-    def download_subscription(self, subscription, force_pdf):
-        for document in self.do("iter_documents", subscription, backends=(subscription.backend,)):
-            if not self.download_doc(document, force_pdf):
-                return False
-        return True
+        downloads = []
+        with Downloader() as downloader:
+            try:
+                for subscription in subscriptions:
+                    downloads += self.download_subscription(downloader, subscription, force_pdf)
+            except BaseException:
+                downloader.shutdown(cancel=True)
+                raise
+
+        if not self.wait_downloads(downloads):
+            return 1
+
+    def sort_subscriptions(self, subscriptions):
+        """
+        Alternate subscriptions of each backend.
+
+        A backend is locked while it lists documents, which prevents its own
+        downloads, so documents of a backend are listed while the ones of
+        the previous backend are downloaded.
+        """
+        by_backend = {}
+        for subscription in subscriptions:
+            by_backend.setdefault(subscription.backend, []).append(subscription)
+        return [
+            subscription
+            for subscriptions in zip_longest(*by_backend.values())
+            for subscription in subscriptions
+            if subscription is not None
+        ]
+
+    def download_subscription(self, downloader, subscription, force_pdf):
+        """
+        Schedule the download of documents of a subscription.
+
+        Documents are all listed before downloads are scheduled: downloads of
+        a backend can't run while it is listing, only downloads of other
+        backends go on meanwhile.
+
+        :return: list of (document, dest, future)
+        """
+        documents = list(self.do("iter_documents", subscription, backends=(subscription.backend,)))
+        downloads = []
+        for document in documents:
+            download = self.download_doc(downloader, document, force_pdf)
+            if download is not None:
+                downloads.append(download)
+        return downloads
+
+    def download_doc(self, downloader, document, force_pdf):
+        """
+        Schedule the download of a document, unless it is already on disk.
 
-    def download_doc(self, document, force_pdf):
+        :return: (document, dest, future), or None if it is skipped
+        """
         if force_pdf:
             method = "download_document_pdf"
         else:
@@ -270,18 +316,46 @@ def download_doc(self, document, force_pdf):
 
         extension = document.format if not force_pdf else "pdf"
         dest = document.id + (f".{extension}" if extension else "")
-
-        for buf in self.do(method, document, backends=(document.backend,)):
-            if buf:
+        if is_downloaded(dest):
+            self.logger.info('Skipping "%s", already downloaded', dest)
+            return None
+
+        def fetch():
+            # The backend is called directly from a download thread, instead
+            # of through BackendsCall. It is safe because its lock is held
+            # while it is used, so only one thread uses its browser at once;
+            # errors are wrapped in CallErrors like BackendsCall does.
+            backend = self.woob.get_backend(document.backend)
+            with backend:
                 try:
-                    with open(dest, "wb") as f:
-                        f.write(buf)
-                        if not document.has_file:
-                            print("Warning: document.has_file is falsy but the file is available", file=self.stderr)
-                except OSError as e:
-                    print(f'Unable to write bill in "{dest}": {e}', file=self.stderr)
-                    return False
-        return True
+                    return getattr(backend, method)(document) or None
+                except Exception as error:
+                    raise CallErrors([(backend, error, get_backtrace(str(error)))])
+
+        return document, dest, downloader.submit(document.backend, dest, fetch)
+
+    def wait_downloads(self, downloads):
+        """
+        Wait for scheduled downloads and report their errors.
+
+        :raises: :class:`CallErrors` with errors of all backends
+        :return: False if a file couldn't be written
+        """
+        ok = True
+        errors = []
+        for document, dest, future in downloads:
+            try:
+                if future.result() and not document.has_file:
+                    print("Warning: document.has_file is falsy but the file is available", file=self.stderr)
+            except CallErrors as e:
+                errors += e.errors
+            except OSError as e:
+                print(f'Unable to write bill in "{dest}": {e}', file=self.stderr)
+                ok = False
+
+        if errors:
+            raise CallErrors(errors)
+        return ok
 
     def do_profile(self, line):
         """
@@ -157,12 +157,13 @@ def do_list(self, line):
         caps = line.split()
         for backend_name, module_name, params in sorted(self.woob.backends_config.iter_backends()):
             try:
-                module = self.woob.modules_loader.get_or_load_module(module_name)
+                # Metadata are cached, so modules don't have to be imported.
+                metadata = self.woob.modules_loader.get_module_metadata(module_name)
             except ModuleLoadError as e:
                 self.logger.warning(f"Unable to load module {module_name!r}: {e}")
                 continue
 
-            if caps and not module.has_caps(*caps):
+            if caps and not metadata.has_caps(*caps):
                 continue
             row = OrderedDict(
                 [
@@ -171,9 +172,7 @@ def do_list(self, line):
                     (
                         "Configuration",
                         ", ".join(
-                            "{}={}".format(
-                                key, ("*****" if key in module.config and module.config[key].masked else value)
-                            )
+                            "{}={}".format(key, ("*****" if metadata.is_masked(key) else value))
                             for key, value in params.items()
                         ),
                     ),
@@ -16,10 +16,12 @@
 # along with woob. If not, see <http://www.gnu.org/licenses/>.
 
 import os
+from itertools import islice
 from re import search, sub
 
 from woob.capabilities.base import empty
 from woob.capabilities.gallery import BaseGallery, BaseImage, CapGallery
+from woob.tools.application.download import Downloader, is_downloaded
 from woob.tools.application.formatters.iformatter import PrettyFormatter
 from woob.tools.application.repl import ReplApplication, defaultcount
 
@@ -110,32 +112,70 @@ def do_download(self, line):
             pass  # ignore error on existing directory
         os.chdir(dest)  # fail here if dest couldn't be created
 
-        i = 0
-        for img in self.woob[backend].iter_gallery_images(gallery):
-            i += 1
-            if i < first:
-                continue
-
-            self.woob[backend].fillobj(img, ("url", "data"))
-            if img.data is None:
-                self.woob[backend].fillobj(img, ("url", "data"))
-                if img.data is None:
-                    print("Couldn't get page %d, exiting" % i, file=self.stderr)
-                    break
-
-            ext = search(r"\.([^\.]{1,5})$", img.url)
-            if ext:
-                ext = ext.group(1)
-            else:
-                ext = "jpg"
-
-            name = "%03d.%s" % (i, ext)
-            print("Writing file %s" % name)
-
-            with open(name, "wb") as f:
-                f.write(img.data)
+        backend = self.woob[backend]
+        images = ((i, img) for i, img in enumerate(backend.iter_gallery_images(gallery), 1) if i >= first)
+        ret = None
+        stop = False
+        writes = []
+        with Downloader() as downloader:
+            # Images of a window are filled together, which lets backends
+            # fetch them concurrently, while the previous window is written.
+            while not stop and (window := list(islice(images, self.FILL_WINDOW))):
+                to_fill = [img for i, img in window if not self.is_image_downloaded(i, img)]
+                if to_fill:
+                    backend.fillobjs(to_fill, ("url", "data"))
+                filled = {id(img) for img in to_fill}
+
+                previous, writes = writes, []
+                for i, img in window:
+                    if id(img) not in filled:
+                        print("Skipping page %d, already downloaded" % i)
+                        continue
+
+                    if empty(img.data):
+                        backend.fillobj(img, ("url", "data"))
+                        if empty(img.data):
+                            print("Couldn't get page %d, exiting" % i, file=self.stderr)
+                            stop = True
+                            break
+
+                    name = self.get_image_name(i, img)
+                    print("Writing file %s" % name)
+                    writes.append((name, downloader.submit(name, name, lambda data=img.data: data)))
+
+                if not self.wait_writes(previous):
+                    ret = 1
+                    stop = True
+
+        if not self.wait_writes(writes):
+            ret = 1
 
         os.chdir(os.path.pardir)
+        return ret
+
+    def get_image_name(self, i, img):
+        ext = search(r"\.([^\.]{1,5})$", img.url)
+        if ext:
+            ext = ext.group(1)
+        else:
+            ext = "jpg"
+
+        return "%03d.%s" % (i, ext)
+
+    def is_image_downloaded(self, i, img):
+        if empty(img.url):
+            return False
+        return is_downloaded(self.get_image_name(i, img), None if empty(img.size) else img.size)
+
+    def wait_writes(self, writes):
+        ok = True
+        for name, future in writes:
+            try:
+                future.result()
+            except OSError as e:
+                print(f'Unable to write file "{name}": {e}', file=self.stderr)
+                ok = False
+        return ok
 
     def do_info(self, line):
         """
@@ -19,16 +19,14 @@
 # set PYTHONPATH=D:\Dropbox\Projets\boomoney
 # D:\Dropbox\Projets\boomoney\scripts\bin\woob.exe money -N
 
-import asyncio
 import datetime
+import multiprocessing
 import os
 import re
 import shutil
 import signal
 import subprocess
 import sys
-from asyncio import create_subprocess_exec
-from asyncio.subprocess import PIPE
 from io import StringIO
 from optparse import OptionGroup
 from threading import Lock, Thread
@@ -46,6 +44,7 @@
 from woob.applications.bank.bank import OfxFormatter
 from woob.capabilities.bank import AccountType
 from woob.tools.application.formatters.simple import SimpleFormatter
+from woob.tools.misc import get_backtrace
 
 
 __all__ = ["AppMoney"]
@@ -145,149 +144,90 @@ def run(self):
                 self.last_dates[account] = last_date
 
 
+def history_worker(args, conn):
+    """
+    Entry point of history worker processes.
+
+    The application, with its logged-in backend, is kept alive while
+    accounts are received on `conn`, and the OFX content of each of them is
+    sent back. None stops the worker.
+    """
+    # The parent process handles interruptions, and terminates workers.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    app = AppMoney()
+    app.parse_args(args)
+    app.load_config()
+    app._interactive = False
+
+    while (account := conn.recv()) is not None:
+        try:
+            result = app.retrieve_history(account)
+        except Exception:
+            result = "", get_backtrace()
+        conn.send(result)
+
+
 class HistoryThreadAsAProcess(HistoryThread):
+    """
+    Retrieve history of accounts in a worker process.
+
+    It isolates crashes of the backend, and lets several backends work in
+    parallel.
+    """
+
+    MP_CONTEXT = "spawn"
+    """Start method of workers: they are started from a thread, and forking a
+    multi-threaded process may leave locks held in the child"""
 
     def __init__(self, money, accounts):
         super().__init__(money, accounts)
-        self.ofxcontent = ""
-        self.stderr = ""
-        self.loop = asyncio.new_event_loop()
+        self.process = None
+        self.results = {}
 
     def terminate(self):
-        self.process.terminate()
+        if self.process is not None:
+            self.process.terminate()
         return super().terminate()
 
     def retrieve_history(self, account):
-        self.ofxcontent[account] = re.sub(r"\r\r\n", r"\n", self.ofxcontent[account])
-        return self.ofxcontent[account], self.stderrcontent[account]
-
-    async def _read_stream(self, stream, callback):
-        while True:
-            line = await stream.readline()
-            if line:
-                callback(line)
-            else:
-                break
-
-    async def run_process(self):
-        id, backend = self.accounts[0].split("@")
-
-        propagated_options = []
-        for o in vars(self.money.options):
-            switcher = {
-                "backends": False,
-                "exclude_backends": False,
-                "insecure": True,
-                "nss": True,
-                "debug": True,
-                "quiet": False,
-                "verbose": True,
-                "logging_file": False,
-                "save_responses": False,
-                "export_session": False,
-                "shell_completion": False,
-                "auto_update": False,
-                "condition": False,
-                "count": True,
-                "select": False,
-                "formatter": False,
-                "no_header": False,
-                "no_keys": False,
-                "outfile": False,
-                "list": False,
-                "force": True,
-                "accounts": False,
-                "until_date": True,
-                "no_import": False,
-                "display": False,
-            }
-            propagate = switcher.get(o, None)
-            if propagate is None:
-                self.money.logger.warning("Unhandled option %s." % o)
-                propagate = False
-            if propagate:
-                value = getattr(self.money.options, o)
-                o = o.replace("_", "-")
-                if value is not None:
-                    if value == 0:
-                        pass
-                    elif value == 1:
-                        propagated_options += ["--" + o]
-                    else:
-                        propagated_options += ["--" + o + "=" + str(value)]
+        return self.results.pop(account)
 
-        self.cmd = [
-            sys.executable,  # D:\...\woob.exe
-            sys.path[0],
-            "money",
-            "--no-import",
-            "--display",
-            "--backends=" + backend,
-            "--accounts=" + ",".join(self.accounts),
-        ] + propagated_options
-        self.money.logger.info(" ".join(self.cmd))
-
-        self.process = await create_subprocess_exec(*self.cmd, stdout=PIPE, stderr=PIPE)
-
-        def handle_stdout_line(line):
-            line = line.decode("CP1252")
-            if not re.search(r"^\([0-9]+/[0-9]+\) ", line) is None:
-                account = re.split(r"\s", line)[1]
-                self.ofxcontent[account] = self.stdout
-                self.stderrcontent[account] = self.stderr
-                last_date = self.money.get_history_from_thread(account, self)
+    def run(self):
+        backend = self.accounts[0].split("@")[1]
+        args = self.money.get_worker_args(backend)
+        self.money.logger.info("Starting history worker: %s", " ".join(args))
+
+        context = multiprocessing.get_context(self.MP_CONTEXT)
+        conn, child_conn = context.Pipe()
+        self.process = context.Process(target=history_worker, args=(args, child_conn), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+        try:
+            # The worker retrieves the next accounts while results are imported.
+            try:
+                for account in self.accounts + [None]:
+                    conn.send(account)
+            except OSError:
+                pass
+
+            for account in self.accounts:
+                try:
+                    self.results[account] = conn.recv()
+                except (EOFError, OSError):
+                    self.process.join(1)
+                    self.results[account] = (
+                        "",
+                        "History worker of %s exited with code %s\n" % (backend, self.process.exitcode),
+                    )
 
+                last_date = self.money.get_history_from_thread(account, self)
                 if not self.money.options.no_import:
                     self.last_dates[account] = last_date
-
-                self.stdout = ""
-                self.stderr = ""
-                self.stdouterr = ""
-                self.intransaction = False
-                return
-
-            if line.startswith("Hint: There are more results available"):
-                self.stderr += line
-                self.stdouterr += line
-                return
-
-            if line.startswith("OFXHEADER:"):
-                self.intransaction = True
-
-            if self.intransaction:
-                self.stdout += line
-            else:
-                self.stderr += line
-            self.stdouterr += line
-
-            # print("STDOUT: {}".format(line))
-
-        def handle_stderr_line(line):
-            line = line.decode("CP1252")
-            self.stderr += line
-            self.stdouterr += line
-            # print("STDERR: {}".format(line))
-
-        self.stdout = ""
-        self.stderr = ""
-        self.stdouterr = ""
-        self.ofxcontent = dict()
-        self.stderrcontent = dict()
-        self.intransaction = False
-
-        await asyncio.wait(
-            [
-                self._read_stream(self.process.stdout, handle_stdout_line),
-                self._read_stream(self.process.stderr, handle_stderr_line),
-            ]
-        )
-
-        await self.process.wait()
-
-    def run(self):
-        self.loop.run_until_complete(self.run_process())
-        if self.stdouterr != "":
-            self.money.print(" ".join(self.cmd) + "\n" + self.stdouterr)
+        finally:
+            conn.close()
+            self.process.join()
 
 
 class AppMoney(Appbank):
@@ -333,6 +273,54 @@ def __init__(self):
         self.commands_formatters["select"] = "simple"
         self._backupDone = False
 
+    WORKER_OPTIONS = {
+        "backends": False,
+        "exclude_backends": False,
+        "insecure": True,
+        "nss": True,
+        "debug": True,
+        "quiet": False,
+        "verbose": True,
+        "logging_file": False,
+        "save_responses": False,
+        "export_session": False,
+        "shell_completion": False,
+        "auto_update": False,
+        "condition": False,
+        "count": True,
+        "select": False,
+        "formatter": False,
+        "no_header": False,
+        "no_keys": False,
+        "outfile": False,
+        "list": False,
+        "force": True,
+        "accounts": False,
+        "until_date": True,
+        "no_import": False,
+        "display": False,
+    }
+    """Options given to history workers"""
+
+    def get_worker_args(self, backend):
+        args = [self.APPNAME, "--backends=" + backend]
+        for o in vars(self.options):
+            propagate = self.WORKER_OPTIONS.get(o, None)
+            if propagate is None:
+                self.logger.warning("Unhandled option %s." % o)
+                propagate = False
+            if propagate:
+                value = getattr(self.options, o)
+                o = o.replace("_", "-")
+                if value is not None:
+                    if value == 0:
+                        pass
+                    elif value == 1:
+                        args += ["--" + o]
+                    else:
+                        args += ["--" + o + "=" + str(value)]
+        return args
+
     def str2bool(self, str):
         if str is True:
             return True
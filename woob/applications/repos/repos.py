@@ -15,13 +15,17 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with woob. If not, see <http://www.gnu.org/licenses/>.
 
+import gzip
+import hashlib
 import os
 import shutil
 import subprocess
 import tarfile
-from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from copy import copy
 from datetime import datetime
+from io import BytesIO
+from tempfile import NamedTemporaryFile
 from time import mktime, strptime
 
 from woob.core.repositories import Repository
@@ -32,6 +36,79 @@
 __all__ = ["AppWoobRepos"]
 
 
+def archive_filter(tarinfo):
+    """
+    Filter and normalize entries of module archives, so that they only
+    depend on the content of the module.
+    """
+    filename = tarinfo.name
+    # Skip *.pyc files in tarballs.
+    if filename.endswith(".pyc") or os.path.basename(filename) == "__pycache__":
+        return
+    # Don't include *.png files in tarball
+    if filename.endswith(".png"):
+        return
+
+    tarinfo.uid = tarinfo.gid = 0
+    tarinfo.uname = tarinfo.gname = ""
+    tarinfo.mode = 0o755 if tarinfo.isdir() or tarinfo.mode & 0o111 else 0o644
+    return tarinfo
+
+
+def build_archive(module_path, name, tarname, mtime):
+    """
+    Build a reproducible archive of a module.
+
+    Entries are sorted, and their timestamp is the version of the module, so
+    the same module always gives the same archive. It is run in a process
+    pool.
+
+    :return: True if the archive has been written, False if the existing one
+             is the same, and the hash of the content of the module, which
+             doesn't depend on timestamps
+    """
+    content_hash = hashlib.sha256()
+    buf = BytesIO()
+    with gzip.GzipFile(filename="", mode="wb", fileobj=buf, mtime=0) as gz:
+        with tarfile.open(fileobj=gz, mode="w", format=tarfile.GNU_FORMAT) as tar:
+            for root, dirs, files in os.walk(module_path):
+                dirs.sort()
+                arcroot = os.path.join(name, os.path.relpath(root, module_path))
+                for filename in [None, *sorted(files)]:
+                    path = root if filename is None else os.path.join(root, filename)
+                    arcname = os.path.normpath(arcroot if filename is None else os.path.join(arcroot, filename))
+                    tarinfo = archive_filter(tar.gettarinfo(path, arcname))
+                    if tarinfo is None:
+                        if filename is None:
+                            dirs.clear()
+                        continue
+
+                    tarinfo.mtime = mtime
+                    content_hash.update(f"{tarinfo.name}\0{tarinfo.type.decode()}\0{tarinfo.mode:o}\0".encode())
+                    if tarinfo.isreg():
+                        with open(path, "rb") as fp:
+                            content_hash.update(fp.read())
+                            fp.seek(0)
+                            tar.addfile(tarinfo, fp)
+                    else:
+                        tar.addfile(tarinfo)
+
+    data = buf.getvalue()
+    try:
+        with open(tarname, "rb") as fp:
+            if fp.read() == data:
+                return False, content_hash.hexdigest()
+    except OSError:
+        pass
+
+    with NamedTemporaryFile(dir=os.path.dirname(tarname), delete=False) as fp:
+        fp.write(data)
+    os.chmod(fp.name, 0o644)
+    os.replace(fp.name, tarname)
+    os.utime(tarname, (mtime, mtime))
+    return True, content_hash.hexdigest()
+
+
 class AppWoobRepos(ReplApplication):
     APPNAME = "repos"
     VERSION = "3.7"
@@ -50,6 +127,11 @@ class AppWoobRepos(ReplApplication):
     def load_default_backends(self):
         pass
 
+    def add_application_options(self, group):
+        group.add_option(
+            "--jobs", type="int", default=os.cpu_count(), help="number of archives to build and sign at the same time"
+        )
+
     def do_create(self, line):
         """
         create NAME [PATH]
@@ -81,6 +163,9 @@ def do_build(self, line):
 
         Build backends contained in SOURCE to REPOSITORY.
 
+        Archives are reproducible: they are only rewritten, and signed again,
+        when the content of a module changes.
+
         Example:
         $ woob repos build $HOME/src/woob/modules /var/www/updates.woob.tech/0.a/
         """
@@ -96,7 +181,7 @@ def do_build(self, line):
             print('Use the "create" command before.', file=self.stderr)
             return 1
 
-        r.build_index(source_path, index_file)
+        r.build_index(source_path, index_file, workers=self.options.jobs)
 
         if r.signed:
             sigfiles = [r.KEYRING, Repository.INDEX]
@@ -138,26 +223,32 @@ def do_build(self, line):
             else:
                 print("Keyring is up to date")
 
-        for name, module in r.modules.items():
-            tarname = os.path.join(repo_path, "%s.tar.gz" % name)
-            if r.signed:
-                sigfiles.append(os.path.basename(tarname))
-            module_path = os.path.join(source_path, name)
-            if os.path.exists(tarname):
-                tar_mtime = int(datetime.fromtimestamp(os.path.getmtime(tarname)).strftime("%Y%m%d%H%M"))
-                if tar_mtime >= module.version:
-                    continue
+        names = list(r.modules)
+        tarnames = [os.path.join(repo_path, "%s.tar.gz" % name) for name in names]
+        if r.signed:
+            sigfiles += [os.path.basename(tarname) for tarname in tarnames]
 
-            print("Create archive for %s" % name)
-            with closing(tarfile.open(tarname, "w:gz")) as tar:
-                tar.add(module_path, arcname=name, filter=self._archive_excludes)
-            tar_mtime = mktime(strptime(str(module.version), "%Y%m%d%H%M"))
-            os.utime(tarname, (tar_mtime, tar_mtime))
+        with ProcessPoolExecutor(max_workers=self.options.jobs) as executor:
+            changes = executor.map(
+                build_archive,
+                [os.path.join(source_path, name) for name in names],
+                names,
+                tarnames,
+                [mktime(strptime(str(r.modules[name].version), "%Y%m%d%H%M")) for name in names],
+            )
+            for name, (changed, content_hash) in zip(names, changes):
+                if changed:
+                    print("Created archive for %s" % name)
+                r.modules[name].content_hash = content_hash
 
-            # Copy icon.
-            icon_path = os.path.join(module_path, "favicon.png")
-            if os.path.exists(icon_path):
-                shutil.copy(icon_path, os.path.join(repo_path, "%s.png" % name))
+                # Copy icon.
+                icon_path = os.path.join(source_path, name, "favicon.png")
+                if os.path.exists(icon_path):
+                    shutil.copy(icon_path, os.path.join(repo_path, "%s.png" % name))
+
+        # Save content hashes, so clients don't download modules which only
+        # changed of version.
+        r.save(index_file)
 
         if r.signed:
             gpg = find_exe("gpg2") or find_exe("gpg")
@@ -201,6 +292,7 @@ def do_build(self, line):
                 raise Exception("No suitable secret key found")
 
             # Check if all files have an up to date signature
+            to_sign = []
             for filename in sigfiles:
                 filepath = os.path.realpath(os.path.join(repo_path, filename))
                 sigpath = filepath + ".sig"
@@ -211,29 +303,28 @@ def do_build(self, line):
                     print("Signing %s" % filename)
                     if os.path.exists(sigpath):
                         os.remove(sigpath)
-                    subprocess.check_call(
-                        [
-                            gpg,
-                            "--no-options",
-                            "--quiet",
-                            "--local-user",
-                            secret_fingerprint,
-                            "--detach-sign",
-                            "--output",
-                            sigpath,
-                            "--sign",
-                            filepath,
-                        ]
-                    )
-                    os.utime(sigpath, (file_mtime, file_mtime))
-            print("Signatures are up to date")
+                    to_sign.append((filepath, sigpath, file_mtime))
 
-    def _archive_excludes(self, tarinfo):
-        filename = tarinfo.name
-        # Skip *.pyc files in tarballs.
-        if filename.endswith(".pyc"):
-            return
-        # Don't include *.png files in tarball
-        if filename.endswith(".png"):
-            return
-        return tarinfo
+            def sign(filepath, sigpath, file_mtime):
+                subprocess.check_call(
+                    [
+                        gpg,
+                        "--no-options",
+                        "--quiet",
+                        "--local-user",
+                        secret_fingerprint,
+                        "--detach-sign",
+                        "--output",
+                        sigpath,
+                        "--sign",
+                        filepath,
+                    ]
+                )
+                os.utime(sigpath, (file_mtime, file_mtime))
+
+            # gpg can't create several detached signatures at once, so run
+            # it concurrently instead.
+            with ThreadPoolExecutor(max_workers=self.options.jobs) as executor:
+                for future in [executor.submit(sign, *args) for args in to_sign]:
+                    future.result()
+            print("Signatures are up to date")
@@ -27,14 +27,16 @@
 import tempfile
 import warnings
 import zlib
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future
+from concurrent.futures import wait as wait_futures
 from copy import copy, deepcopy
 from datetime import datetime, timedelta
 from functools import wraps
 from hashlib import sha256
 from logging import Logger
 from threading import Lock
-from typing import Any, Callable, ClassVar
+from typing import Any, Callable, ClassVar, Iterable, Iterator
 from urllib.parse import parse_qsl, urlencode, urljoin, urlparse
 from uuid import uuid4
 
@@ -52,8 +54,9 @@
 from .cookies import WoobCookieJar
 from .exceptions import ClientError, HTTPNotFound, ServerError
 from .har import HARManager
-from .pages import NextPage
+from .pages import NextPage, Page
 from .profiles import Firefox, Profile
+from .ratelimit import RateLimit, TokenBucket, get_token_bucket
 from .sessions import FuturesSession
 from .url import URL, normalize_url
 
@@ -118,6 +121,31 @@ class Browser:
     Maximum of threads for asynchronous requests.
     """
 
+    SHARE_EXECUTOR: ClassVar[bool] = False
+    """
+    Run asynchronous requests on the executor shared by all browsers of the
+    process, instead of a dedicated one.
+
+    In both cases, the executor is only created on the first asynchronous
+    request, and at most :attr:`MAX_WORKERS` requests of this browser are
+    processed at the same time.
+    """
+
+    RATE_LIMIT: ClassVar[RateLimit | None] = None
+    """
+    Maximum number of requests per second sent to each host, or a
+    ``(rate, burst)`` tuple.
+
+    Limits are shared by all browsers of the process sending requests to the
+    same host, and adapt to 429 and 503 responses and their ``Retry-After``
+    header. ``None`` disables rate limiting.
+    """
+
+    RATE_LIMITS: ClassVar[dict[str, RateLimit]] = {}
+    """
+    Per-host overrides of :attr:`RATE_LIMIT`, with hostnames as keys.
+    """
+
     ALLOW_REFERRER: ClassVar[bool] = True
     """
     Controls how we send the ``Referer`` or not.
@@ -371,6 +399,9 @@ def _create_session(self) -> requests.Session:
             max_workers=self.MAX_WORKERS,
             max_retries=self.MAX_RETRIES,
             adapter_class=self.HTTP_ADAPTER_CLASS,
+            share_executor=self.SHARE_EXECUTOR,
+            # adapters are mounted by _setup_session()
+            mount_adapters=False,
         )
 
     def _setup_session(self, profile: Profile):
@@ -454,6 +485,7 @@ def open(
         data_encoding: str | None = None,
         is_async: bool = False,
         callback: Callable[[requests.Response], requests.Response] | None = None,
+        rate_limiter: TokenBucket | None = None,
         **kwargs,
     ) -> requests.Response:
         """
@@ -522,6 +554,10 @@ def open(
                          with response as its first and only argument
         :type callback: callable
 
+        :param rate_limiter: (optional) Rate limiter to use instead of the one
+                             of the host, see :meth:`get_rate_limiter()`
+        :type rate_limiter: :class:`~woob.browser.ratelimit.TokenBucket`
+
         :return: :class:`requests.Response <Response>` object
         :rtype: :class:`requests.Response`
         """
@@ -538,7 +574,9 @@ def open(
             # The _cookies attribute is not present in requests < 2.2. As in
             # previous version it doesn't calls extract_cookies_to_jar(), it is
             # not a problem as we keep our own cookiejar instance.
-            preq._cookies = WoobCookieJar.from_cookiejar(preq._cookies)
+            if not isinstance(preq._cookies, WoobCookieJar) or preq._cookies is self.session.cookies:
+                # It is already a per-request copy when prepared by WoobSession.
+                preq._cookies = WoobCookieJar.from_cookiejar(preq._cookies)
             if self.COOKIE_POLICY:
                 preq._cookies.set_policy(self.COOKIE_POLICY)
 
@@ -553,9 +591,28 @@ def open(
         if callback is None:
             callback = lambda response: response
 
+        if rate_limiter is None:
+            rate_limiter = self.get_rate_limiter(preq.url)
+
+        send_kwargs = {}
+        if rate_limiter is not None:
+            # The session waits for the token, so that asynchronous requests
+            # do not block the caller.
+            send_kwargs["rate_limiter"] = rate_limiter
+
         # We define an inner_callback here in order to execute the same code
         # regardless of is_async param.
         def inner_callback(future, response):
+            if rate_limiter is not None:
+                delay = rate_limiter.update(response)
+                if delay is not None:
+                    self.logger.info(
+                        "Throttled by %s (HTTP %s), slowing down to %s",
+                        response.url,
+                        response.status_code,
+                        rate_limiter,
+                    )
+
             if allow_redirects:
                 response = self.handle_refresh(response)
 
@@ -574,6 +631,7 @@ def inner_callback(future, response):
                 proxies=proxies,
                 callback=inner_callback,
                 is_async=is_async,
+                **send_kwargs,
             )
         except Exception as error:
             # response in these kind of exception are already stored in HAR
@@ -611,6 +669,21 @@ def async_open(self, url: str, **kwargs) -> requests.Response:
             del kwargs["is_async"]
         return self.open(url, is_async=True, **kwargs)
 
+    def get_rate_limiter(self, url: str) -> TokenBucket | None:
+        """
+        Get the rate limiter to use for a request, according to
+        :attr:`RATE_LIMIT` and :attr:`RATE_LIMITS`.
+
+        :param url: absolute URL of the request
+        :return: the limiter shared for this host, or None if requests
+                 should not be limited
+        """
+        host = urlparse(url).hostname
+        rate_limit = self.RATE_LIMITS.get(host, self.RATE_LIMIT)
+        if rate_limit is None:
+            return None
+        return get_token_bucket(host, rate_limit)
+
     def raise_for_status(self, response: requests.Response):
         """
         Like :meth:`requests.Response.raise_for_status()` but will use other
@@ -958,6 +1031,7 @@ def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.page = None
+        self._prefetched: dict[tuple, tuple[Page | None, Future]] = {}
 
         # exclude properties because they can access other fields not yet defined
         def is_property(attr):
@@ -1051,6 +1125,9 @@ def location(self, *args, **kwargs) -> requests.Response:
         attribute ``page`` is added to response, and the attribute :attr:`page`
         is set on the browser.
         """
+        # Prefetched pages were announced by the page we are leaving.
+        self._cancel_prefetched()
+
         if self.page is not None:
             # Call leave hook.
             self.page.on_leave()
@@ -1068,6 +1145,149 @@ def location(self, *args, **kwargs) -> requests.Response:
         # Returns self.response in case on_load recalls location()
         return self.response
 
+    def _prefetch_key(self, request: str | requests.Request) -> tuple:
+        if isinstance(request, requests.Request):
+            return (
+                request.method,
+                self.absurl(request.url),
+                repr(request.params),
+                repr(request.data),
+                repr(request.json),
+            )
+        return (None, self.absurl(request))
+
+    def _cancel_prefetched(self) -> dict[tuple, tuple[Page | None, Future]]:
+        prefetched = self._prefetched
+        self._prefetched = {}
+        for _, future in prefetched.values():
+            future.cancel()
+        return prefetched
+
+    def prefetch(self, request: str | requests.Request, page: Page | None = None):
+        """
+        Start fetching a page which will be the next one, while the current
+        one is still being parsed.
+
+        The response is then used by :meth:`pagination()` and the
+        :func:`~woob.browser.pages.pagination` decorator when a
+        :class:`~woob.browser.pages.NextPage` exception is raised for the same
+        request, instead of sending it again.
+
+        It is usually called by :class:`~woob.browser.elements.ListElement`
+        when its ``prefetch_next_page`` attribute is set.
+
+        :param request: URL or :class:`requests.Request` of the next page
+        :param page: page announcing the next one (default: current page)
+        """
+        key = self._prefetch_key(request)
+        if key not in self._prefetched:
+            self._prefetched[key] = (page or self.page, self.open(request, is_async=True))
+
+    def location_next_page(self, request: str | requests.Request, page: Page | None = None) -> requests.Response:
+        """
+        Go on the next page of a pagination, using the response fetched by
+        :meth:`prefetch()` if any, or like :meth:`location()` otherwise.
+
+        A prefetched response is only used if it was announced by the same
+        page, so an abandoned pagination never feeds another one.
+
+        :param request: URL or :class:`requests.Request` of the next page
+        :param page: page raising the :class:`~woob.browser.pages.NextPage`
+                     exception (default: current page)
+        """
+        origin, future = self._prefetched.pop(self._prefetch_key(request), (None, None))
+        self._cancel_prefetched()
+
+        if future is None or origin is not (page or self.page):
+            if future is not None:
+                future.cancel()
+            return self.location(request)
+
+        if self.page is not None:
+            self.page.on_leave()
+
+        response = future.result()
+
+        self.response = response
+        self.page = response.page
+        self.url = response.url
+
+        if self.page is not None:
+            self.page.on_load()
+
+        return self.response
+
+    def open_many(
+        self,
+        urls: Iterable[str | requests.Request],
+        *,
+        concurrency: int | None = None,
+        ordered: bool = True,
+        **kwargs,
+    ) -> Iterator[requests.Response]:
+        """
+        Open several URLs concurrently, like :meth:`open()` with ``is_async=True``.
+
+        At most ``concurrency`` requests are in flight at the same time
+        (default is :attr:`MAX_WORKERS`), the next ones being sent as soon as a
+        response has been received, so they get cookies set by previous
+        responses. The referrer of every request is computed from the current
+        URL when this method is called, even if :meth:`location()` is called
+        while iterating.
+
+        As with :meth:`open()`, the responses have a ``page`` attribute if the
+        URL matches any :class:`~woob.browser.url.URL` object, and the current
+        page of the browser is not changed.
+
+        >>> for response in browser.open_many(urls, concurrency=4):  # doctest: +SKIP
+        ...     yield from response.page.iter_history()
+
+        :param urls: URLs or :class:`requests.Request` objects to open
+        :param concurrency: maximum number of concurrent requests
+        :param ordered: if ``True``, yield responses in the same order than
+                        ``urls``, otherwise as soon as they are completed
+        :param kwargs: other parameters passed to :meth:`open()`
+        :raises: the exception of the first failed request, once it is reached;
+                 other pending requests are then cancelled
+        """
+        if concurrency is None:
+            concurrency = self.MAX_WORKERS
+        if concurrency < 1:
+            raise ValueError("concurrency must be greater than 0")
+
+        kwargs.pop("is_async", None)
+        base_url = self.url
+        urls = iter(urls)
+        futures: deque[Future] = deque()
+
+        def submit_next():
+            for url in urls:
+                referrer = kwargs.get("referrer")
+                if referrer is None:
+                    url_string = url.url if isinstance(url, requests.Request) else url
+                    referrer = self.get_referrer(base_url, self.absurl(url_string, base=base_url))
+                futures.append(self.open(url, is_async=True, **{**kwargs, "referrer": referrer or False}))
+                return
+
+        try:
+            for _ in range(concurrency):
+                submit_next()
+
+            while futures:
+                if ordered:
+                    future = futures.popleft()
+                    future.result()
+                else:
+                    done, _ = wait_futures(futures, return_when=FIRST_COMPLETED)
+                    future = done.pop()
+                    futures.remove(future)
+
+                submit_next()
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
     def pagination(self, func: Callable, *args, **kwargs):
         r"""
         This helper function can be used to handle pagination pages easily.
@@ -1095,13 +1315,16 @@ def pagination(self, func: Callable, *args, **kwargs):
         >>> list(b.pagination(lambda: b.page.iter_values()))
         ['One', 'Two', 'Three', 'Four']
 
+        Next pages announced with :meth:`prefetch()` are fetched while the
+        current one is being processed.
+
         .. note: consider using :func:`~woob.browser.pages.pagination` decorator instead.
         """
         while True:
             try:
                 yield from func(*args, **kwargs)
             except NextPage as e:
-                self.location(e.request)
+                self.location_next_page(e.request, self.page)
             else:
                 return
 
@@ -1181,6 +1404,20 @@ class StatesMixin:
     In minutes, used to set an expiration datetime object of the state.
     """
 
+    COMPACT_STATE: ClassVar[bool] = True
+    """
+    Store cookies in a compact binary format, as bytes which the storage
+    handles natively.
+
+    If False, they are stored in the legacy format, a base64 string, for
+    storages which only support text. Both formats can be loaded.
+    """
+
+    STATE_COOKIES_VERSION: ClassVar[bytes] = b"\x02"
+    """
+    Version of the compact format of cookies, stored as its first byte.
+    """
+
     def locate_browser(self, state: dict):
         """
         From the ``state`` object, go on the saved url.
@@ -1190,7 +1427,11 @@ def locate_browser(self, state: dict):
         except (requests.exceptions.HTTPError, requests.exceptions.TooManyRedirects):
             pass
 
-    def _load_cookies(self, cookie_state: str):
+    def _load_cookies(self, cookie_state: str | bytes):
+        if isinstance(cookie_state, bytes):
+            self._load_compact_cookies(cookie_state)
+            return
+
         try:
             uncompressed = zlib.decompress(base64.b64decode(cookie_state))
         except (TypeError, zlib.error, EOFError, ValueError):
@@ -1206,6 +1447,38 @@ def _load_cookies(self, cookie_state: str):
                 self.session.cookies.set(**jcookie)
             self.logger.debug("Reloaded cookies from storage")
 
+    def _load_compact_cookies(self, cookie_state: bytes):
+        version, payload = cookie_state[:1], cookie_state[1:]
+        if version != self.STATE_COOKIES_VERSION:
+            self.logger.error("Unsupported version of cookies state: %r", version)
+            return
+
+        try:
+            rows = json.loads(zlib.decompress(payload))
+        except (zlib.error, ValueError):
+            self.logger.error("Unable to reload cookies from storage")
+            return
+
+        cookies = self.session.cookies
+        if isinstance(cookies, WoobCookieJar):
+            cookies.load_rows(rows)
+        else:
+            for row in rows:
+                cookies.set(**dict(zip(WoobCookieJar.COOKIE_FIELDS, row)))
+        self.logger.debug("Reloaded cookies from storage")
+
+    def _dump_cookies(self) -> str | bytes:
+        cookies = self.session.cookies
+        if not self.COMPACT_STATE:
+            jcookies = [{attr: getattr(cookie, attr) for attr in WoobCookieJar.COOKIE_FIELDS} for cookie in cookies]
+            return base64.b64encode(zlib.compress(json.dumps(jcookies).encode("utf-8"))).decode("ascii")
+
+        if isinstance(cookies, WoobCookieJar):
+            rows = cookies.dump_rows()
+        else:
+            rows = [[getattr(cookie, attr) for attr in WoobCookieJar.COOKIE_FIELDS] for cookie in cookies]
+        return self.STATE_COOKIES_VERSION + zlib.compress(json.dumps(rows, separators=(",", ":")).encode("utf-8"), 1)
+
     def load_state(self, state: dict):
         """
         Supply a ``state`` object and load it.
@@ -1250,11 +1523,7 @@ def dump_state(self) -> dict:
         if hasattr(self, "page") and self.page:
             state["url"] = self.page.url
 
-        cookies = [
-            {attr: getattr(cookie, attr) for attr in ("name", "value", "domain", "path", "secure", "expires")}
-            for cookie in self.session.cookies
-        ]
-        state["cookies"] = base64.b64encode(zlib.compress(json.dumps(cookies).encode("utf-8"))).decode("ascii")
+        state["cookies"] = self._dump_cookies()
         for attrname in self.__states__:
             try:
                 state[attrname] = getattr(self, attrname)
@@ -16,6 +16,7 @@
 # along with woob. If not, see <http://www.gnu.org/licenses/>.
 
 import http.cookiejar
+from copy import copy
 
 import requests.cookies
 
@@ -48,6 +49,74 @@ def copy(self):
         new_cj.update(self)
         return new_cj
 
+    COOKIE_FIELDS = ("name", "value", "domain", "path", "secure", "expires")
+    """
+    Attributes of cookies kept by :meth:`dump_rows`, in this order.
+    """
+
+    def dump_rows(self):
+        """
+        Dump cookies as a list of rows, with the values of
+        :attr:`COOKIE_FIELDS`.
+
+        :rtype: list[list]
+        """
+        with self._cookies_lock:
+            return [
+                [cookie.name, cookie.value, cookie.domain, cookie.path, cookie.secure, cookie.expires]
+                for cookies_by_path in self._cookies.values()
+                for cookies_by_name in cookies_by_path.values()
+                for cookie in cookies_by_name.values()
+            ]
+
+    def load_rows(self, rows):
+        """
+        Set cookies from rows made by :meth:`dump_rows`.
+
+        Contrary to setting cookies one by one, the jar is only locked once.
+
+        :param rows: cookie rows
+        :type rows: iterable[list]
+        """
+        cookies = []
+        for name, value, domain, path, secure, expires in rows:
+            cookies.append(
+                requests.cookies.create_cookie(name, value, domain=domain, path=path, secure=secure, expires=expires)
+            )
+
+        with self._cookies_lock:
+            for cookie in cookies:
+                self._cookies.setdefault(cookie.domain, {}).setdefault(cookie.path, {})[cookie.name] = cookie
+
+    def for_request(self, request):
+        """
+        Return a copy of the jar restricted to cookies which may be sent with
+        a request.
+
+        Only domains and paths accepted by the policy for this request are
+        walked, so the cost depends on the number of matching cookies and not
+        on the size of the jar. The policy is kept, so the copy can still
+        receive cookies when following redirects.
+
+        :param request: the request to send
+        :type request: :class:`requests.Request` or :class:`requests.PreparedRequest`
+        """
+        new_cj = type(self)()
+        policy = self.get_policy()
+        new_cj.set_policy(policy)
+
+        mock_request = requests.cookies.MockRequest(request)
+        with self._cookies_lock:
+            for domain, cookies_by_path in self._cookies.items():
+                if not policy.domain_return_ok(domain, mock_request):
+                    continue
+                for path, cookies_by_name in cookies_by_path.items():
+                    if not policy.path_return_ok(path, mock_request):
+                        continue
+                    for cookie in cookies_by_name.values():
+                        new_cj.set_cookie(copy(cookie))
+        return new_cj
+
 
 WeboobCookieJar = WoobCookieJar
 
@@ -228,6 +228,12 @@ class ListElement(AbstractElement):
     empty_xpath = None
     flush_at_end = False
     ignore_duplicate = False
+    prefetch_next_page = False
+    """
+    Start fetching the next page before parsing items of the current one,
+    when paginating. It requires the ``next_page`` selector to only depend on
+    the document.
+    """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -261,6 +267,11 @@ def __iter__(self):
 
         self.parse(self.el)
 
+        if self.prefetch_next_page:
+            next_page = self.get_next_page()
+            if next_page is not None:
+                self.page.browser.prefetch(next_page, self.page)
+
         items = []
         for el in self.find_elements():
             for attrname in dir(self):
@@ -288,12 +299,14 @@ def __iter__(self):
     def flush(self):
         yield from self.objects.values()
 
-    def check_next_page(self):
+    def get_next_page(self):
         try:
-            value = self.use_selector(self.next_page)
+            return self.use_selector(self.next_page)
         except (AttributeError, AttributeNotFound, XPathNotFound):
-            return
+            return None
 
+    def check_next_page(self):
+        value = self.get_next_page()
         if value is None:
             return
 
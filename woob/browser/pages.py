@@ -56,6 +56,11 @@ def pagination(func: Callable):
 
     :class:`NextPage` constructor can take an url or a Request object.
 
+    If the next page has been announced with
+    :meth:`~woob.browser.browsers.PagesBrowser.prefetch`, for example by a
+    :class:`~woob.browser.elements.ListElement` with ``prefetch_next_page``
+    set, it is fetched while the current page is processed.
+
     >>> class Page(HTMLPage):
     ...     @pagination
     ...     def iter_values(self):
@@ -86,7 +91,7 @@ def inner(page: Page, *args, **kwargs):
                 if isinstance(e.request, Page):
                     page = e.request
                 else:
-                    result = page.browser.location(e.request)
+                    result = page.browser.location_next_page(e.request, page)
                     page = result.page
             else:
                 return
@@ -0,0 +1,212 @@
+# Copyright(C) 2026 woob project
+#
+# This file is part of woob.
+#
+# woob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# woob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with woob. If not, see <http://www.gnu.org/licenses/>.
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from time import monotonic, sleep
+from typing import Hashable, Tuple, Union
+
+import requests
+
+
+__all__ = ["RateLimit", "TokenBucket", "get_token_bucket", "parse_retry_after"]
+
+
+RateLimit = Union[float, Tuple[float, int]]
+"""
+A rate limit, either a number of requests per second, or a tuple
+``(requests per second, burst)``.
+"""
+
+THROTTLING_STATUS_CODES = (429, 503)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse the value of a ``Retry-After`` header.
+
+    :param value: number of seconds, or HTTP date
+    :return: number of seconds to wait, or None if it can't be parsed
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+
+    Each request takes one token, and tokens are refilled at `rate` per
+    second, up to `burst`. It adapts to the server: the rate is halved each
+    time it replies with a throttling status code (429 or 503), and then
+    slowly goes back to the configured rate on successful responses.
+
+    :param rate: maximum number of requests per second
+    :param burst: number of requests which can be sent at once
+    """
+
+    MIN_RATE_DIVISOR = 16
+    """
+    The rate is never decreased below the configured rate divided by this.
+    """
+
+    RECOVERY_STEPS = 10
+    """
+    Number of successful responses needed to go back to the configured rate
+    after a throttling response.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if burst < 1:
+            raise ValueError("burst must be greater than 0")
+
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.waits = 0
+        self.throttled = 0
+        self._next = 0.0
+        self._lock = Lock()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} rate={self.rate:g}/{self.max_rate:g} burst={self.burst}>"
+
+    def configure(self, rate: float, burst: int = 1):
+        """
+        Restrict the configuration of this bucket, as it may be shared
+        between browsers asking for different limits.
+        """
+        with self._lock:
+            self.max_rate = min(self.max_rate, rate)
+            self.rate = min(self.rate, self.max_rate)
+            self.burst = min(self.burst, burst)
+
+    def reserve(self) -> float:
+        """
+        Take a token.
+
+        :return: the number of seconds to wait before using it
+        """
+        with self._lock:
+            now = monotonic()
+            interval = 1 / self.rate
+            start = max(self._next, now - (self.burst - 1) * interval)
+            self._next = start + interval
+
+            delay = max(0.0, start - now)
+            if delay:
+                self.waits += 1
+            return delay
+
+    def acquire(self) -> float:
+        """
+        Wait until a token is available, and take it.
+
+        :return: the number of seconds waited
+        """
+        delay = self.reserve()
+        if delay:
+            sleep(delay)
+        return delay
+
+    def backoff(self, delay: float | None = None):
+        """
+        Slow down after the server asked for it.
+
+        :param delay: seconds to wait before the next request, usually from a
+                      ``Retry-After`` header
+        """
+        with self._lock:
+            self.throttled += 1
+            self.rate = max(self.max_rate / self.MIN_RATE_DIVISOR, self.rate / 2)
+            if delay:
+                self._next = max(self._next, monotonic() + delay)
+
+    def recover(self):
+        """
+        Get closer to the configured rate after a successful response.
+        """
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / self.RECOVERY_STEPS)
+
+    def update(self, response: requests.Response) -> float | None:
+        """
+        Adapt the rate to a response.
+
+        :return: the delay requested by the server, if it throttled the request
+        """
+        if response.status_code not in THROTTLING_STATUS_CODES:
+            self.recover()
+            return None
+
+        delay = parse_retry_after(response.headers.get("Retry-After"))
+        if response.status_code == 503 and delay is None:
+            # A 503 without Retry-After is more likely to be an outage than
+            # throttling.
+            self.recover()
+            return None
+
+        self.backoff(delay)
+        return delay or 0.0
+
+
+_buckets: dict[Hashable, TokenBucket] = {}
+_buckets_lock = Lock()
+
+
+def get_token_bucket(key: Hashable, rate_limit: RateLimit) -> TokenBucket:
+    """
+    Get the bucket shared in the process by everything using `key`,
+    creating it if needed.
+
+    If the bucket already exists with a different limit, the most
+    restrictive one is used.
+
+    :param key: identifier of the bucket, usually a hostname
+    :param rate_limit: limit to apply
+    """
+    if isinstance(rate_limit, tuple):
+        rate, burst = rate_limit
+    else:
+        rate, burst = rate_limit, 1
+
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = _buckets[key] = TokenBucket(rate, burst)
+        elif bucket.max_rate != rate or bucket.burst != burst:
+            bucket.configure(rate, burst)
+        return bucket
@@ -16,11 +16,14 @@
 # along with woob. If not, see <http://www.gnu.org/licenses/>.
 
 try:
-    from concurrent.futures import ThreadPoolExecutor
+    from concurrent.futures import Future, ThreadPoolExecutor
+    from concurrent.futures import wait as wait_futures
 except ImportError:
     ThreadPoolExecutor = None
 
+from collections import deque
 from http import cookiejar
+from threading import Lock
 
 from requests import Session
 from requests.adapters import DEFAULT_POOLSIZE
@@ -31,6 +34,7 @@
 from requests.utils import get_netrc_auth
 
 from .adapters import HTTPAdapter
+from .cookies import WoobCookieJar
 
 
 def merge_hooks(request_hooks, session_hooks):
@@ -73,8 +77,12 @@ def prepare_request(self, request):
             cookies = cookiejar_from_dict(cookies)
 
         # Merge with session cookies
-        merged_cookies = RequestsCookieJar()
-        merged_cookies.update(self.cookies)
+        if isinstance(self.cookies, WoobCookieJar):
+            # Only copy session cookies which may be sent to this URL.
+            merged_cookies = self.cookies.for_request(request)
+        else:
+            merged_cookies = RequestsCookieJar()
+            merged_cookies.update(self.cookies)
         merged_cookies.update(cookies)
 
         # Set environment's basic authentication if not explicitly set.
@@ -101,8 +109,119 @@ def prepare_request(self, request):
 WeboobSession = WoobSession
 
 
+SHARED_EXECUTOR_MAX_WORKERS = 32
+"""
+Number of threads of the process-wide executor returned by :func:`get_shared_executor`.
+"""
+
+_shared_executor = None
+_shared_executor_lock = Lock()
+
+
+def get_shared_executor():
+    """
+    Get the executor shared by every :class:`FuturesSession` created with
+    ``share_executor=True``.
+
+    It is created on first call, with :data:`SHARED_EXECUTOR_MAX_WORKERS` threads.
+    """
+    global _shared_executor
+
+    with _shared_executor_lock:
+        if _shared_executor is None and ThreadPoolExecutor is not None:
+            _shared_executor = ThreadPoolExecutor(
+                max_workers=SHARED_EXECUTOR_MAX_WORKERS,
+                thread_name_prefix="woob-shared",
+            )
+        return _shared_executor
+
+
+class BoundedExecutor:
+    """
+    Submit jobs to an existing executor, running at most `max_workers` of them
+    at the same time.
+
+    Jobs above the limit are queued and only submitted to the underlying
+    executor when a slot is released, so they never block its threads.
+
+    :meth:`shutdown` waits for jobs submitted through this object, but doesn't
+    stop the underlying executor, which may be used by others.
+    """
+
+    def __init__(self, executor, max_workers):
+        self.executor = executor
+        self.max_workers = max_workers
+        self._lock = Lock()
+        self._queue = deque()
+        self._running = 0
+        self._futures = set()
+        self._shutdown = False
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._futures.add(future)
+            self._queue.append((future, fn, args, kwargs))
+        future.add_done_callback(self._forget)
+        self._dispatch()
+        return future
+
+    def _forget(self, future):
+        with self._lock:
+            self._futures.discard(future)
+
+    def _dispatch(self):
+        while True:
+            with self._lock:
+                if self._running >= self.max_workers or not self._queue:
+                    return
+                future, fn, args, kwargs = self._queue.popleft()
+                if not future.set_running_or_notify_cancel():
+                    # cancelled while it was queued
+                    continue
+                self._running += 1
+
+            self.executor.submit(self._run, future, fn, args, kwargs)
+
+    def _run(self, future, fn, args, kwargs):
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                self._running -= 1
+            self._dispatch()
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                for future, _, _, _ in self._queue:
+                    future.cancel()
+                self._queue.clear()
+            futures = list(self._futures)
+
+        if wait:
+            wait_futures(futures)
+
+
 class FuturesSession(WoobSession):
-    def __init__(self, executor=None, max_workers=2, max_retries=2, adapter_class=HTTPAdapter, *args, **kwargs):
+    def __init__(
+        self,
+        executor=None,
+        max_workers=2,
+        max_retries=2,
+        adapter_class=HTTPAdapter,
+        *args,
+        share_executor=False,
+        mount_adapters=True,
+        **kwargs,
+    ):
         """Creates a FuturesSession
 
         Notes
@@ -113,17 +232,50 @@ def __init__(self, executor=None, max_workers=2, max_retries=2, adapter_class=HT
 
         * If you provide both `executor` and `max_workers`, the latter is
           ignored and provided executor is used as is.
+
+        * When no `executor` is provided, it is only created on the first
+          asynchronous request. With `share_executor`, the process-wide
+          executor returned by :func:`get_shared_executor` is used, and this
+          session never runs more than `max_workers` requests at a time on it.
+
+        * `mount_adapters` can be disabled when the caller mounts its own
+          adapters, as :class:`woob.browser.browsers.Browser` does.
         """
         super().__init__(*args, **kwargs)
-        if executor is None and ThreadPoolExecutor is not None:
-            executor = ThreadPoolExecutor(max_workers=max_workers)
-            # set connection pool size equal to max_workers if needed
-            if max_workers > DEFAULT_POOLSIZE:
-                adapter_kwargs = dict(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=max_retries)
-                self.mount("https://", adapter_class(**adapter_kwargs))
-                self.mount("http://", adapter_class(**adapter_kwargs))
+        self.max_workers = max_workers
+        self.share_executor = share_executor
+        self._executor = executor
+        self._executor_lock = Lock()
+
+        # set connection pool size equal to max_workers if needed
+        if executor is None and mount_adapters and max_workers > DEFAULT_POOLSIZE:
+            adapter_kwargs = dict(pool_connections=max_workers, pool_maxsize=max_workers, max_retries=max_retries)
+            self.mount("https://", adapter_class(**adapter_kwargs))
+            self.mount("http://", adapter_class(**adapter_kwargs))
+
+    @property
+    def executor(self):
+        """
+        Executor used to process asynchronous requests, created on first access.
+        """
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = self._create_executor()
+        return self._executor
 
-        self.executor = executor
+    @executor.setter
+    def executor(self, executor):
+        self._executor = executor
+
+    def _create_executor(self):
+        if ThreadPoolExecutor is None:
+            return None
+
+        if self.share_executor:
+            return BoundedExecutor(get_shared_executor(), self.max_workers)
+
+        return ThreadPoolExecutor(max_workers=self.max_workers)
 
     def send(self, *args, **kwargs):
         """Maintains the existing api for :meth:`Session.send`
@@ -135,6 +287,9 @@ def send(self, *args, **kwargs):
 
         In all cases, it will call the `callback` parameter and return its
         result when the request has been processed.
+
+        If a `rate_limiter` is given, it waits for a token of it before
+        sending the request, in the thread processing it.
         """
         if "async" in kwargs:
             import warnings
@@ -147,8 +302,11 @@ def send(self, *args, **kwargs):
 
         callback = kwargs.pop("callback", lambda future, response: response)
         is_async = kwargs.pop("is_async", False)
+        rate_limiter = kwargs.pop("rate_limiter", None)
 
         def func(*args, **kwargs):
+            if rate_limiter is not None:
+                rate_limiter.acquire()
             resp = sup(*args, **kwargs)
             return callback(self, resp)
 
@@ -161,5 +319,7 @@ def func(*args, **kwargs):
 
     def close(self):
         super().close()
-        if self.executor:
-            self.executor.shutdown()
+        # Do not use the property here, we don't want to create an executor
+        # only to shut it down.
+        if self._executor:
+            self._executor.shutdown()
@@ -26,6 +26,7 @@
 
 from woob.browser.filters.base import _Filter
 from woob.browser.pages import Page
+from woob.browser.ratelimit import RateLimit, TokenBucket, get_token_bucket
 from woob.tools.regex_helper import normalize
 
 
@@ -61,6 +62,9 @@ class which is instancied by PagesBrowser.open if the page matches a regex.
     :param timeout: Timeout to use for this URL in particular.
     :param methods: Request HTTP methods to match the response.
     :param content_type: MIME type of the content to match the response with.
+    :param rate_limit: Requests per second, or ``(rate, burst)`` tuple, allowed
+                       for this URL, instead of the browser's
+                       :attr:`~woob.browser.browsers.Browser.RATE_LIMIT`.
     """
 
     _creation_counter = 0
@@ -73,6 +77,7 @@ def __init__(
         timeout: float | None = None,
         methods: tuple[str, ...] = (),
         content_type: str | None = None,
+        rate_limit: RateLimit | None = None,
     ):
         if content_type is not None and ";" in content_type:
             raise ValueError(
@@ -94,6 +99,7 @@ def __init__(
         self._timeout = timeout
         self._methods = tuple(methods)
         self._content_type = content_type
+        self._rate_limit = rate_limit
         self._creation_counter = URL._creation_counter
         URL._creation_counter += 1
 
@@ -198,6 +204,7 @@ def go(
             method=method,
             headers=headers,
             timeout=timeout,
+            **self._rate_limiter_kwargs(),
         )
         return r.page or r
 
@@ -240,12 +247,32 @@ def open(
             headers=headers,
             is_async=is_async,
             callback=callback,
+            **self._rate_limiter_kwargs(),
         )
 
         if hasattr(r, "page") and r.page:
             return r.page
         return r
 
+    def get_rate_limiter(self) -> TokenBucket | None:
+        """
+        Get the rate limiter of this URL, shared with the same URL of other
+        browsers, or None if it has no ``rate_limit``.
+        """
+        if self._rate_limit is None:
+            return None
+
+        base = getattr(self.browser, self._base, None)
+        return get_token_bucket(("url", base, *self.urls), self._rate_limit)
+
+    def _rate_limiter_kwargs(self) -> dict:
+        # Only pass the parameter when needed, as browsers may override
+        # open() with a restricted signature.
+        rate_limiter = self.get_rate_limiter()
+        if rate_limiter is None:
+            return {}
+        return {"rate_limiter": rate_limiter}
+
     def get_base_url(self, browser: Browser | None = None, for_pattern: str | None = None) -> str:
         """
         Get the browser's base URL for the instance.
@@ -25,6 +25,7 @@
 from configparser import DuplicateSectionError, RawConfigParser
 from logging import warning
 from subprocess import CalledProcessError, check_output
+from threading import Lock
 
 
 __all__ = ["BackendsConfig", "BackendAlreadyExists"]
@@ -73,6 +74,9 @@ class BackendsConfig:
     A backend is an instance of a module with a config.
     A module can therefore have multiple backend instances.
 
+    The file is parsed once, and parsed again only when its modification
+    time or size change. Backends are indexed by name and by module.
+
     :param confpath: path to the backends config file
     """
 
@@ -83,6 +87,12 @@ class WrongPermissions(Exception):
 
     def __init__(self, confpath: str) -> None:
         self.confpath = confpath
+        self._lock = Lock()
+        self._config: RawConfigParser | None = None
+        self._config_key: tuple[int, int, int] | None = None
+        self._backends: dict[str, tuple[str | None, dict[str, str]]] = {}
+        self._modules: dict[str, list[str]] = {}
+        self._positions: dict[str, int] = {}
         try:
             mode = os.stat(confpath).st_mode
         except OSError:
@@ -113,36 +123,85 @@ def _read_config(self) -> RawConfigParser:
         return config
 
     def _write_config(self, config: RawConfigParser) -> None:
-        f = codecs.open(self.confpath, "wb", encoding="utf-8")
-        with f:
-            config.write(f)
+        with self._lock:
+            try:
+                f = codecs.open(self.confpath, "wb", encoding="utf-8")
+                with f:
+                    config.write(f)
+            except BaseException:
+                self._config = self._config_key = None
+                raise
+            self._set_cache(config)
+
+    def _get_config_key(self) -> tuple[int, int, int]:
+        st = os.stat(self.confpath)
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _set_cache(self, config: RawConfigParser) -> None:
+        self._config = config
+        self._config_key = self._get_config_key()
+
+        self._backends = {}
+        self._modules = {}
+        self._positions = {}
+        for position, backend_name in enumerate(config.sections()):
+            self._positions[backend_name] = position
+            params = dict(config.items(backend_name))
+            module_name = params.pop("_module", None)
+            self._backends[backend_name] = (module_name, params)
+            if module_name is not None:
+                self._modules.setdefault(module_name, []).append(backend_name)
+
+    def _load(self) -> None:
+        """
+        Parse the config file, unless it has not changed since it was last
+        parsed.
+        """
+        with self._lock:
+            if self._config is None or self._config_key != self._get_config_key():
+                self._set_cache(self._read_config())
 
-    def iter_backends(self) -> Iterator[tuple[str, str, DictWithCommands]]:
+    def iter_backends(
+        self, names: Iterable[str] | None = None, modules: Iterable[str] | None = None
+    ) -> Iterator[tuple[str, str, DictWithCommands]]:
         """
         Iter on all saved backends.
 
         An item is a tuple with backend name, module name, and params dict.
+        Backends are in the order of the config file.
+
+        :param names: only iter on backends with these names
+        :param modules: only iter on backends of these modules
         """
-        config = self._read_config()
-        changed = False
-        for backend_name in config.sections():
-            params = DictWithCommands(config.items(backend_name))
-            try:
-                module_name = params.pop("_module")
-            except KeyError:
+        self._load()
+        backends = self._backends
+        if modules is not None:
+            selected = {name for module_name in modules for name in self._modules.get(module_name, ())}
+            if names is not None:
+                selected.intersection_update(names)
+        elif names is not None:
+            selected = {name for name in names if name in backends}
+        else:
+            selected = None
+
+        if selected is None:
+            backend_names = list(backends)
+        else:
+            backend_names = sorted(selected, key=self._positions.__getitem__)
+
+        for backend_name in backend_names:
+            module_name, params = backends[backend_name]
+            if module_name is None:
                 warning('Missing field "_module" for configured backend "%s"', backend_name)
                 continue
-            yield backend_name, module_name, params
-
-        if changed:
-            self._write_config(config)
+            yield backend_name, module_name, DictWithCommands(params)
 
     def backend_exists(self, name: str) -> bool:
         """
         Return True if the backend exists in config.
         """
-        config = self._read_config()
-        return name in config.sections()
+        self._load()
+        return name in self._backends
 
     def add_backend(self, backend_name: str, module_name: str, params: dict[str, str]) -> None:
         """
@@ -188,21 +247,18 @@ def get_backend(self, backend_name: str) -> tuple[str, dict[str, str]]:
 
         :returns: a tuple with the module name and the backends params
         """
-
-        config = self._read_config()
-        if not config.has_section(backend_name):
-            raise KeyError(f'Configured backend "{backend_name}" not found')
-
-        # XXX why not a DictWithCommands?
-        items = dict(config.items(backend_name))
-
+        self._load()
         try:
-            module_name = items.pop("_module")
+            module_name, params = self._backends[backend_name]
         except KeyError:
+            raise KeyError(f'Configured backend "{backend_name}" not found')
+
+        if module_name is None:
             warning('Missing field "_module" for configured backend "%s"', backend_name)
             raise KeyError(f'Configured backend "{backend_name}" not found')
 
-        return module_name, items
+        # XXX why not a DictWithCommands?
+        return module_name, dict(params)
 
     def remove_backend(self, backend_name: str) -> bool:
         """
@@ -0,0 +1,233 @@
+# Copyright(C) 2026 woob project
+#
+# This file is part of woob.
+#
+# woob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# woob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with woob. If not, see <http://www.gnu.org/licenses/>.
+
+# flake8: compatible
+
+from __future__ import annotations
+
+import types
+from collections import OrderedDict
+from collections.abc import Mapping
+from threading import Lock, RLock
+from typing import TYPE_CHECKING, Any
+
+from woob.capabilities.base import Capability
+from woob.tools.log import getLogger
+
+
+if TYPE_CHECKING:
+    from woob.core.modules import LoadedModule, ModuleMetadata
+    from woob.core.woob import WoobBase
+    from woob.tools.backend import Module
+    from woob.tools.storage import IStorage
+
+
+__all__ = ["BackendsLRU", "LazyBackend"]
+
+
+class LazyBackend:
+    """
+    Lightweight proxy of a backend.
+
+    The backend itself, with its config, storage and browser, is only created
+    the first time one of its attributes is used, and its module is only
+    imported at this time. ``NAME`` and :meth:`has_caps` are answered from
+    the metadata of the module, and other class attributes of the module
+    (like ``DESCRIPTION``) are available without creating the backend.
+
+    As the module is only loaded and the config only validated when the
+    backend is created, a :class:`woob.exceptions.ModuleLoadError` or a
+    :class:`woob.tools.backend.Module.ConfigError` can be raised on first use.
+
+    :param woob: woob instance
+    :param metadata: metadata of the module of the backend
+    :param name: name of the backend
+    :param params: config of the backend
+    :param storage: storage to give to the backend
+    :param lru: if set, keep track of the backend in this LRU
+    """
+
+    def __init__(
+        self,
+        woob: WoobBase,
+        metadata: ModuleMetadata,
+        name: str,
+        params: Mapping[str, Any] | None,
+        storage: IStorage | None,
+        lru: BackendsLRU | None = None,
+    ) -> None:
+        self.name = name
+        self.lock = RLock()
+        self._woob = woob
+        self._metadata = metadata
+        self._params = params
+        self._storage = storage
+        self._lru = lru
+        self._instance: Module | None = None
+        self._instance_lock = Lock()
+        self._busy = 0
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<Backend {self.name} ({state})>"
+
+    def __enter__(self) -> None:
+        self.lock.acquire()
+        self._busy += 1
+
+    def __exit__(self, t: type[BaseException], v: BaseException, tb: types.TracebackType) -> None:
+        self._busy -= 1
+        self.lock.release()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        if self._instance is None and name.isupper():
+            # Class attributes don't need the backend.
+            try:
+                return getattr(self._load_module().klass, name)
+            except AttributeError:
+                pass
+
+        return getattr(self.materialize(), name)
+
+    @property
+    def NAME(self) -> str:
+        return self._metadata.name
+
+    @property
+    def is_loaded(self) -> bool:
+        """
+        True if the backend has been created.
+        """
+        return self._instance is not None
+
+    def has_caps(self, *caps: str | type[Capability]) -> bool:
+        """
+        Check if this backend implements at least one of these capabilities.
+        """
+        return self._metadata.has_caps(*caps)
+
+    def _load_module(self) -> LoadedModule:
+        return self._woob.modules_loader.get_or_load_module(self._metadata.name)
+
+    def materialize(self) -> Module:
+        """
+        Get the backend, creating it if needed.
+        """
+        instance = self._instance
+        if instance is None:
+            with self._instance_lock:
+                if self._instance is None:
+                    module = self._load_module()
+                    self._instance = module.create_instance(self._woob, self.name, self._params, self._storage)
+                instance = self._instance
+
+        if self._lru is not None:
+            self._lru.touch(self)
+        return instance
+
+    def deinit(self) -> None:
+        """
+        Unload the backend, which dumps its state.
+
+        It will be created again if it is used later.
+        """
+        if self._lru is not None:
+            self._lru.discard(self)
+
+        with self._instance_lock:
+            instance, self._instance = self._instance, None
+
+        if instance is not None:
+            instance.deinit()
+
+
+class BackendsLRU:
+    """
+    Keep at most `maxsize` lazy backends loaded.
+
+    When there are too many of them, the least recently used ones are
+    unloaded. Backends which are locked are in use, and are never unloaded.
+
+    :param maxsize: maximum number of loaded backends, no limit if None
+    """
+
+    def __init__(self, maxsize: int | None = None) -> None:
+        self.logger = getLogger("woob.backends_lru")
+        self.maxsize = maxsize
+        self._backends: OrderedDict[LazyBackend, None] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._backends)
+
+    def __contains__(self, backend: LazyBackend) -> bool:
+        return backend in self._backends
+
+    def touch(self, backend: LazyBackend) -> None:
+        """
+        Mark a backend as used, and unload idle backends if there are too
+        many of them.
+        """
+        with self._lock:
+            self._backends[backend] = None
+            self._backends.move_to_end(backend)
+            victims = self._pop_victims()
+
+        # Unloading may be slow, as it dumps the state, so it is done without
+        # holding the lock.
+        for victim in victims:
+            self.logger.debug("Unloading idle backend %s", victim.name)
+            try:
+                victim.deinit()
+            finally:
+                victim._busy -= 1
+                victim.lock.release()
+
+    def discard(self, backend: LazyBackend) -> None:
+        """
+        Forget a backend.
+        """
+        with self._lock:
+            self._backends.pop(backend, None)
+
+    def _pop_victims(self) -> list[LazyBackend]:
+        if self.maxsize is None:
+            return []
+
+        victims = []
+        excess = len(self._backends) - self.maxsize
+        # The last backend is the one which has just been used.
+        for backend in list(self._backends)[:-1]:
+            if excess <= 0:
+                break
+
+            if not backend.lock.acquire(blocking=False):
+                continue
+            if backend._busy:
+                # Locked by the current thread.
+                backend.lock.release()
+                continue
+
+            # Lock it until it is unloaded, so it isn't used meanwhile.
+            backend._busy += 1
+            del self._backends[backend]
+            victims.append(backend)
+            excess -= 1
+        return victims
@@ -17,17 +17,20 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib
 import importlib.util
 import logging
+import os
 import pkgutil
 import sys
 import warnings
-from collections.abc import Iterator, Mapping
-from importlib import metadata
+from collections.abc import Iterable, Iterator, Mapping
 from importlib.machinery import ModuleSpec
 from inspect import getmodule
 from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, cast
 
@@ -37,8 +40,9 @@
 from woob.capabilities.base import Capability
 from woob.exceptions import ModuleLoadError
 from woob.tools.backend import BackendConfig, Module
+from woob.tools.json import json
 from woob.tools.log import getLogger
-from woob.tools.packaging import parse_requirements
+from woob.tools.packaging import cached_parse_requirements, get_installed_version, parse_requirements
 from woob.tools.storage import IStorage
 
 
@@ -46,16 +50,20 @@
     from woob.core import Woob
     from woob.core.repositories import Repositories
 
-__all__ = ["LoadedModule", "ModulesLoader", "RepositoryModulesLoader"]
+__all__ = ["LoadedModule", "ModuleMetadata", "ModulesLoader", "ModulesMetadataIndex", "RepositoryModulesLoader"]
 
 
 class LoadedModule:
     klass: type[Module]
 
-    def __init__(self, package: ModuleType) -> None:
+    def __init__(self, package: ModuleType, klass: type[Module] | None = None) -> None:
         self.logger = getLogger("woob.backend")
         self.package = package
-        klass: type[Module] | None = None
+
+        if klass is not None:
+            # Already known, for example from ModuleMetadata.
+            self.klass = klass
+            return
 
         full_name = package.__name__
         for attrname in dir(self.package):
@@ -178,6 +186,230 @@ def create_instance(
         return backend_instance
 
 
+def get_tree_fingerprint(path: str | Path) -> str:
+    """
+    Get a fingerprint of a module file or directory, which changes when any
+    of its files is modified, added, removed or renamed.
+
+    It is based on the path, modification time and size of each file.
+
+    :param path: path of the module
+    """
+    h = hashlib.sha1()
+    if not os.path.isdir(path):
+        st = os.stat(path)
+        h.update(f"{st.st_mtime_ns}:{st.st_size}".encode())
+        return h.hexdigest()
+
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+        for filename in sorted(files):
+            if filename.endswith(".pyc"):
+                continue
+            filepath = os.path.join(root, filename)
+            st = os.stat(filepath)
+            h.update(f"{os.path.relpath(filepath, path)}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+    return h.hexdigest()
+
+
+class ModuleMetadata:
+    """
+    Information about a module which can be used without importing it.
+
+    It is cached by :class:`ModulesMetadataIndex`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fingerprint: str,
+        klass: str,
+        capabilities: Iterable[str] = (),
+        dependencies: Iterable[str] = (),
+        description: str = "",
+        maintainer: str = "",
+        license: str = "",
+        icon: str = "",
+        config: Mapping[str, Mapping[str, Any]] | None = None,
+        requirements: Mapping[str, str] | None = None,
+    ) -> None:
+        self.name = name
+        self.fingerprint = fingerprint
+        #: path of the Module class, as "python.module:ClassName"
+        self.klass = klass
+        self.capabilities = list(capabilities)
+        self.dependencies = list(dependencies)
+        self.description = description
+        self.maintainer = maintainer
+        self.license = license
+        self.icon = icon
+        #: config keys, with their label, and whether they are masked or required
+        self.config = dict(config or {})
+        #: python requirements, as specifier strings
+        self.requirements = dict(requirements or {})
+
+    def __repr__(self) -> str:
+        return f"<ModuleMetadata {self.name}>"
+
+    @classmethod
+    def from_loaded_module(cls, module: LoadedModule, fingerprint: str) -> ModuleMetadata:
+        requirements: dict[str, str] = {}
+        if module.path is not None:
+            module_path = Path(module.path)
+            if not module_path.is_dir():
+                module_path = module_path.parent
+            requirements = {
+                name: str(spec) for name, spec in parse_requirements(module_path / "requirements.txt").items()
+            }
+
+        return cls(
+            name=module.name,
+            fingerprint=fingerprint,
+            klass=f"{module.klass.__module__}:{module.klass.__qualname__}",
+            capabilities=sorted({cap.__name__ for cap in module.iter_caps()}),
+            dependencies=module.dependencies,
+            description=module.description,
+            maintainer=module.maintainer,
+            license=module.license,
+            icon=module.icon or "",
+            config={
+                key: {"label": value.label, "masked": bool(value.masked), "required": bool(value.required)}
+                for key, value in module.config.items()
+            },
+            requirements=requirements,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> ModuleMetadata:
+        return cls(**data)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "fingerprint": self.fingerprint,
+            "klass": self.klass,
+            "capabilities": self.capabilities,
+            "dependencies": self.dependencies,
+            "description": self.description,
+            "maintainer": self.maintainer,
+            "license": self.license,
+            "icon": self.icon,
+            "config": self.config,
+            "requirements": self.requirements,
+        }
+
+    def has_caps(self, *caps: str | type[Capability]) -> bool:
+        """Return True if module implements at least one of the caps."""
+        return any((cap if isinstance(cap, str) else cap.__name__) in self.capabilities for cap in caps)
+
+    def is_masked(self, key: str) -> bool:
+        """Return True if the config key is masked, like passwords."""
+        return bool(self.config.get(key, {}).get("masked", False))
+
+    def load_class(self) -> type[Module]:
+        """
+        Import the module and get its Module class.
+
+        :raises: ImportError if the class does not exist anymore
+        """
+        module_name, _, qualname = self.klass.partition(":")
+        attr: Any = importlib.import_module(module_name)
+        for part in qualname.split("."):
+            attr = getattr(attr, part, None)
+
+        if not isinstance(attr, type) or not issubclass(attr, Module):
+            raise ImportError(f"{self.klass} is not a Module class")
+        return attr
+
+
+class ModulesMetadataIndex:
+    """
+    On-disk cache of :class:`ModuleMetadata`, so modules don't have to be
+    imported to know their capabilities or configuration.
+
+    Entries are only returned if the fingerprint of the module has not
+    changed, and the whole cache is dropped when woob is upgraded.
+
+    :param path: JSON file to store the index, or None to only keep it in memory
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path
+        self.logger = getLogger(f"{__name__}.metadata")
+        self.modules: dict[str, ModuleMetadata] = {}
+        self._lock = Lock()
+
+        if path is not None:
+            self.load()
+
+    def load(self) -> None:
+        assert self.path is not None
+        try:
+            with open(self.path, encoding="utf-8") as fp:
+                data = json.load(fp)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            self.logger.warning("Unable to read modules metadata from %s: %s", self.path, e)
+            return
+
+        if data.get("format") != self.FORMAT_VERSION or data.get("woob") != __version__:
+            return
+
+        for name, entry in data.get("modules", {}).items():
+            try:
+                self.modules[name] = ModuleMetadata.from_dict(entry)
+            except TypeError:
+                continue
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+
+        with self._lock:
+            data = {
+                "format": self.FORMAT_VERSION,
+                "woob": __version__,
+                "modules": {name: metadata.to_dict() for name, metadata in sorted(self.modules.items())},
+            }
+
+        try:
+            with NamedTemporaryFile(
+                "w", encoding="utf-8", dir=os.path.dirname(self.path), prefix=".metadata", delete=False
+            ) as fp:
+                json.dump(data, fp)
+            os.replace(fp.name, self.path)
+        except OSError as e:
+            self.logger.debug("Unable to save modules metadata to %s: %s", self.path, e)
+
+    def get(self, name: str, fingerprint: str | None) -> ModuleMetadata | None:
+        """
+        Get metadata of a module, if it is still valid.
+
+        :param name: name of the module
+        :param fingerprint: current fingerprint of the module
+        """
+        metadata = self.modules.get(name)
+        if metadata is None or fingerprint is None or metadata.fingerprint != fingerprint:
+            return None
+        return metadata
+
+    def set(self, metadata: ModuleMetadata) -> bool:
+        """
+        Store metadata of a module.
+
+        :return: True if the index changed and should be saved
+        """
+        with self._lock:
+            current = self.modules.get(metadata.name)
+            if current is not None and current.to_dict() == metadata.to_dict():
+                return False
+            self.modules[metadata.name] = metadata
+            return True
+
+
 def _add_in_modules_path(path: str) -> None:
     try:
         import woob_modules
@@ -200,13 +432,14 @@ class ModulesLoader:
 
     LOADED_MODULE = LoadedModule
 
-    def __init__(self, path: str | None = None, version: str | None = None) -> None:
+    def __init__(self, path: str | None = None, version: str | None = None, metadata_path: str | None = None) -> None:
         self.version = version
         self.path = path
         if self.path:
             _add_in_modules_path(self.path)
         self.loaded: dict[str, LoadedModule] = {}
         self.logger = getLogger(f"{__name__}.loader")
+        self.metadata = ModulesMetadataIndex(metadata_path)
 
     def get_or_load_module(self, module_name: str) -> LoadedModule:
         """
@@ -258,9 +491,19 @@ def load_module(self, module_name: str) -> None:
             raise ModuleLoadError(module_name, f"Module {module_name} does not exist")
         self.check_version(module_name, module_spec)
 
+        fingerprint = self.get_module_fingerprint(module_name, module_spec)
+        metadata = self.metadata.get(module_name, fingerprint)
+
         try:
             pymodule = importlib.import_module(f"woob_modules.{module_name}")
-            module = self.LOADED_MODULE(pymodule)
+            klass = None
+            if metadata is not None:
+                try:
+                    klass = metadata.load_class()
+                except ImportError:
+                    # Fallback on looking for the class in the package.
+                    pass
+            module = self.LOADED_MODULE(pymodule, klass)
         except Exception as e:
             if logging.root.level <= logging.DEBUG:
                 self.logger.exception(e)
@@ -275,6 +518,53 @@ def load_module(self, module_name: str) -> None:
             )
         )
 
+        if fingerprint is not None and metadata is None:
+            if self.metadata.set(ModuleMetadata.from_loaded_module(module, fingerprint)):
+                self.metadata.save()
+
+    def get_module_fingerprint(self, module_name: str, module_spec: ModuleSpec | None = None) -> str | None:
+        """
+        Get a fingerprint of the module, which changes when the module is
+        updated, to know if its cached metadata are still valid.
+
+        :return: the fingerprint, or None if it can't be computed
+        """
+        if module_spec is None:
+            module_path = self.get_module_path(module_name)
+            if module_path:
+                _add_in_modules_path(module_path)
+            module_spec = importlib.util.find_spec(f"woob_modules.{module_name}")
+
+        if module_spec is None or module_spec.origin is None:
+            return None
+
+        path = Path(module_spec.origin)
+        if path.name == "__init__.py":
+            path = path.parent
+
+        try:
+            return get_tree_fingerprint(path)
+        except OSError:
+            return None
+
+    def get_module_metadata(self, module_name: str) -> ModuleMetadata:
+        """
+        Get metadata of a module, importing it only if they are not cached
+        yet or the module changed.
+
+        Can raise a ModuleLoadError exception.
+        """
+        fingerprint = self.get_module_fingerprint(module_name)
+        metadata = self.metadata.get(module_name, fingerprint)
+        if metadata is not None:
+            return metadata
+
+        module = self.get_or_load_module(module_name)
+        metadata = ModuleMetadata.from_loaded_module(module, fingerprint or "")
+        if fingerprint is not None and self.metadata.set(metadata):
+            self.metadata.save()
+        return metadata
+
     def get_module_path(self, module_name: str) -> str | None:
         return self.path
 
@@ -292,7 +582,7 @@ def check_version(self, module_name: str, module_spec: ModuleSpec) -> None:
         # requirements.txt file applies on all single-file modules.
         requirements_path = Path(module_spec.origin).parent / "requirements.txt"
 
-        for name, spec in parse_requirements(requirements_path).items():
+        for name, spec in cached_parse_requirements(requirements_path).items():
             if name == "woob":
                 if woob_version and woob_version not in spec:
                     # specific user friendly error message
@@ -303,17 +593,14 @@ def check_version(self, module_name: str, module_spec: ModuleSpec) -> None:
                     )
                 continue
 
-            try:
-                pkg = metadata.distribution(name)
-            except metadata.PackageNotFoundError as exc:
-                raise ModuleLoadError(
-                    module_name, f'Module requires python package "{name}" but not installed.'
-                ) from exc
+            version = get_installed_version(name)
+            if version is None:
+                raise ModuleLoadError(module_name, f'Module requires python package "{name}" but not installed.')
 
-            if Version(pkg.version) not in spec:
+            if Version(version) not in spec:
                 raise ModuleLoadError(
                     module_name,
-                    f'Module requires python package "{name}" {spec} but version {pkg.version} is installed',
+                    f'Module requires python package "{name}" {spec} but version {version} is installed',
                 )
 
 
@@ -322,8 +609,14 @@ class RepositoryModulesLoader(ModulesLoader):
     Load modules from repositories.
     """
 
+    METADATA_FILENAME = "metadata.json"
+
     def __init__(self, repositories: Repositories) -> None:
-        super().__init__(repositories.modules_dir, repositories.version)
+        super().__init__(
+            repositories.modules_dir,
+            repositories.version,
+            os.path.join(os.path.dirname(repositories.modules_dir), self.METADATA_FILENAME),
+        )
         self.repositories = repositories
         # repositories.modules_dir is ...../woob_modules
         # shouldn't be in sys.path, its parent should
@@ -341,3 +634,15 @@ def get_module_path(self, module_name: str) -> str:
             raise ModuleLoadError(module_name, f"Module {module_name} is not installed")
 
         return minfo.path
+
+    def get_module_fingerprint(self, module_name: str, module_spec: ModuleSpec | None = None) -> str | None:
+        minfo = self.repositories.get_module_info(module_name)
+        if minfo is None or minfo.path is None:
+            return None
+
+        if minfo.is_local():
+            # Modules of a local repository may be edited without updating
+            # the repository index.
+            return super().get_module_fingerprint(module_name, module_spec)
+
+        return f"{minfo.path}:{minfo.version}"
@@ -19,6 +19,8 @@
 
 import hashlib
 import importlib
+import json
+import multiprocessing
 import os
 import posixpath
 import re
@@ -26,14 +28,18 @@
 import subprocess
 import sys
 import tarfile
-from collections.abc import Generator, Iterable, Iterator, Mapping, Sequence
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping, Sequence
 from compileall import compile_dir
-from configparser import DEFAULTSECT, RawConfigParser
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from configparser import DEFAULTSECT
+from configparser import Error as ConfigParserError
+from configparser import RawConfigParser
 from contextlib import closing, contextmanager
 from datetime import datetime
 from io import BytesIO, StringIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile, mkdtemp
+from threading import local
 from typing import IO, Any, TextIO, TypeVar
 from urllib.request import getproxies
 
@@ -48,7 +54,7 @@
 from woob.tools.misc import find_exe, get_backtrace, to_unicode
 from woob.tools.packaging import parse_requirements
 
-from .modules import LoadedModule, _add_in_modules_path
+from .modules import LoadedModule, _add_in_modules_path, get_tree_fingerprint
 
 
 T = TypeVar("T")
@@ -84,6 +90,9 @@ def __init__(self, name: str) -> None:
         self.license = ""
         self.icon = ""
         self.woob_spec: SpecifierSet = SpecifierSet()
+        # hash of the content of the module, which doesn't depend on its
+        # version, set by "woob repos build".
+        self.content_hash = ""
 
     def load(self, items: Mapping[str, str]) -> None:
         self.version = int(items["version"])
@@ -94,6 +103,7 @@ def load(self, items: Mapping[str, str]) -> None:
         self.license = to_unicode(items["license"])
         self.icon = items["icon"].strip() or ""
         self.woob_spec = SpecifierSet(items.get("woob_spec", ""))
+        self.content_hash = items.get("content_hash", "")
 
     def has_caps(self, *caps: str | type[Capability] | Iterable[str | type[Capability]]) -> bool:
         """Return True if module implements at least one of the caps."""
@@ -115,7 +125,7 @@ def is_local(self) -> bool:
         return self.url is None
 
     def dump(self) -> tuple[tuple[str, Any], ...]:
-        return (
+        items: tuple[tuple[str, Any], ...] = (
             ("version", self.version),
             ("capabilities", " ".join(self.capabilities)),
             ("dependencies", " ".join(self.dependencies)),
@@ -125,6 +135,51 @@ def dump(self) -> tuple[tuple[str, Any], ...]:
             ("icon", self.icon or ""),
             ("woob_spec", str(self.woob_spec)),
         )
+        if self.content_hash:
+            items += (("content_hash", self.content_hash),)
+        return items
+
+
+def build_module_info(path: str, name: str, module_path: str) -> tuple[dict[str, Any] | None, tuple[str, str] | None]:
+    """
+    Import a module of a local repository to get its information.
+
+    It can be run in a process pool.
+
+    :param path: path of the repository
+    :param name: name of the module
+    :param module_path: path of the module package or file
+    :return: the information to load in a :class:`ModuleInfo`, or the error
+             message and its backtrace
+    """
+    _add_in_modules_path(path)
+
+    try:
+        pymodule = importlib.import_module(f"woob_modules.{name}")
+        module = LoadedModule(pymodule)
+    except Exception as e:  # noqa
+        return None, (f"[{type(e).__name__}] {e}", get_backtrace(str(e)))
+
+    m = ModuleInfo(module.name)
+    m.version = Repository.get_tree_mtime(module_path)
+    m.capabilities = list({c.__name__ for c in module.iter_caps()})
+    m.dependencies = module.dependencies
+    m.description = module.description
+    m.maintainer = module.maintainer
+    m.license = module.license
+    m.icon = module.icon or ""
+
+    assert module.path is not None
+    requirements_path = Path(module.path)
+    if not os.path.isdir(str(requirements_path)):
+        requirements_path = requirements_path.parent
+
+    requirements = parse_requirements(requirements_path / "requirements.txt")
+    m.woob_spec = requirements.get("woob", SpecifierSet())
+
+    info = {key: str(value) for key, value in m.dump()}
+    info["name"] = m.name
+    return info, None
 
 
 class RepositoryUnavailable(Exception):
@@ -139,6 +194,8 @@ class Repository:
     """
 
     INDEX = "modules.list"
+    INDEX_CACHE = ".modules.list.cache"
+    INDEX_CACHE_VERSION = 1
     KEYDIR = ".keys"
     KEYRING = "trusted.gpg"
 
@@ -151,6 +208,9 @@ def __init__(self, url: str) -> None:
         self.signed = False
         self.key_update = 0
         self.obsolete = False
+        # validators of the downloaded index, for conditional requests.
+        self.etag = ""
+        self.last_modified = ""
         self.logger = getLogger(f"{__name__}.repository")
         self.errors: dict[str, str] = {}
 
@@ -179,15 +239,19 @@ def localurl2path(self) -> str:
             return self.url[len("file://") :]
         return self.url
 
-    def retrieve_index(self, browser: Browser, repo_path: str | None) -> None:
+    def retrieve_index(self, browser: Browser, repo_path: str | None, previous: str | None = None) -> None:
         """
         Retrieve the index file of this repository. It can use network
         if this is a remote repository.
 
         :param repo_path: path to save the downloaded index file (if any).
+        :param previous: content of the index file previously saved for this
+                         repository, if any. A remote index is then only
+                         downloaded if it has changed.
         """
         built = False
         fp: TextIO
+        response = None
         if self.local:
             # Repository is local, open the file.
             filename = os.path.join(self.localurl2path(), self.INDEX)
@@ -200,15 +264,39 @@ def retrieve_index(self, browser: Browser, repo_path: str | None) -> None:
                 built = True
                 fp = open(filename, encoding="utf-8")
         else:
+            headers = {}
+            if previous is not None:
+                try:
+                    self.parse_index(StringIO(previous))
+                except (RepositoryUnavailable, ConfigParserError) as e:
+                    self.logger.debug("Unable to parse previous index of %s: %s", self.url, e)
+                    self.etag = self.last_modified = ""
+                else:
+                    if self.etag:
+                        headers["If-None-Match"] = self.etag
+                    if self.last_modified:
+                        headers["If-Modified-Since"] = self.last_modified
+
             # This is a remote repository, download file
             try:
-                fp = StringIO(browser.open(posixpath.join(self.url, self.INDEX)).text)
+                response = browser.open(posixpath.join(self.url, self.INDEX), headers=headers)
             except BrowserHTTPError as e:
                 raise RepositoryUnavailable(str(e)) from e
 
+            if response.status_code == 304:
+                self.logger.debug("Index of %s has not changed", self.url)
+                fp = StringIO(previous)
+            else:
+                fp = StringIO(response.text)
+
         self.parse_index(fp)
         fp.close()
 
+        if response is not None and response.status_code != 304:
+            # Validators are not in the index, but in response headers.
+            self.etag = response.headers.get("ETag", "")
+            self.last_modified = response.headers.get("Last-Modified", "")
+
         # this value can be changed by parse_index
         if self.local and not built:
             # Always rebuild index of a local repository.
@@ -268,6 +356,8 @@ def parse_index(self, fp: TextIO) -> None:
             self.signed = bool(int(items.get("signed", "0")))
             self.key_update = int(items.get("key_update", "0"))
             self.obsolete = bool(int(items.get("obsolete", "0")))
+            self.etag = items.get("etag", "")
+            self.last_modified = items.get("last_modified", "")
         except KeyError as e:
             raise RepositoryUnavailable(f"Missing global parameters in repository: {e}") from e
         except ValueError as e:
@@ -294,12 +384,17 @@ def parse_index(self, fp: TextIO) -> None:
                 module.signed = self.signed
             self.modules[section] = module
 
-    def build_index(self, path: str, filename: str) -> None:
+    def build_index(self, path: str, filename: str, workers: int | None = None) -> None:
         """
         Rebuild index of modules of repository.
 
+        Modules are only imported if they changed since the last build, which
+        is known with fingerprints kept in :attr:`INDEX_CACHE`.
+
         :param path: path of the repository
         :param filename: file to save index
+        :param workers: if greater than 1, import changed modules in a pool of
+                        this number of processes
         """
         self.logger.debug("Rebuild index")
         self.modules.clear()
@@ -314,6 +409,11 @@ def build_index(self, path: str, filename: str) -> None:
             self.signed = False
             self.key_update = 0
 
+        cache_path = os.path.join(path, self.INDEX_CACHE)
+        cache = self.load_index_cache(cache_path)
+        new_cache = {}
+        to_build = []
+
         for name in sorted(os.listdir(path)):
             module_path = Path(path) / name
 
@@ -337,50 +437,92 @@ def build_index(self, path: str, filename: str) -> None:
 
                 name = name[:-3]
 
-            try:
-                pymodule = importlib.import_module(f"woob_modules.{name}")
-                module = LoadedModule(pymodule)
-            except Exception as e:  # noqa
-                self.logger.warning("Unable to build module %s: [%s] %s", name, type(e).__name__, e)
-                bt = get_backtrace(str(e))
-                self.logger.debug(bt)
-                self.errors[name] = bt
+            fingerprint = get_tree_fingerprint(module_path)
+            cached = cache.get(name)
+            if cached is not None and cached["fingerprint"] == fingerprint:
+                new_cache[name] = cached
             else:
-                m = ModuleInfo(module.name)
-                m.version = self.get_tree_mtime(str(module_path))
-                m.capabilities = list({c.__name__ for c in module.iter_caps()})
-                m.dependencies = module.dependencies
-                m.description = module.description
-                m.maintainer = module.maintainer
-                m.license = module.license
-                m.icon = module.icon or ""
+                to_build.append((name, str(module_path), fingerprint))
 
-                assert module.path is not None
-                module_path = Path(module.path)
-                if not os.path.isdir(str(module_path)):
-                    module_path = module_path.parent
+        self.logger.debug("%d modules to build, %d modules unchanged", len(to_build), len(new_cache))
 
-                requirements = parse_requirements(module_path / "requirements.txt")
-                m.woob_spec = requirements.get("woob", SpecifierSet())
+        executor: Executor | None = None
+        mapper: Callable[..., Iterator[tuple[dict[str, Any] | None, tuple[str, str] | None]]] = map
+        if workers is not None and workers > 1 and len(to_build) > 1:
+            # Like extraction of modules, don't fork a possibly multi-threaded
+            # process.
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            mapper = executor.map
 
-                self.modules[module.name] = m
+        try:
+            results = mapper(
+                build_module_info,
+                [path] * len(to_build),
+                [name for name, _, _ in to_build],
+                [module_path for _, module_path, _ in to_build],
+            )
+            for (name, _, fingerprint), (info, error) in zip(to_build, results):
+                if error is not None:
+                    message, bt = error
+                    self.logger.warning("Unable to build module %s: %s", name, message)
+                    self.logger.debug(bt)
+                    self.errors[name] = bt
+                else:
+                    assert info is not None
+                    new_cache[name] = {"fingerprint": fingerprint, "info": info}
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        for name in sorted(new_cache):
+            info = new_cache[name]["info"]
+            m = ModuleInfo(info["name"])
+            m.load(info)
+            self.modules[m.name] = m
+
+        self.save_index_cache(cache_path, new_cache)
 
         self.update = int(datetime.now().strftime("%Y%m%d%H%M"))
         self.save(filename)
 
+    def load_index_cache(self, cache_path: str) -> dict[str, Any]:
+        """
+        Load fingerprints and information of modules from the last build.
+        """
+        try:
+            with open(cache_path, encoding="utf-8") as fp:
+                cache = json.load(fp)
+        except (OSError, ValueError):
+            return {}
+
+        if not isinstance(cache, dict) or cache.get("version") != self.INDEX_CACHE_VERSION:
+            return {}
+        return cache.get("modules", {})
+
+    def save_index_cache(self, cache_path: str, modules: Mapping[str, Any]) -> None:
+        try:
+            with open_for_config(cache_path) as f:
+                json.dump({"version": self.INDEX_CACHE_VERSION, "modules": modules}, f)
+        except OSError as e:
+            # The repository may be read-only, the index is rebuilt anyway.
+            self.logger.debug("Unable to save index cache %s: %s", cache_path, e)
+
     @staticmethod
     def get_tree_mtime(path: str, include_root: bool = False) -> int:
-        mtime = 0
+        mtime = 0.0
         if include_root or not os.path.isdir(path):
-            mtime = int(datetime.fromtimestamp(os.path.getmtime(path)).strftime("%Y%m%d%H%M"))
+            mtime = os.path.getmtime(path)
         for root, _, files in os.walk(path):
             for f in files:
                 if f.endswith(".pyc"):
                     continue
-                m = int(datetime.fromtimestamp(os.path.getmtime(os.path.join(root, f))).strftime("%Y%m%d%H%M"))
-                mtime = max(mtime, m)
+                mtime = max(mtime, os.path.getmtime(os.path.join(root, f)))
 
-        return mtime
+        if not mtime:
+            return 0
+
+        # Formatting is monotonic, so only the latest date is formatted.
+        return int(datetime.fromtimestamp(mtime).strftime("%Y%m%d%H%M"))
 
     def save(self, filename: str, private: bool = False) -> None:
         """
@@ -397,6 +539,10 @@ def save(self, filename: str, private: bool = False) -> None:
         config.set(DEFAULTSECT, "key_update", str(self.key_update))
         if private:
             config.set(DEFAULTSECT, "url", self.url)
+            if self.etag:
+                config.set(DEFAULTSECT, "etag", self.etag)
+            if self.last_modified:
+                config.set(DEFAULTSECT, "last_modified", self.last_modified)
 
         for module in self.modules.values():
             config.add_section(module.name)
@@ -409,36 +555,54 @@ def save(self, filename: str, private: bool = False) -> None:
 
 class Versions:
     VERSIONS_LIST = "versions.list"
+    CONTENT_HASHES_LIST = "content_hashes.list"
 
     def __init__(self, path: str) -> None:
         self.path = path
         self.versions = {}
+        self.content_hashes: dict[str, str] = {}
 
-        config_filename = os.path.join(self.path, self.VERSIONS_LIST)
-        try:
-            with open(config_filename, encoding="utf-8") as fp:
-                config = RawConfigParser()
-                config.read_file(fp, config_filename)
+        for filename, values, convert in (
+            (self.VERSIONS_LIST, self.versions, int),
+            (self.CONTENT_HASHES_LIST, self.content_hashes, str),
+        ):
+            config_filename = os.path.join(self.path, filename)
+            try:
+                with open(config_filename, encoding="utf-8") as fp:
+                    config = RawConfigParser()
+                    config.read_file(fp, config_filename)
 
-                # Read default parameters
-                for key, value in config.items(DEFAULTSECT):
-                    self.versions[key] = int(value)
-        except OSError:
-            pass
+                    # Read default parameters
+                    for key, value in config.items(DEFAULTSECT):
+                        values[key] = convert(value)
+            except OSError:
+                pass
 
     def get(self, name: str) -> Any:
         return self.versions.get(name, None)
 
-    def set(self, name: str, version: int | str) -> None:
+    def get_content_hash(self, name: str) -> str | None:
+        return self.content_hashes.get(name, None)
+
+    def set(self, name: str, version: int | str, content_hash: str | None = None) -> None:
         self.versions[name] = int(version)
+        if content_hash is not None and self.content_hashes.get(name) != content_hash:
+            if content_hash:
+                self.content_hashes[name] = content_hash
+            else:
+                self.content_hashes.pop(name, None)
+            self._save(self.CONTENT_HASHES_LIST, self.content_hashes)
         self.save()
 
     def save(self) -> None:
+        self._save(self.VERSIONS_LIST, self.versions)
+
+    def _save(self, filename: str, values: Mapping[str, Any]) -> None:
         config = RawConfigParser()
-        for name, version in self.versions.items():
-            config.set(DEFAULTSECT, name, str(version))
+        for name, value in values.items():
+            config.set(DEFAULTSECT, name, str(value))
 
-        with open_for_config(os.path.join(self.path, self.VERSIONS_LIST)) as fp:
+        with open_for_config(os.path.join(self.path, filename)) as fp:
             config.write(fp)
 
 
@@ -549,6 +713,29 @@ def dependency_sort(deps_rules: Mapping[T, set[T]]) -> DepList[T]:
 """
 
 
+def extract_module(tardata: bytes, path: str, name: str, module_dir: str) -> None:
+    """
+    Extract a module from its tarball, and byte-compile it.
+
+    It is run in a process pool when several modules are installed.
+
+    :param tardata: content of the tarball
+    :param path: directory where the module is extracted
+    :param name: name of the module
+    :param module_dir: directory where the module will be installed, used in
+                       compiled files
+    """
+    # TODO: remove tar.extractall() when not needed to prevent from potential archive attacks
+    with closing(tarfile.open("", "r:gz", BytesIO(tardata))) as tar:
+        tar.extractall(path)  # nosec
+
+    extracted_dir = os.path.join(path, name)
+    if not os.path.isdir(extracted_dir):
+        raise ModuleInstallError(f"The archive for {name} looks invalid.")
+
+    compile_dir(extracted_dir, quiet=True, ddir=module_dir)
+
+
 class Repositories:
     SOURCES_LIST = "sources.list"
     MODULES_DIR = "modules"
@@ -559,6 +746,11 @@ class Repositories:
 
     SHARE_DIRS = [MODULES_DIR, REPOS_DIR, KEYRINGS_DIR, ICONS_DIR]
 
+    INSTALL_WORKERS = 8
+    """
+    Number of modules downloaded and verified at the same time.
+    """
+
     def __init__(self, workdir: str, datadir: str, version: str) -> None:
         self.logger = getLogger(f"{__name__}.repositories")
         self.version = version
@@ -591,12 +783,15 @@ def __init__(self, workdir: str, datadir: str, version: str) -> None:
         else:
             self.load()
 
-    def load_browser(self) -> None:
+    def create_browser(self) -> Browser:
         class WoobBrowser(Browser):
             PROFILE = WoobProfile(self.version)
 
+        return WoobBrowser(logger=getLogger("browser", parent=self.logger), proxy=getproxies())
+
+    def load_browser(self) -> None:
         if self.browser is None:
-            self.browser = WoobBrowser(logger=getLogger("browser", parent=self.logger), proxy=getproxies())
+            self.browser = self.create_browser()
 
     def create_dir(self, name: str) -> None:
         if not os.path.exists(name):
@@ -698,12 +893,29 @@ def retrieve_icon(self, module: str | ModuleInfo | None) -> None:
             icon_url = module.url.replace(".tar.gz", ".png")
 
         try:
-            icon = self.browser.open(icon_url)
-        except BrowserHTTPNotFound:
+            icon = self._download(icon_url)
+        except (BrowserHTTPNotFound, FileNotFoundError):
             pass  # no icon, no problem
         else:
             with open(dest_path, "wb") as fp:
-                fp.write(icon.content)
+                fp.write(icon)
+
+    def _download(self, url: str, browser: Browser | None = None) -> bytes:
+        """
+        Download a file of a repository, which may be a file:// URL.
+
+        :param browser: browser to use instead of :attr:`browser`, as a
+                        browser can't be shared between threads
+        """
+        if url.startswith("file://"):
+            with open(url[len("file://") :], "rb") as fp:
+                return fp.read()
+
+        if browser is None:
+            self.load_browser()
+            browser = self.browser
+        assert browser is not None
+        return browser.open(url).content
 
     def _parse_source_list(self) -> list[str]:
         sources = []
@@ -726,8 +938,16 @@ def update_repositories(self, progress: IProgress = PrintProgress()) -> None:
         assert self.browser is not None
 
         self.repositories = []
+        # Previous indexes are kept to only download the changed ones.
+        previous = {}
         for name in os.listdir(self.repos_dir):
-            os.remove(os.path.join(self.repos_dir, name))
+            path = os.path.join(self.repos_dir, name)
+            try:
+                with open(path, encoding="utf-8") as fp:
+                    previous[name.split("-", 1)[-1]] = fp.read()
+            except OSError:
+                pass
+            os.remove(path)
 
         gpg_found = Keyring.find_gpg() or Keyring.find_gpgv()
         for line in self._parse_source_list():
@@ -738,7 +958,7 @@ def update_repositories(self, progress: IProgress = PrintProgress()) -> None:
             repo_path = os.path.join(self.repos_dir, prio_filename)
             keyring_path = os.path.join(self.keyrings_dir, filename)
             try:
-                repository.retrieve_index(self.browser, repo_path)
+                repository.retrieve_index(self.browser, repo_path, previous.get(filename))
                 if gpg_found:
                     repository.retrieve_keyring(self.browser, keyring_path, progress)
                 else:
@@ -815,6 +1035,11 @@ def update(self, progress: IProgress = PrintProgress()) -> None:
         to_update = []
         for info in self.get_all_modules_info().values():
             if self._is_module_updatable(info):
+                if info.content_hash and info.content_hash == self.versions.get_content_hash(info.name):
+                    # Only the version has changed, not the content.
+                    self.logger.debug("Module %s is unchanged in version %s", info.name, info.version)
+                    self.versions.set(info.name, info.version)
+                    continue
                 to_update.append(info)
 
         to_update = self._get_all_dependencies(to_update)
@@ -824,14 +1049,7 @@ def update(self, progress: IProgress = PrintProgress()) -> None:
             progress.progress(1.0, "All modules are up-to-date.")
             return
 
-        proxy_progress = SubProgress(progress, len(to_update))
-
-        for n, info in enumerate(to_update):
-            proxy_progress.current = n
-            try:
-                self._install_one_module(info, proxy_progress)
-            except ModuleInstallError as e:
-                proxy_progress.progress(1.0, str(e))
+        self._install_modules(to_update, progress, stop_on_error=False)
 
     def install(self, module: str | ModuleInfo, progress: IProgress = PrintProgress()) -> None:
         info: ModuleInfo | None
@@ -852,11 +1070,7 @@ def install(self, module: str | ModuleInfo, progress: IProgress = PrintProgress(
             if self._is_module_updatable(subinfo) or self._is_module_installable(subinfo)
         ]
 
-        proxy_progress = SubProgress(progress, len(to_install))
-
-        for n, info in enumerate(to_install):
-            proxy_progress.current = n
-            self._install_one_module(info, proxy_progress)
+        self._install_modules(to_install, progress)
 
     def _install_one_module(self, module: ModuleInfo, progress: IProgress) -> None:
         """
@@ -865,15 +1079,15 @@ def _install_one_module(self, module: ModuleInfo, progress: IProgress) -> None:
         :param module: module to install
         :param progress: observer object
         """
+        self._install_modules([module], progress)
+
+    def _check_installable(self, module: ModuleInfo, progress: IProgress) -> None:
         if self.version not in module.woob_spec:
             raise ModuleInstallError(
                 f"Module requires woob {module.woob_spec}, but you use woob {self.version}'.\n"
                 "Hint: use 'woob update' or install a newer version of woob"
             )
 
-        self.load_browser()
-        assert self.browser is not None
-
         if module.is_local():
             raise ModuleInstallError("%s is available on local." % module.name)
 
@@ -886,45 +1100,150 @@ def _install_one_module(self, module: ModuleInfo, progress: IProgress) -> None:
         else:
             raise ModuleInstallError("The latest version of %s is already installed" % module.name)
 
-        progress.progress(0.3, "Downloading module...")
+    def _get_keyring(self, module: ModuleInfo) -> Keyring | None:
+        """
+        Get the keyring to check the signature of a module, or None if it is
+        not signed or if gpg is not available.
+        """
+        if not module.signed or not (Keyring.find_gpg() or Keyring.find_gpgv()):
+            return None
+
+        assert module.repo_url is not None  # refs: Repository.parse_index
+        return Keyring(os.path.join(self.keyrings_dir, self.url2filename(module.repo_url)))
+
+    def _prepare_module(
+        self,
+        module: ModuleInfo,
+        keyring: Keyring | None,
+        path: str,
+        extractor: Executor | None,
+        get_browser: Callable[[], Browser],
+    ) -> str:
+        """
+        Download a module, check its signature, and extract it.
+
+        It is run in a thread pool, so it doesn't report progress.
+
+        :param get_browser: function returning the browser of the current thread
+        :return: path of the extracted module
+        """
+        assert module.url is not None
+        browser = get_browser()
+
         try:
-            assert module.url is not None
-            tardata = self.browser.open(module.url).content
-        except BrowserHTTPError as e:
+            tardata = self._download(module.url, browser)
+        except (BrowserHTTPError, OSError) as e:
             raise ModuleInstallError("Unable to fetch module: %s" % e)
 
-        # Check signature
-        if module.signed and (Keyring.find_gpg() or Keyring.find_gpgv()):
-            assert module.repo_url is not None  # refs: Repository.parse_index
-            progress.progress(0.5, "Checking module authenticity...")
-            sig_data = self.browser.open(posixpath.join(module.url + ".sig")).content
-            keyring_path = os.path.join(self.keyrings_dir, self.url2filename(module.repo_url))
-            keyring = Keyring(keyring_path)
+        if keyring is not None:
+            try:
+                sig_data = self._download(posixpath.join(module.url + ".sig"), browser)
+            except (BrowserHTTPError, OSError) as e:
+                raise ModuleInstallError("Unable to fetch signature of module: %s" % e)
             if not keyring.exists():
                 raise ModuleInstallError("No keyring found, please update repos.")
             if not keyring.is_valid(tardata, sig_data):
                 raise ModuleInstallError("Invalid signature for %s." % module.name)
 
-        # Extract module from tarball.
-        if os.path.isdir(module_dir):
-            shutil.rmtree(module_dir)
-        progress.progress(0.7, "Setting up module...")
+        module_dir = os.path.join(self.modules_dir, module.name)
+        path = os.path.join(path, module.name)
+        os.mkdir(path)
+        if extractor is None:
+            extract_module(tardata, path, module.name, module_dir)
+        else:
+            extractor.submit(extract_module, tardata, path, module.name, module_dir).result()
+        return os.path.join(path, module.name)
 
-        # TODO: remove tar.extractall() when not needed to prevent from potential archive attacks
-        with closing(tarfile.open("", "r:gz", BytesIO(tardata))) as tar:
-            tar.extractall(self.modules_dir)  # nosec
+    def _install_modules(self, modules: Sequence[ModuleInfo], progress: IProgress, stop_on_error: bool = True) -> None:
+        """
+        Install modules.
 
-        if not os.path.isdir(module_dir):
-            raise ModuleInstallError(f"The archive for {module.name} looks invalid.")
-        # Precompile
-        compile_dir(module_dir, quiet=True)
+        Modules are downloaded and their signatures are checked concurrently
+        by :attr:`INSTALL_WORKERS` threads, then they are extracted and
+        byte-compiled in a process pool. They are finally installed in the
+        given order, which has to respect their dependencies.
 
-        self.versions.set(module.name, module.version)
+        :param modules: modules to install, sorted by dependencies
+        :param progress: observer object
+        :param stop_on_error: if True, raise the first error, otherwise report
+                              it and install other modules
+        """
+        if not modules:
+            return
 
-        progress.progress(0.9, "Downloading icon...")
-        self.retrieve_icon(module)
+        # Each download thread creates its own browser, they are all closed
+        # once downloads are over.
+        browsers: list[Browser] = []
+        thread_browser = local()
+
+        def get_browser() -> Browser:
+            browser = getattr(thread_browser, "browser", None)
+            if browser is None:
+                browser = thread_browser.browser = self.create_browser()
+                browsers.append(browser)
+            return browser
+
+        keyrings: dict[str | None, Keyring | None] = {}
+
+        proxy_progress = SubProgress(progress, len(modules))
+        staging_dir = mkdtemp(prefix=".install-", dir=self.modules_dir)
+        downloader = ThreadPoolExecutor(max_workers=self.INSTALL_WORKERS, thread_name_prefix="woob-install")
+        extractor = None
+        if len(modules) > 1:
+            # Jobs are submitted by download threads, and forking a
+            # multi-threaded process may deadlock.
+            extractor = ProcessPoolExecutor(
+                max_workers=min(self.INSTALL_WORKERS, os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        try:
+            futures: list[Future[str] | ModuleInstallError] = []
+            for n, module in enumerate(modules):
+                proxy_progress.current = n
+                try:
+                    self._check_installable(module, proxy_progress)
+                except ModuleInstallError as e:
+                    if stop_on_error:
+                        raise
+                    futures.append(e)
+                    continue
+                if module.repo_url not in keyrings:
+                    keyrings[module.repo_url] = self._get_keyring(module)
+                keyring = keyrings[module.repo_url] if module.signed else None
+                futures.append(
+                    downloader.submit(self._prepare_module, module, keyring, staging_dir, extractor, get_browser)
+                )
+
+            for n, (module, future) in enumerate(zip(modules, futures)):
+                proxy_progress.current = n
+                try:
+                    if isinstance(future, ModuleInstallError):
+                        raise future
+                    extracted_dir = future.result()
+                except ModuleInstallError as e:
+                    if stop_on_error:
+                        raise
+                    proxy_progress.progress(1.0, str(e))
+                    continue
 
-        progress.progress(1.0, f"Module {module.name} has been installed!")
+                module_dir = os.path.join(self.modules_dir, module.name)
+                if os.path.isdir(module_dir):
+                    shutil.rmtree(module_dir)
+                os.replace(extracted_dir, module_dir)
+                self.versions.set(module.name, module.version, module.content_hash)
+
+                proxy_progress.progress(0.9, "Downloading icon...")
+                self.retrieve_icon(module)
+
+                proxy_progress.progress(1.0, f"Module {module.name} has been installed!")
+        finally:
+            downloader.shutdown(cancel_futures=True)
+            for browser in browsers:
+                browser.deinit()
+            if extractor is not None:
+                extractor.shutdown(cancel_futures=True)
+            shutil.rmtree(staging_dir, ignore_errors=True)
 
     @staticmethod
     def url2filename(url: str) -> str:
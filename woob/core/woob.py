@@ -21,14 +21,16 @@
 import os
 import warnings
 from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, cast
 
 from woob import __version__
 from woob.capabilities.base import Capability
 from woob.core.backendscfg import BackendsConfig
 from woob.core.bcall import BackendsCall
-from woob.core.modules import LoadedModule, ModulesLoader, RepositoryModulesLoader
+from woob.core.lazybackends import BackendsLRU, LazyBackend
+from woob.core.modules import LoadedModule, ModuleMetadata, ModulesLoader, RepositoryModulesLoader
 from woob.core.repositories import IProgress, PrintProgress, Repositories
 from woob.core.requests import RequestsManager
 from woob.core.scheduler import IScheduler, Scheduler
@@ -66,6 +68,14 @@ class WoobBase:
     :param scheduler: what scheduler to use; default is :class:`woob.core.scheduler.Scheduler`
     """
 
+    MAX_LOADED_BACKENDS: int | None = None
+    """
+    Maximum number of lazy backends kept loaded at once.
+
+    When this is exceeded, the least recently used backends are unloaded,
+    and are loaded again on next use. Unlimited if None.
+    """
+
     @classproperty
     def VERSION(self) -> str:
         warnings.warn("Use woob.__version__ instead.", DeprecationWarning, stacklevel=2)
@@ -76,6 +86,7 @@ def __init__(
     ) -> None:
         self.logger = getLogger("woob")
         self.backend_instances: dict[str, Module] = {}
+        self.backends_lru = BackendsLRU(self.MAX_LOADED_BACKENDS)
         self.requests = RequestsManager()
 
         self.modules_path = modules_path
@@ -268,7 +279,7 @@ def do(self, function: Callable[..., Any] | str, *args: Any, **kwargs: Any) -> B
         backends = list(self.backend_instances.values())
         _backends = kwargs.pop("backends", None)
         if _backends is not None:
-            if isinstance(_backends, Module):
+            if isinstance(_backends, (Module, LazyBackend)):
                 backends = [_backends]
             elif isinstance(_backends, str):
                 if len(_backends) > 0:
@@ -479,16 +490,31 @@ def load_backends(
         exclude: Iterable[str] | None = None,
         storage: IStorage | None = None,
         errors: list[Woob.LoadError] | None = None,
+        workers: int | None = None,
+        lazy: bool = False,
     ) -> dict[str, Module]:
         """
         Load backends listed in config file.
 
+        With `workers`, modules are imported and backends are instantiated
+        concurrently, which speeds up the startup when there are a lot of
+        backends. Backends are still loaded in the order of the config file.
+
+        With `lazy`, only proxies are registered (see
+        :class:`woob.core.lazybackends.LazyBackend`), and backends are created
+        on first use. Modules are not imported if their metadata are cached.
+        Their load and config errors are then raised at this time, and not
+        stored in `errors`. At most :attr:`MAX_LOADED_BACKENDS` of them
+        are kept loaded.
+
         :param caps: load backends which implement all of specified caps
         :param names: load backends in list
         :param modules: load backends which module is in list
         :param exclude: do not load backends in list
         :param storage: use this storage if specified
         :param errors: if specified, store every errors in this list
+        :param workers: number of threads used to load backends
+        :param lazy: only create backends when they are used
         :returns: loaded backends
         """
         loaded = {}
@@ -499,14 +525,16 @@ def load_backends(
             self.logger.error("Repositories are not consistent with the sources.list")
             raise VersionsMismatchError('Versions mismatch, please run "woob config update"')
 
-        for backend_name, module_name, params in self.backends_config.iter_backends():
+        selected = []
+        if names is not None:
+            names = list(names)
+        if modules is not None:
+            modules = list(modules)
+
+        for backend_name, module_name, params in self.backends_config.iter_backends(names=names, modules=modules):
             if (
                 "_enabled" in params
                 and not params["_enabled"].lower() in ("1", "y", "true", "on", "yes")
-                or names is not None
-                and backend_name not in names
-                or modules is not None
-                and module_name not in modules
                 or exclude is not None
                 and backend_name in exclude
             ):
@@ -528,26 +556,65 @@ def load_backends(
             if not minfo.is_installed():
                 self.repositories.install(minfo)
 
-            module = None
+            selected.append((backend_name, module_name, params))
+
+        def load_module(module_name: str) -> LoadedModule | ModuleMetadata | ModuleLoadError:
             try:
-                module = self.modules_loader.get_or_load_module(module_name)
+                if lazy:
+                    return self.modules_loader.get_module_metadata(module_name)
+                return self.modules_loader.get_or_load_module(module_name)
             except ModuleLoadError as e:
-                self.logger.error('Unable to load module "%s": %s', module_name, e)
-                continue
-
-            if backend_name in self.backend_instances:
-                self.logger.warning(
-                    'Oops, the backend "%s" is already loaded. Unload it before reloading...', backend_name
-                )
-                self.unload_backends(backend_name)
-
+                return e
+
+        def create_instance(
+            entry: tuple[str, LoadedModule | ModuleMetadata, Mapping[str, str]],
+        ) -> Module | Module.ConfigError:
+            backend_name, module, params = entry
+            if isinstance(module, ModuleMetadata):
+                return cast(Module, LazyBackend(self, module, backend_name, params, storage, lru=self.backends_lru))
             try:
-                backend_instance = module.create_instance(self, backend_name, params, storage)
+                return module.create_instance(self, backend_name, params, storage)
             except Module.ConfigError as e:
-                if errors is not None:
-                    errors.append(self.LoadError(backend_name, str(e)))
-            else:
-                self.backend_instances[backend_name] = loaded[backend_name] = backend_instance
+                return e
+
+        executor = None
+        mapper: Callable[..., Iterator[Any]] = map
+        if workers is not None and workers > 1 and len(selected) > 1:
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="woob-load")
+            mapper = executor.map
+
+        try:
+            # Each module is imported only once.
+            module_names = list(dict.fromkeys(module_name for _, module_name, _ in selected))
+            loaded_modules = {}
+            for module_name, result in zip(module_names, mapper(load_module, module_names)):
+                if isinstance(result, ModuleLoadError):
+                    self.logger.error('Unable to load module "%s": %s', module_name, result)
+                else:
+                    loaded_modules[module_name] = result
+
+            entries = []
+            for backend_name, module_name, params in selected:
+                if module_name not in loaded_modules:
+                    continue
+
+                if backend_name in self.backend_instances:
+                    self.logger.warning(
+                        'Oops, the backend "%s" is already loaded. Unload it before reloading...', backend_name
+                    )
+                    self.unload_backends(backend_name)
+
+                entries.append((backend_name, loaded_modules[module_name], params))
+
+            for (backend_name, _, _), result in zip(entries, mapper(create_instance, entries)):
+                if isinstance(result, Module.ConfigError):
+                    if errors is not None:
+                        errors.append(self.LoadError(backend_name, str(result)))
+                else:
+                    self.backend_instances[backend_name] = loaded[backend_name] = result
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
         return loaded
 
     def load_or_install_module(self, module_name: str) -> LoadedModule:
@@ -17,6 +17,7 @@
 
 import difflib
 import importlib
+import multiprocessing
 import pkgutil
 import sys
 
@@ -87,6 +88,10 @@ def print_version(cls):
 
     @classmethod
     def run(cls):
+        # Needed by frozen executables to start worker processes, like
+        # the ones of "woob money".
+        multiprocessing.freeze_support()
+
         if sys.version_info < (3, 9):
             print("woob requires python >= 3.9 to work", file=sys.stderr)
             return 1
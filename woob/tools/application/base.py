@@ -22,6 +22,7 @@
 import sys
 import warnings
 from datetime import datetime
+from itertools import islice
 from optparse import OptionGroup, OptionParser
 
 from woob.capabilities.base import BaseObject, ConversionWarning
@@ -111,6 +112,9 @@ class Application:
     DEBUG_FILTER = 2
     """Verbosity of DEBUG"""
 
+    FILL_WINDOW = 10
+    """Number of results completed at once, for backends able to fill several objects"""
+
     stdin = sys.stdin
     stdout = sys.stdout
     stderr = sys.stderr
@@ -225,6 +229,9 @@ def create_storage(self, path=None, klass=None, localonly=False):
         """
         Create a storage object.
 
+        If a :class:`woob.tools.storage.ShardedStorage` directory exists next
+        to the storage file, with a ``.d`` suffix, it is used by default.
+
         :param path: An optional specific path
         :type path: :class:`str`
         :param klass: What class to instance
@@ -233,11 +240,6 @@ def create_storage(self, path=None, klass=None, localonly=False):
         :type localonly: :class:`bool`
         :rtype: :class:`woob.tools.storage.IStorage`
         """
-        if klass is None:
-            from woob.tools.storage import StandardStorage
-
-            klass = StandardStorage
-
         if path is None:
             path = os.path.join(self.CONFDIR, self.APPNAME + ".storage")
             if self.OLD_APPNAME:
@@ -246,6 +248,15 @@ def create_storage(self, path=None, klass=None, localonly=False):
         elif os.path.sep not in path:
             path = os.path.join(self.CONFDIR, path)
 
+        if klass is None:
+            from woob.tools.storage import ShardedStorage, StandardStorage
+
+            klass = StandardStorage
+            # The storage has been migrated with "python -m woob.tools.storage".
+            if os.path.isdir(path + ".d"):
+                klass = ShardedStorage
+                path += ".d"
+
         storage = klass(path)
         self.storage = ApplicationStorage(self.APPNAME, storage)
         self.storage.load(self.STORAGE)
@@ -327,23 +338,58 @@ def _do_complete_obj(self, backend, fields, obj):
             obj = backend.fillobj(obj, fields) or obj
         return obj
 
+    def _do_complete_objs(self, backend, fields, objs):
+        objs = list(objs)
+        to_fill = [i for i, obj in enumerate(objs) if obj and isinstance(obj, BaseObject)]
+        if not to_fill:
+            return objs
+
+        for i in to_fill:
+            objs[i].backend = backend.name
+        if fields is None or len(fields) > 0:
+            filled = backend.fillobjs([objs[i] for i in to_fill], fields)
+            for i, obj in zip(to_fill, filled):
+                objs[i] = obj or objs[i]
+        return objs
+
     def _do_complete_iter(self, backend, count, fields, res):
         modif = 0
-
-        for i, sub in enumerate(res):
-            sub = self._do_complete_obj(backend, fields, sub)
-            if self.condition and self.condition.limit and self.condition.limit == i:
+        i = 0
+        # Only backends able to fill several objects at once are given
+        # several of them, as it delays the display of the first results.
+        window = self.FILL_WINDOW if getattr(backend, "BATCH_OBJECTS", None) else 1
+        iterator = iter(res)
+
+        while True:
+            # Never get more results than the ones which would have been
+            # completed one by one.
+            size = window
+            if self.condition and self.condition.limit:
+                size = min(size, self.condition.limit - i + 1)
+            if count:
+                size = min(size, count + modif - i + 1)
+
+            if size > 1:
+                batch = self._do_complete_objs(backend, fields, islice(iterator, size))
+            else:
+                batch = [self._do_complete_obj(backend, fields, sub) for sub in islice(iterator, 1)]
+            if not batch:
                 return
 
-            if self.condition and not self.condition.is_valid(sub):
-                modif += 1
-            else:
-                if count and i - modif == count:
-                    if self._is_default_count:
-                        raise MoreResultsAvailable()
-                    else:
-                        return
-                yield sub
+            for sub in batch:
+                if self.condition and self.condition.limit and self.condition.limit == i:
+                    return
+
+                if self.condition and not self.condition.is_valid(sub):
+                    modif += 1
+                else:
+                    if count and i - modif == count:
+                        if self._is_default_count:
+                            raise MoreResultsAvailable()
+                        else:
+                            return
+                    yield sub
+                i += 1
 
     def _do_complete(self, backend, count, selected_fields, function, *args, **kwargs):
         assert count is None or count > 0
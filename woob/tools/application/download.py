@@ -0,0 +1,171 @@
+# Copyright(C) 2026 woob project
+#
+# This file is part of woob.
+#
+# woob is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# woob is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with woob. If not, see <http://www.gnu.org/licenses/>.
+
+# flake8: compatible
+
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Lock
+from typing import Any
+
+
+__all__ = ["Downloader", "is_downloaded", "write_file"]
+
+
+PART_SUFFIX = ".part"
+
+
+def is_downloaded(dest: str, size: int | None = None) -> bool:
+    """
+    Check if a file has already been downloaded.
+
+    As files are written by :func:`write_file`, an existing file is
+    complete. Its size is checked if the expected one is known.
+
+    :param dest: path of the file
+    :param size: expected size of the file, if known
+    """
+    try:
+        st = os.stat(dest)
+    except OSError:
+        return False
+    return size is None or st.st_size == size
+
+
+def write_file(dest: str, data: bytes | Iterable[bytes]) -> int:
+    """
+    Write a file atomically.
+
+    Data is written in a temporary file next to `dest`, which is renamed
+    once complete, so an interrupted download never leaves a truncated
+    file.
+
+    :param dest: path of the file
+    :param data: content, or chunks of content
+    :return: number of bytes written
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = (data,)
+
+    part = dest + PART_SUFFIX
+    written = 0
+    try:
+        with open(part, "wb") as f:
+            for chunk in data:
+                written += f.write(chunk)
+        os.replace(part, dest)
+    except BaseException:
+        try:
+            os.unlink(part)
+        except OSError:
+            pass
+        raise
+    return written
+
+
+class Downloader:
+    """
+    Download files on a bounded pool of threads.
+
+    Downloads sharing the same key, usually the name of a backend, are run
+    one after the other, as a browser can't be used by several threads;
+    downloads with different keys are run concurrently.
+
+    :param max_workers: maximum number of concurrent downloads
+    """
+
+    MAX_WORKERS = 8
+
+    def __init__(self, max_workers: int | None = None):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or self.MAX_WORKERS)
+        self._queues: dict[Hashable, deque[tuple[Future, str, Callable[[], Any]]]] = {}
+        self._lock = Lock()
+
+    def __enter__(self) -> Downloader:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.shutdown()
+
+    def submit(self, key: Hashable, dest: str, fetch: Callable[[], Any]) -> Future:
+        """
+        Schedule a download.
+
+        :param key: downloads with the same key are not run concurrently
+        :param dest: path of the file to write
+        :param fetch: function returning the content, or chunks of content;
+                      nothing is written if it returns None
+        :return: future of the number of bytes written, or None
+        """
+        future: Future = Future()
+        with self._lock:
+            queue = self._queues.setdefault(key, deque())
+            queue.append((future, dest, fetch))
+            if len(queue) == 1:
+                self.executor.submit(self._run, key)
+        return future
+
+    def _run(self, key: Hashable) -> None:
+        with self._lock:
+            future, dest, fetch = self._queues[key][0]
+
+        if future.set_running_or_notify_cancel():
+            try:
+                data = fetch()
+                result = None if data is None else write_file(dest, data)
+            except BaseException as exc:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+        with self._lock:
+            queue = self._queues[key]
+            queue.popleft()
+            if queue:
+                self.executor.submit(self._run, key)
+            else:
+                del self._queues[key]
+
+    def shutdown(self, cancel: bool = False) -> None:
+        """
+        Wait for scheduled downloads.
+
+        :param cancel: cancel downloads which are not started
+        """
+        if cancel:
+            with self._lock:
+                for queue in self._queues.values():
+                    for future, _, _ in queue:
+                        future.cancel()
+
+        # Each download schedules the next one of its key, so wait for all
+        # of them before shutting the executor down.
+        while True:
+            with self._lock:
+                pending = [future for queue in self._queues.values() for future, _, _ in queue]
+            if not pending:
+                break
+            for future in pending:
+                try:
+                    future.exception()
+                except BaseException:
+                    pass
+        self.executor.shutdown()
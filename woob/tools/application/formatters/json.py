@@ -16,7 +16,7 @@
 # along with woob. If not, see <http://www.gnu.org/licenses/>.
 
 
-from woob.tools.json import WoobEncoder, json
+from woob.tools.json import WoobEncoder
 
 from .iformatter import IFormatter
 
@@ -27,20 +27,50 @@
 class JsonFormatter(IFormatter):
     """
     Formats the whole list as a single JSON list object.
+
+    Items are written as they come, by chunks of :attr:`CHUNK_SIZE`, so
+    the list is never kept in memory.
     """
 
+    CHUNK_SIZE = 100
+
     def __init__(self):
         super().__init__()
+        self.encoder = WoobEncoder()
+        self.started = False
         self.queue = []
 
     def flush(self):
-        self.output(json.dumps(self.queue, cls=WoobEncoder))
+        self.output_items(closing=True)
+        self.started = False
+
+    def output_items(self, closing=False):
+        # The last item is kept until the next one or the end, to know if it
+        # has to be followed by a comma or by the closing bracket.
+        if closing:
+            items, self.queue = self.queue, []
+        else:
+            items, self.queue = self.queue[:-1], self.queue[-1:]
+            if not items:
+                return
+
+        s = ",\n".join(items)
+        if not self.started:
+            s = "[" + s
+            self.started = True
+        s += "]" if closing else ","
+        self.output(s)
+
+    def push(self, item):
+        self.queue.append(self.encoder.encode(item))
+        if len(self.queue) > self.CHUNK_SIZE:
+            self.output_items()
 
     def format_dict(self, item):
-        self.queue.append(item)
+        self.push(item)
 
     def format_collection(self, collection, only):
-        self.queue.append(collection.to_dict())
+        self.push(collection.to_dict())
 
 
 class JsonLineFormatter(IFormatter):
@@ -49,5 +79,9 @@ class JsonLineFormatter(IFormatter):
     The advantage is that it can be streamed.
     """
 
+    def __init__(self):
+        super().__init__()
+        self.encoder = WoobEncoder()
+
     def format_dict(self, item):
-        self.output(json.dumps(item, cls=WoobEncoder))
+        self.output(self.encoder.encode(item))
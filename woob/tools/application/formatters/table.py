@@ -25,6 +25,11 @@
 except ImportError:
     SINGLE_BORDER = None  # NOQA
 
+try:
+    from wcwidth import wcswidth
+except ImportError:
+    wcswidth = None  # NOQA
+
 from woob.capabilities.base import empty
 
 from .iformatter import IFormatter
@@ -36,32 +41,53 @@
 class TableFormatter(IFormatter):
     HTML = False
 
+    STREAM_THRESHOLD = 1000
+    """
+    Number of rows after which the table is printed incrementally, instead of
+    keeping all rows until :meth:`flush`. Set to None to never stream.
+
+    When streaming, columns and their widths are decided from these first
+    rows (or columns are :attr:`DISPLAYED_FIELDS` if set). Later values in
+    hidden columns are not displayed, and longer values break alignment.
+    """
+
     def __init__(self):
         super().__init__()
         self.queue = []
         self.keys = None
         self.header = None
+        # columns and their widths, when streaming
+        self.stream_columns = None
+        self.count = 0
 
     def flush(self):
+        if self.stream_columns is not None:
+            self.output(self.get_border("└", "┴", "┘"))
+            self.stream_columns = None
+            self.count = 0
+            return
+
         s = self.get_formatted_table()
         if s is not None:
             self.output(s)
 
-    def get_formatted_table(self):
-        if len(self.queue) == 0:
-            return
-
+    def get_columns(self):
+        keys = list(self.keys)
         if self.interactive:
-            self.keys.insert(0, "#")
+            keys.insert(0, "#")
 
-        column_headers = []
-        keys = []
+        columns = []
         # Do not display columns when all values are NotLoaded or NotAvailable
-        for key in self.keys:
-            if key == "#" or any(not empty(line.get(key)) for line in self.queue):
-                column_headers.append(key.capitalize().replace("_", " "))
-                keys.append(key)
-
+        for key in keys:
+            if (
+                key == "#"
+                or (self.DISPLAYED_FIELDS is not None and key in self.DISPLAYED_FIELDS)
+                or any(not empty(line.get(key)) for line in self.queue)
+            ):
+                columns.append((key, key.capitalize().replace("_", " ")))
+        return columns
+
+    def get_title(self):
         s = ""
         if self.display_header and self.header:
             if self.HTML:
@@ -69,6 +95,17 @@ def get_formatted_table(self):
             else:
                 s += self.header
             s += "\n"
+        return s
+
+    def get_formatted_table(self):
+        if len(self.queue) == 0:
+            return
+
+        columns = self.get_columns()
+        keys = [key for key, _ in columns]
+        column_headers = [column_header for _, column_header in columns]
+
+        s = self.get_title()
         table = PrettyTable(list(column_headers))
         for column_header in column_headers:
             # API changed in python-prettytable. The try/except is a bad hack to support both versions
@@ -102,7 +139,71 @@ def format_cell(self, cell):
     def format_dict(self, item):
         if self.keys is None:
             self.keys = list(item.keys())
+
+        if self.stream_columns is not None:
+            return self.get_row(item)
+
         self.queue.append(item)
+        if self.STREAM_THRESHOLD is not None and not self.HTML and len(self.queue) >= self.STREAM_THRESHOLD:
+            return self.start_stream()
+
+    def get_cell_string(self, item, key):
+        if key == "#":
+            return str(self.count)
+        return str(self.format_cell(item.get(key))).replace("\n", " ")
+
+    @staticmethod
+    def get_width(string):
+        if wcswidth is not None:
+            width = wcswidth(string)
+            if width >= 0:
+                return width
+        return len(string)
+
+    def start_stream(self):
+        """
+        Start to print the table incrementally, with the queued rows.
+        """
+        columns = self.get_columns()
+        widths = [self.get_width(column_header) for _, column_header in columns]
+        for n, line in enumerate(self.queue, 1):
+            self.count = n
+            for i, (key, _) in enumerate(columns):
+                widths[i] = max(widths[i], self.get_width(self.get_cell_string(line, key)))
+        self.stream_columns = [(key, column_header, width) for (key, column_header), width in zip(columns, widths)]
+
+        self.count = 0
+        lines = [
+            self.get_border("┌", "┬", "┐"),
+            self.get_line(column_header for _, column_header, _ in self.stream_columns),
+            self.get_border("├", "┼", "┤"),
+        ]
+        lines.extend(self.get_row(line) for line in self.queue)
+        self.queue = []
+        return self.get_title() + "\n".join(lines)
+
+    def get_border(self, left, middle, right):
+        if SINGLE_BORDER is None:
+            left = middle = right = "+"
+            fill = "-"
+        else:
+            fill = "─"
+        return left + middle.join(fill * (width + 2) for _, _, width in self.stream_columns) + right
+
+    def get_line(self, cells):
+        sep = "│" if SINGLE_BORDER is not None else "|"
+        return (
+            sep
+            + sep.join(
+                " %s%s " % (cell, " " * (width - self.get_width(cell)))
+                for cell, (_, _, width) in zip(cells, self.stream_columns)
+            )
+            + sep
+        )
+
+    def get_row(self, item):
+        self.count += 1
+        return self.get_line(self.get_cell_string(item, key) for key, _, _ in self.stream_columns)
 
     def set_header(self, string):
         self.header = string
@@ -15,7 +15,13 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with woob. If not, see <http://www.gnu.org/licenses/>.
 
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+
+import woob.tools.date as date_utils
 from woob.capabilities import UserError
+from woob.capabilities.base import BaseObject
 
 
 __all__ = ["ResultsCondition", "ResultsConditionError"]
@@ -30,13 +36,6 @@ class ResultsConditionError(UserError):
     pass
 
 
-class Condition:
-    def __init__(self, left, op, right):
-        self.left = left  # Field of the object to test
-        self.op = op
-        self.right = right
-
-
 def is_egal(left, right):
     return left == right
 
@@ -64,6 +63,128 @@ def is_notin(left, right):
 functions = {"!=": is_notegal, "=": is_egal, ">": is_sup, "<": is_inf, "|": is_in, "!|": is_notin}
 
 
+TIMEDELTA_RE = re.compile(r"^\s*((?P<hours>\d+)\s*h)?\s*((?P<minutes>\d+)\s*m)?\s*((?P<seconds>\d+)\s*s)?\s*$")
+
+
+def parse_date(value):
+    return date(*[int(x) for x in value.split("-")])
+
+
+def parse_datetime(value):
+    splitted_datetime = value.split(" ")
+    return datetime(
+        *([int(x) for x in splitted_datetime[0].split("-")] + [int(x) for x in splitted_datetime[1].split(":")])
+    )
+
+
+def parse_timedelta(value):
+    time_dict = TIMEDELTA_RE.match(value).groupdict()
+    return timedelta(
+        seconds=int(time_dict["seconds"] or "0"),
+        minutes=int(time_dict["minutes"] or "0"),
+        hours=int(time_dict["hours"] or "0"),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_parser(typed):
+    """
+    Get the function to convert a value given by the user to the type of a
+    field.
+    """
+    if issubclass(typed, date_utils.date):
+        return parse_date
+    elif issubclass(typed, date_utils.datetime):
+        return parse_datetime
+    elif issubclass(typed, timedelta):
+        return parse_timedelta
+    return typed
+
+
+@lru_cache(maxsize=None)
+def has_plain_fields(cls):
+    """
+    Check if the fields of objects of this class can be read directly,
+    instead of using :meth:`BaseObject.to_dict`.
+    """
+    return (
+        issubclass(cls, BaseObject) and cls.to_dict is BaseObject.to_dict and cls.iter_fields is BaseObject.iter_fields
+    )
+
+
+# Marker of a value which can't be converted.
+INVALID = object()
+
+
+class Condition:
+    """
+    Condition on a field of objects.
+
+    The value to compare is converted to the type of the field the first
+    time this type is seen, and kept for next objects.
+    """
+
+    def __init__(self, left, op, right):
+        self.left = left  # Field of the object to test
+        self.op = op
+        self.right = right
+        self.function = functions[op]
+        self.converted = {}
+
+    def get_value(self, obj):
+        """
+        Get the value of the field, as in ``obj.to_dict()``.
+
+        :raises: :class:`ResultsConditionError` if the object has no such field
+        """
+        if has_plain_fields(type(obj)):
+            if self.left == "id":
+                if obj.id is not None:
+                    return obj.fullid if obj.backend is not None else obj.id
+            elif self.left in obj._fields:
+                return obj._fields[self.left].value
+        else:
+            d = obj.to_dict()
+            if self.left in d:
+                return d[self.left]
+
+        raise ResultsConditionError('Field "%s" is not valid.' % self.left)
+
+    def convert(self, value):
+        typed = type(value)
+        try:
+            return self.converted[typed]
+        except KeyError:
+            pass
+
+        # We have to change the type of v, always gived as string by application
+        try:
+            converted = get_parser(typed)(self.right)
+        except Exception:
+            converted = INVALID
+        self.converted[typed] = converted
+        return converted
+
+    def is_valid(self, obj):
+        value = self.get_value(obj)
+
+        # in the case of id, test id@backend and id
+        if self.left == "id":
+            evalfullid = self.function(self.right, value)
+            evalid = self.function(self.right, obj.id)
+            if self.op in ("!=", "!|"):
+                return evalfullid and evalid
+            return evalfullid or evalid
+
+        tocompare = self.convert(value)
+        if tocompare is INVALID:
+            return False
+        try:
+            return self.function(tocompare, value)
+        except Exception:
+            return False
+
+
 class ResultsCondition(IResultsCondition):
     condition_str = None
 
@@ -104,65 +225,9 @@ def __init__(self, condition_str):
         self.condition_str = condition_str
 
     def is_valid(self, obj):
-        import re
-        from datetime import date, datetime, timedelta
-
-        import woob.tools.date as date_utils
-
-        d = obj.to_dict()
-        # We evaluate all member of a list at each iteration.
-        for _or in self.condition:
-            myeval = True
-            for condition in _or:
-                if condition.left in d:
-                    # in the case of id, test id@backend and id
-                    if condition.left == "id":
-                        tocompare = condition.right
-                        evalfullid = functions[condition.op](tocompare, d["id"])
-                        evalid = functions[condition.op](tocompare, obj.id)
-                        if condition.op in ("!=", "!|"):
-                            myeval = evalfullid and evalid
-                        else:
-                            myeval = evalfullid or evalid
-                    else:
-                        # We have to change the type of v, always gived as string by application
-                        typed = type(d[condition.left])
-                        try:
-                            if isinstance(d[condition.left], date_utils.date):
-                                tocompare = date(*[int(x) for x in condition.right.split("-")])
-                            elif isinstance(d[condition.left], date_utils.datetime):
-                                splitted_datetime = condition.right.split(" ")
-                                tocompare = datetime(
-                                    *(
-                                        [int(x) for x in splitted_datetime[0].split("-")]
-                                        + [int(x) for x in splitted_datetime[1].split(":")]
-                                    )
-                                )
-                            elif isinstance(d[condition.left], timedelta):
-                                time_dict = re.match(
-                                    r"^\s*((?P<hours>\d+)\s*h)?\s*((?P<minutes>\d+)\s*m)?\s*((?P<seconds>\d+)\s*s)?\s*$",
-                                    condition.right,
-                                ).groupdict()
-                                tocompare = timedelta(
-                                    seconds=int(time_dict["seconds"] or "0"),
-                                    minutes=int(time_dict["minutes"] or "0"),
-                                    hours=int(time_dict["hours"] or "0"),
-                                )
-                            else:
-                                tocompare = typed(condition.right)
-                            myeval = functions[condition.op](tocompare, d[condition.left])
-                        except:
-                            myeval = False
-                else:
-                    raise ResultsConditionError('Field "%s" is not valid.' % condition.left)
-                # Do not try all AND conditions if one is false
-                if not myeval:
-                    break
-            # Return True at the first OR valid condition
-            if myeval:
-                return True
-        # If we are here, all OR conditions are False
-        return False
+        # Return True at the first OR valid condition, and do not try all AND
+        # conditions if one is false.
+        return any(all(condition.is_valid(obj) for condition in _or) for _or in self.condition)
 
     def __str__(self):
         return self.condition_str
@@ -20,11 +20,13 @@
 import importlib
 import logging
 import os
+import pickle
 import types
 import warnings
 from collections.abc import Iterable, Iterator, Mapping
 from copy import copy
-from threading import RLock
+from hashlib import sha256
+from threading import Lock, RLock
 from typing import TYPE_CHECKING, Any, Callable, ClassVar
 from urllib.request import getproxies
 
@@ -57,13 +59,35 @@ class BackendStorage:
     It is instancied automatically in constructor of :class:`Module`, in the
     :attr:`Module.storage` attribute.
 
+    A digest of the data is kept when they are loaded or saved, and
+    :meth:`save` does nothing if they have not changed since. The
+    :attr:`writes` and :attr:`skipped_writes` counters can be used for
+    monitoring, and are also summed for the whole process in
+    :attr:`total_writes` and :attr:`total_skipped_writes`.
+
     :param name: name of backend
     :param storage: storage object
     """
 
+    total_writes: ClassVar[int] = 0
+    """
+    Number of saves which have been written, in all backends.
+    """
+
+    total_skipped_writes: ClassVar[int] = 0
+    """
+    Number of saves which have been skipped as nothing changed, in all
+    backends.
+    """
+
+    _stats_lock: ClassVar[Lock] = Lock()
+
     def __init__(self, name: str, storage: IStorage | None) -> None:
         self.name = name
         self.storage = storage
+        self.writes = 0
+        self.skipped_writes = 0
+        self._digest: str | None = None
 
     def set(self, *args: Unpack[SetArgs]) -> None:
         """
@@ -124,13 +148,46 @@ def load(self, default: Mapping[str, Any] = {}) -> None:
         """
         if self.storage:
             self.storage.load("backends", self.name, default)
+            self._digest = self.get_digest()
+
+    def get_digest(self) -> str | None:
+        """
+        Get a digest of the data of this backend.
+
+        :return: the digest, or None if it can't be computed
+        """
+        if not self.storage:
+            return None
+
+        try:
+            data = pickle.dumps(self.storage.get("backends", self.name), protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            # Data can't be pickled, consider they always change.
+            return None
+        return sha256(data).hexdigest()
 
     def save(self) -> None:
         """
         Save storage.
+
+        Nothing is written if data have not changed since they were loaded or
+        saved.
         """
-        if self.storage:
-            self.storage.save("backends", self.name)
+        if not self.storage:
+            return
+
+        digest = self.get_digest()
+        if digest is not None and digest == self._digest:
+            self.skipped_writes += 1
+            with self._stats_lock:
+                BackendStorage.total_skipped_writes += 1
+            return
+
+        self.storage.save("backends", self.name)
+        self._digest = digest
+        self.writes += 1
+        with self._stats_lock:
+            BackendStorage.total_writes += 1
 
 
 class BackendConfig(ValuesDict):
@@ -276,6 +333,17 @@ class Module:
     NOT yet filled.
     """
 
+    BATCH_OBJECTS: ClassVar[
+        dict[type[BaseObject], Callable[[Module, list[BaseObject], list[str]], Iterable[BaseObject] | None]]
+    ] = {}
+    """Supported objects to fill several at once, with :meth:`fillobjs`
+
+    The key is the class and the value the method to call to fill
+    Method prototype: method(objects, fields)
+    It can fetch objects concurrently, or with a bulk API. It fills objects
+    in place, or returns the filled objects in the same order.
+    """
+
     DEPENDENCIES: ClassVar[tuple[str, ...]] = ()
     """Tuple of module names on which this module depends."""
 
@@ -510,6 +578,58 @@ def has_caps(self, *caps: str | type[Capability]) -> bool:
             for c in caps
         )
 
+    @staticmethod
+    def _not_loaded_or_incomplete(v: Any) -> bool:
+        return v is NotLoaded or isinstance(v, BaseObject) and not v.__iscomplete__()
+
+    @staticmethod
+    def _not_loaded(v: Any) -> bool:
+        return v is NotLoaded
+
+    @staticmethod
+    def _filter_missing_fields(obj: object, fields: Iterable[str] | None, check_cb: Callable[[Any], bool]) -> list[str]:
+        missing_fields = []
+        if fields is None:
+            # Select all fields
+            if isinstance(obj, BaseObject):
+                fields = [item[0] for item in obj.iter_fields()]
+            else:
+                fields = [item[0] for item in iter_fields(obj)]
+
+        for field in fields:
+            if not hasattr(obj, field):
+                raise FieldNotFound(obj, field)
+            value = getattr(obj, field)
+
+            missing = False
+            if isinstance(value, (str, bytes)):
+                # Strings can't contain objects to fill.
+                pass
+            elif hasattr(value, "__iter__"):
+                for v in value.values() if isinstance(value, dict) else value:
+                    if check_cb(v):
+                        missing = True
+                        break
+            elif check_cb(value):
+                missing = True
+
+            if missing:
+                missing_fields.append(field)
+
+        return missing_fields
+
+    @staticmethod
+    def _get_fill_fields(fields: str | Iterable[str] | None) -> Iterable[str] | None:
+        if isinstance(fields, str):
+            return (fields,)
+        return fields
+
+    def _set_not_available(self, obj: object, fields: Iterable[str] | None) -> None:
+        # Object is not supported by backend. Do not notice it to avoid flooding user.
+        # That's not so bad.
+        for field in self._filter_missing_fields(obj, fields, self._not_loaded):
+            setattr(obj, field, NotAvailable)
+
     def fillobj(self, obj: object | None, fields: str | Iterable[str] | None = None) -> object | None:
         """
         Fill an object with the wanted fields.
@@ -519,46 +639,8 @@ def fillobj(self, obj: object | None, fields: str | Iterable[str] | None = None)
         if obj is None:
             return obj
 
-        def not_loaded_or_incomplete(v: Any) -> bool:
-            return v is NotLoaded or isinstance(v, BaseObject) and not v.__iscomplete__()
-
-        def not_loaded(v: Any) -> bool:
-            return v is NotLoaded
-
-        def filter_missing_fields(
-            obj: object, fields: Iterable[str] | None, check_cb: Callable[[Any], bool]
-        ) -> list[str]:
-            missing_fields = []
-            if fields is None:
-                # Select all fields
-                if isinstance(obj, BaseObject):
-                    fields = [item[0] for item in obj.iter_fields()]
-                else:
-                    fields = [item[0] for item in iter_fields(obj)]
-
-            for field in fields:
-                if not hasattr(obj, field):
-                    raise FieldNotFound(obj, field)
-                value = getattr(obj, field)
-
-                missing = False
-                if hasattr(value, "__iter__"):
-                    for v in value.values() if isinstance(value, dict) else value:
-                        if check_cb(v):
-                            missing = True
-                            break
-                elif check_cb(value):
-                    missing = True
-
-                if missing:
-                    missing_fields.append(field)
-
-            return missing_fields
-
-        if isinstance(fields, str):
-            fields = (fields,)
-
-        missing_fields = filter_missing_fields(obj, fields, not_loaded_or_incomplete)
+        fields = self._get_fill_fields(fields)
+        missing_fields = self._filter_missing_fields(obj, fields, self._not_loaded_or_incomplete)
 
         if not missing_fields:
             return obj
@@ -569,15 +651,51 @@ def filter_missing_fields(
                 obj = value(self, obj, missing_fields) or obj
                 break
 
-        missing_fields = filter_missing_fields(obj, fields, not_loaded)
-
-        # Object is not supported by backend. Do not notice it to avoid flooding user.
-        # That's not so bad.
-        for field in missing_fields:
-            setattr(obj, field, NotAvailable)
+        self._set_not_available(obj, fields)
 
         return obj
 
+    def fillobjs(self, objs: Iterable[object | None], fields: str | Iterable[str] | None = None) -> list[object | None]:
+        """
+        Fill several objects with the wanted fields.
+
+        Objects whose class has a filler in :attr:`BATCH_OBJECTS` are given
+        to it together, other ones are filled one by one with
+        :meth:`fillobj`.
+
+        :param fields: what fields to fill; if None, all fields are filled
+        :return: the filled objects, in the same order
+        """
+        objs = list(objs)
+        batches: dict[Callable[..., Any], list[tuple[int, Iterable[str] | None, list[str]]]] = {}
+
+        for i, obj in enumerate(objs):
+            if obj is None:
+                continue
+
+            filler = next((value for key, value in self.BATCH_OBJECTS.items() if isinstance(obj, key)), None)
+            if filler is None:
+                objs[i] = self.fillobj(obj, fields)
+                continue
+
+            obj_fields = self._get_fill_fields(fields)
+            missing_fields = self._filter_missing_fields(obj, obj_fields, self._not_loaded_or_incomplete)
+            if missing_fields:
+                batches.setdefault(filler, []).append((i, obj_fields, missing_fields))
+
+        for filler, items in batches.items():
+            # Each object may miss different fields, ask for all of them.
+            missing_fields = list(dict.fromkeys(field for _, _, fields_ in items for field in fields_))
+            batch = [objs[i] for i, _, _ in items]
+            self.logger.debug("Fill %d objects with fields: %s", len(batch), missing_fields)
+            filled = filler(self, batch, missing_fields) or batch
+
+            for (i, obj_fields, _), obj in zip(items, filled):
+                self._set_not_available(obj, obj_fields)
+                objs[i] = obj
+
+        return objs
+
 
 class AbstractModuleMissingParentError(Exception):
     pass
@@ -20,8 +20,10 @@
 import os
 import sqlite3
 import tempfile
+import time
 import types
-from collections.abc import ItemsView, Iterator, Mapping, MutableMapping
+from collections.abc import ItemsView, Iterable, Iterator, Mapping, MutableMapping
+from contextlib import contextmanager
 from logging import Logger
 from typing import Any, cast
 
@@ -105,11 +107,46 @@ def __delitem__(self, key: str) -> None:
     def __setitem__(self, key: str, value: Any) -> None:
         self.config.set(self.base, key, value)
 
+    def update(self, *args: Any, **kwargs: Any) -> None:  # type: ignore[override]
+        """
+        Set several keys at once, in a single transaction.
+        """
+        self.config.set_many(self.base, dict(*args, **kwargs).items())
+
 
 class SQLiteConfig(IConfig):
+    """
+    Config stored in a SQLite database, with a table per root key.
+
+    Changes are committed by :meth:`save` at most every
+    `commit_since_seconds`, or at once at the end of a :meth:`batch`.
+
+    The database is vacuumed by :meth:`load` only when needed, see
+    :meth:`maintenance`.
+    """
+
     commit_since_seconds = 3600
     dump_since_seconds = 600
 
+    journal_mode = "WAL"
+    """
+    SQLite journal mode. With WAL, readers don't block writers, and commits
+    don't rewrite the database.
+    """
+
+    vacuum_since_seconds = 7 * 24 * 3600
+    """
+    Vacuum the database if it has not been done for this time.
+    Disabled if None.
+    """
+
+    vacuum_free_ratio = 0.25
+    """
+    Vacuum the database if this ratio of its pages are free.
+    """
+
+    META_TABLE = "_woob_meta"
+
     def __init__(
         self,
         path: str,
@@ -119,6 +156,7 @@ def __init__(
         logger: Logger | None = None,
     ):
         self.path = path
+        self._batch_depth = 0
         if commit_since_seconds:
             self.commit_since_seconds = commit_since_seconds
         if dump_since_seconds:
@@ -130,15 +168,79 @@ def __init__(
         if self.dump_since_seconds:
             self.dump = time_buffer(since_seconds=self.dump_since_seconds, last_run=last_run, logger=logger)(self.dump)
 
-    def load(self, default: Mapping[str, Any] = {}, optimize: bool = True) -> None:
-        self.storage = sqlite3.connect(self.path)
+    def load(self, default: Mapping[str, Any] = {}, optimize: bool | None = None) -> None:
+        """
+        Open the database.
+
+        :param optimize: if True, always vacuum and reindex the database, if
+                         False never do it, and if None, only do it when
+                         needed (see :meth:`maintenance`)
+        """
+        self.storage = sqlite3.connect(self.path, cached_statements=256)
         self.storage.execute("PRAGMA page_size = 4096")
-        if optimize:
-            self.storage.execute("VACUUM")
-            self.storage.execute("REINDEX")
+        if self.journal_mode:
+            self.storage.execute("PRAGMA journal_mode = %s" % self.journal_mode)
+        self._statements: dict[tuple[str, str], str] = {}
         self._tables = set(self.tables())
         self.values = VirtualRootDict(self)
 
+        if optimize:
+            self.maintenance(force=True)
+            self.storage.execute("REINDEX")
+        elif optimize is None:
+            self.maintenance()
+
+    def maintenance(self, force: bool = False) -> bool:
+        """
+        Vacuum the database if it has not been done for
+        :attr:`vacuum_since_seconds`, or if too many pages are free (see
+        :attr:`vacuum_free_ratio`).
+
+        :param force: vacuum anyway
+        :return: True if the database has been vacuumed
+        """
+        now = int(time.time())
+        last_vacuum = self._get_meta("last_vacuum")
+        if last_vacuum is None:
+            # Do not vacuum existing databases as soon as they are opened.
+            self._set_meta("last_vacuum", now)
+            last_vacuum = now
+
+        if not force:
+            page_count = self.storage.execute("PRAGMA page_count").fetchone()[0]
+            freelist_count = self.storage.execute("PRAGMA freelist_count").fetchone()[0]
+            if page_count and freelist_count / page_count >= self.vacuum_free_ratio:
+                force = True
+            elif self.vacuum_since_seconds is not None and now - int(last_vacuum) >= self.vacuum_since_seconds:
+                force = True
+
+        if not force:
+            self.storage.commit()
+            return False
+
+        self._set_meta("last_vacuum", now)
+        self.storage.commit()
+        self.storage.execute("VACUUM")
+        return True
+
+    def _get_meta(self, key: str) -> str | None:
+        try:
+            row = self.storage.execute(
+                "SELECT value FROM %s WHERE key=?;" % quote(self.META_TABLE), (key,)  # nosec
+            ).fetchone()
+        except sqlite3.OperationalError:
+            # Table does not exist yet.
+            return None
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: Any) -> None:
+        self.storage.execute(
+            "CREATE TABLE IF NOT EXISTS %s (key text PRIMARY KEY, value text);" % quote(self.META_TABLE)  # nosec
+        )
+        self.storage.execute(
+            "INSERT OR REPLACE INTO %s VALUES (?, ?);" % quote(self.META_TABLE), (key, str(value))  # nosec
+        )
+
     def save(self, commit_since_seconds: int | None = None, dump_since_seconds: int | None = None) -> None:
         self.commit(since_seconds=commit_since_seconds)
         # No one would want immediate dumps, assume it means no dumps
@@ -152,8 +254,40 @@ def __exit__(self, t: type[BaseException], v: BaseException, tb: types.Traceback
         self.force_save()
         super().__exit__(t, v, tb)
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Context manager to group changes in a single transaction.
+
+        Changes are committed at the end of the outermost batch, or rolled
+        back if an exception is raised. Pending changes made before are
+        committed when it starts. :meth:`save` does not commit during a
+        batch.
+
+        >>> with config.batch():  # doctest: +SKIP
+        ...     for key, value in values.items():
+        ...         config.set('table', key, value)
+        """
+        if not self._batch_depth:
+            self.storage.commit()
+
+        self._batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.storage.rollback()
+            raise
+        else:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.storage.commit()
+
     def commit(self, **kwargs: Any) -> None:
         kwargs.pop("since_seconds", None)
+        if self._batch_depth:
+            return
         self.storage.commit()
 
     def dump(self, **kwargs: Any) -> None:
@@ -180,10 +314,27 @@ def tables(self) -> list[str]:
         cur = self.storage.cursor()
         cur.execute(
             """SELECT name FROM sqlite_master
-            WHERE type="table" AND name NOT LIKE "sqlite_%";"""
+            WHERE type="table" AND name NOT LIKE "sqlite_%" AND name != ?;""",
+            (self.META_TABLE,),
         )
         return [k[0] for k in cur.fetchall()]
 
+    STATEMENTS = {
+        "select": "SELECT value FROM %s WHERE key=?;",
+        "insert": "INSERT OR REPLACE INTO %s VALUES (?, ?);",
+        "delete": "DELETE FROM %s WHERE key=?;",
+        "has": "SELECT count(*) FROM %s WHERE key=?;",
+    }
+
+    def _statement(self, name: str, table: str) -> str:
+        # Always use the same SQL text for a statement, so the connection
+        # reuses the prepared statement from its cache.
+        try:
+            return self._statements[name, table]
+        except KeyError:
+            statement = self._statements[name, table] = self.STATEMENTS[name] % quote(table)  # nosec
+            return statement
+
     def items(self, table: str, size: int = 100) -> Iterator[tuple[str, Any]]:
         """
         Low memory way of listing all items.
@@ -218,9 +369,7 @@ def get(self, *args: Unpack[GetArgs], **kwargs: Unpack[IConfigGet]) -> Any:
         if not key:
             return self.values[table]
         try:
-            cur = self.storage.cursor()
-            cur.execute("SELECT value FROM %s WHERE key=?;" % quote(table), (key,))  # nosec
-            row = cur.fetchone()
+            row = self.storage.execute(self._statement("select", table), (key,)).fetchone()
             if row is None:
                 if "default" in kwargs:
                     value = kwargs.get("default")
@@ -242,13 +391,28 @@ def set(self, *args: Unpack[SetArgs]) -> None:  # type: ignore[override]
         self.ensure_table(table)
         try:
             strvalue = yaml.dump(value, None, Dumper=WoobDumper, default_flow_style=False)
-            cur = self.storage.cursor()
-            cur.execute("""INSERT OR REPLACE INTO %s VALUES (?, ?)""" % quote(table), (key, strvalue))  # nosec
+            self.storage.execute(self._statement("insert", table), (key, strvalue))
         except KeyError:
             raise ConfigError()
         except TypeError:
             raise ConfigError()
 
+    def set_many(self, table: str, items: Iterable[tuple[str, Any]]) -> None:
+        """
+        Set several keys of a table in a single transaction.
+
+        :param table: name of the table
+        :param items: pairs of key and value
+        """
+        self.ensure_table(table)
+        try:
+            rows = [(key, yaml.dump(value, None, Dumper=WoobDumper, default_flow_style=False)) for key, value in items]
+        except TypeError:
+            raise ConfigError()
+
+        with self.batch():
+            self.storage.executemany(self._statement("insert", table), rows)
+
     def delete(self, *args: Unpack[GetArgs]) -> None:
         table = args[0]
         key = ".".join(args[1:])
@@ -260,8 +424,7 @@ def delete(self, *args: Unpack[GetArgs]) -> None:
                 raise ConfigError()
         else:
             self.ensure_table(table)
-            cur = self.storage.cursor()
-            cur.execute("DELETE FROM %s WHERE key=?;" % quote(table), (key,))  # nosec
+            cur = self.storage.execute(self._statement("delete", table), (key,))
             if not cur.rowcount:
                 raise ConfigError()
 
@@ -270,6 +433,5 @@ def has(self, *args: Unpack[GetArgs]) -> bool:
         key = ".".join(args[1:])
         if not key:
             return table in self._tables
-        cur = self.storage.cursor()
-        cur.execute("SELECT count(*) FROM %s WHERE key=?;" % quote(table), (key,))  # nosec
+        cur = self.storage.execute(self._statement("has", table), (key,))
         return bool(cur.fetchone()[0] > 0)
@@ -17,11 +17,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from datetime import date, datetime, time, timedelta
 
 # because we don't want to import this file by "import json"
 from decimal import Decimal
+from enum import Enum
 from typing import Any
 
 
@@ -103,11 +104,27 @@ class WoobEncoder(json.JSONEncoder):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         # avoid simplejson internal Decimal handling
-        if "use_decimal" in kwargs:
+        if "use_decimal" in kwargs or json.__name__ == "simplejson":
             kwargs["use_decimal"] = False
         super().__init__(*args, **kwargs)
 
+    # Conversions of the most common types, looked up by exact type before
+    # trying isinstance() checks.
+    ENCODERS: dict[type, Callable[[Any], Any]] = {
+        Decimal: str,
+        datetime: datetime.isoformat,
+        date: date.isoformat,
+        time: time.isoformat,
+        timedelta: timedelta.total_seconds,
+        type(NotAvailable): lambda o: None,
+        type(NotLoaded): lambda o: None,
+    }
+
     def default(self, o: Any) -> Any:
+        encoder = self.ENCODERS.get(type(o))
+        if encoder is not None:
+            return encoder(o)
+
         if o is NotAvailable:
             return None
         elif o is NotLoaded:
@@ -120,6 +137,8 @@ def default(self, o: Any) -> Any:
             return o.isoformat()
         elif isinstance(o, timedelta):
             return o.total_seconds()
+        elif isinstance(o, Enum):
+            return o.value
         return super().default(o)
 
 
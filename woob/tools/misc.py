@@ -180,6 +180,8 @@ def ratelimit(group: str, delay: int) -> None:
 
     This function is not thread-safe. For reasonably non-critical rate
     limiting (like accessing a website), it should be sufficient nevertheless.
+    To limit requests of a browser, prefer
+    :attr:`~woob.browser.browsers.Browser.RATE_LIMIT`.
 
     :param group: rate limiting group name, alphanumeric
     :param delay: delay in seconds between each call
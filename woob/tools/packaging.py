@@ -18,14 +18,23 @@
 
 from __future__ import annotations
 
+import os
 from collections import OrderedDict
+from importlib import metadata
 from pathlib import Path
+from threading import Lock
 
 from packaging.requirements import InvalidRequirement, Requirement
 from packaging.specifiers import SpecifierSet
+from packaging.utils import canonicalize_name
 
 
-__all__ = ["parse_requirements"]
+__all__ = ["parse_requirements", "cached_parse_requirements", "get_installed_version", "clear_caches"]
+
+
+_requirements_cache: dict[str, tuple[tuple[int, int] | None, dict[str, SpecifierSet]]] = {}
+_installed_versions: dict[str, str | None] | None = None
+_lock = Lock()
 
 
 def parse_requirements(path: str | Path) -> dict[str, SpecifierSet]:
@@ -48,3 +57,84 @@ def parse_requirements(path: str | Path) -> dict[str, SpecifierSet]:
         return {}
 
     return requirements
+
+
+def cached_parse_requirements(path: str | Path) -> dict[str, SpecifierSet]:
+    """
+    Like :func:`parse_requirements`, but the result is cached in the process
+    as long as the file is not modified.
+
+    The returned dict must not be modified.
+    """
+    path = str(path)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        key = None
+    else:
+        key = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _requirements_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    requirements = parse_requirements(path) if key is not None else {}
+    _requirements_cache[path] = (key, requirements)
+    return requirements
+
+
+def _scan_installed_versions() -> dict[str, str | None]:
+    versions: dict[str, str | None] = {}
+    for dist in metadata.distributions():
+        name = dist.metadata["Name"]
+        if not name:
+            continue
+        # The first one found on sys.path is the one which is imported, as
+        # importlib.metadata.distribution() does.
+        versions.setdefault(canonicalize_name(name), dist.version)
+    return versions
+
+
+def get_installed_version(name: str) -> str | None:
+    """
+    Get the version of an installed python distribution.
+
+    Installed distributions are scanned only once per process, which is
+    much faster than calling :func:`importlib.metadata.distribution` for
+    each requirement of each module. Missing distributions are cached too,
+    use :func:`clear_caches` after installing packages.
+
+    :param name: name of the distribution
+    :return: its version, or None if it is not installed
+    """
+    global _installed_versions
+
+    with _lock:
+        if _installed_versions is None:
+            _installed_versions = _scan_installed_versions()
+        versions = _installed_versions
+
+    key = canonicalize_name(name)
+    if key in versions:
+        return versions[key]
+
+    # Not found by the scan, it may have been installed since.
+    try:
+        version = metadata.distribution(name).version
+    except metadata.PackageNotFoundError:
+        version = None
+
+    versions[key] = version
+    return version
+
+
+def clear_caches() -> None:
+    """
+    Clear caches of :func:`cached_parse_requirements` and
+    :func:`get_installed_version`, for example after installing packages.
+    """
+    global _installed_versions
+
+    with _lock:
+        _installed_versions = None
+        _requirements_cache.clear()
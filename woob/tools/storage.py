@@ -15,10 +15,14 @@
 # You should have received a copy of the GNU Lesser General Public License
 # along with woob. If not, see <http://www.gnu.org/licenses/>.
 
-
+import os
+import sys
+from argparse import ArgumentParser
 from collections.abc import Mapping
 from copy import deepcopy
+from threading import Lock
 from typing import Any
+from urllib.parse import quote
 
 from typing_extensions import Unpack
 
@@ -64,14 +68,12 @@ def __init__(self, path: str) -> None:
         self.config.load()
 
     def load(self, what: str, name: str, default: Mapping[str, Any] = {}) -> None:
-        d = {}
-        if what not in self.config.values:
-            self.config.values[what] = {}
-        else:
-            d = self.config.values[what].get(name, {})
-
-        self.config.values[what][name] = deepcopy(default)
-        self.config.values[what][name].update(d)
+        # Backends may be loaded concurrently, so the tree is only updated
+        # with atomic operations.
+        values = self.config.values.setdefault(what, {})
+        value = deepcopy(default)
+        value.update(values.get(name, {}))
+        values[name] = value
 
     def save(self, what: str, name: str) -> None:
         self.config.save()
@@ -84,3 +86,118 @@ def delete(self, what: str, name: str, *args: Unpack[GetArgs]) -> None:
 
     def get(self, what: str, name: str, *args: Unpack[GetArgs], **kwargs: Unpack[IConfigGet]) -> Any:
         return self.config.get(what, name, *args, **kwargs)
+
+
+class ShardedStorage(IStorage):
+    """
+    Storage with one YAML file per backend or application.
+
+    Saving the data of a backend only writes its own file, instead of the
+    whole storage, so it stays cheap with a lot of backends, and processes
+    using different backends don't overwrite each other's changes.
+
+    Data are stored in ``<path>/<what>/<name>.yaml``.
+
+    :param path: directory of the storage
+    """
+
+    EXTENSION = ".yaml"
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.shards: dict[tuple[str, str], YamlConfig] = {}
+        self._lock = Lock()
+
+    def get_shard_path(self, what: str, name: str) -> str:
+        return os.path.join(self.path, quote(what, safe=""), quote(name, safe="") + self.EXTENSION)
+
+    def _read_shard(self, what: str, name: str) -> YamlConfig:
+        shard = YamlConfig(self.get_shard_path(what, name))
+        # Do not use YamlConfig.load() on missing files, as it creates them.
+        if os.path.exists(shard.path):
+            shard.load()
+        return shard
+
+    def _get_shard(self, what: str, name: str) -> YamlConfig:
+        with self._lock:
+            shard = self.shards.get((what, name))
+            if shard is None:
+                shard = self.shards[what, name] = self._read_shard(what, name)
+            return shard
+
+    def load(self, what: str, name: str, default: Mapping[str, Any] = {}) -> None:
+        shard = self._read_shard(what, name)
+        values = deepcopy(default)
+        values.update(shard.values)
+        shard.values = values
+
+        with self._lock:
+            self.shards[what, name] = shard
+
+    def save(self, what: str, name: str) -> None:
+        shard = self._get_shard(what, name)
+        os.makedirs(os.path.dirname(shard.path), exist_ok=True)
+        shard.save()
+
+    def set(self, what: str, name: str, *args: Unpack[SetArgs]) -> None:
+        self._get_shard(what, name).set(*args)
+
+    def delete(self, what: str, name: str, *args: Unpack[GetArgs]) -> None:
+        self._get_shard(what, name).delete(*args)
+
+    def get(self, what: str, name: str, *args: Unpack[GetArgs], **kwargs: Unpack[IConfigGet]) -> Any:
+        shard = self._get_shard(what, name)
+        if not args:
+            return shard.values
+        return shard.get(*args, **kwargs)
+
+
+def migrate_storage(source: str, destination: str) -> int:
+    """
+    Copy the content of a :class:`StandardStorage` file to a
+    :class:`ShardedStorage`.
+
+    Data already in the destination are kept, so it can safely be run
+    several times.
+
+    :param source: path of the YAML storage file
+    :param destination: directory of the sharded storage
+    :return: number of migrated entries
+    """
+    if not os.path.isfile(source):
+        raise FileNotFoundError(source)
+
+    old = StandardStorage(source)
+    new = ShardedStorage(destination)
+
+    count = 0
+    for what, entries in old.config.values.items():
+        for name, values in (entries or {}).items():
+            new.load(what, name, values)
+            new.save(what, name)
+            count += 1
+    return count
+
+
+def main() -> int:
+    """
+    Migrate a storage file, with ``python -m woob.tools.storage SOURCE [DESTINATION]``.
+    """
+    parser = ArgumentParser(description="Migrate a YAML storage file to a sharded storage directory.")
+    parser.add_argument("source", help="path of the YAML storage file")
+    parser.add_argument("destination", nargs="?", help="directory of the sharded storage (default: SOURCE.d)")
+    args = parser.parse_args()
+
+    destination = args.destination or args.source + ".d"
+    try:
+        count = migrate_storage(args.source, destination)
+    except FileNotFoundError:
+        print(f"{args.source}: no such file", file=sys.stderr)  # noqa: T201
+        return 1
+
+    print(f"Migrated {count} entries to {destination}")  # noqa: T201
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())